@@ -25,6 +25,7 @@ Candle / Market Data
     candles             Fetch latest candles (up to 199 per request)
     candles-v2          Fetch candles via the v2 API path
     candles-deep        Fetch deep historical data (parallel workers)
+    history-bulk        Download many assets × timeframes into a SQLite store
     history-line        Fetch raw historical price-line data
     candle-info         Opening / closing / remaining time of current candle
     realtime-price      Live price stream for an asset
@@ -113,7 +114,8 @@ def make_parser() -> argparse.ArgumentParser:
             "  pyquotex payout-asset --asset EURUSD --timeframe 1\n"
             "  pyquotex candles --asset EURUSD --period 60 --count 10\n"
             "  pyquotex candles-v2 --asset EURUSD --period 60\n"
-            "  pyquotex candles-deep --asset EURUSD --seconds 3600 --workers 5\n"
+            "  pyquotex candles-deep --asset EURUSD --seconds 3600 --rate 10\n"
+            "  pyquotex history-bulk --assets EURUSD,GBPUSD --periods 60,300 --days 30\n"
             "  pyquotex history-line --asset EURUSD --offset 3600\n"
             "  pyquotex candle-info --asset EURUSD --period 60\n"
             "  pyquotex realtime-price --asset EURUSD\n"
@@ -221,13 +223,35 @@ def make_parser() -> argparse.ArgumentParser:
                    help="Total history window in seconds (default: 3600)")
     p.add_argument("--period", type=int, default=60,
                    help="Candle period in seconds (default: 60)")
-    p.add_argument("--workers", type=int, default=5,
-                   help="Parallel workers 2-10 (default: 5). "
-                        "WARNING: >10 may cause a ban.")
+    p.add_argument("--workers", type=int, default=None,
+                   help="Upper bound on parallel workers (default: adapted "
+                        "to the server's response times)")
+    p.add_argument("--rate", type=float, default=10.0,
+                   help="Max history requests per second (default: 10)")
     p.add_argument("--output", metavar="FILE",
                    help="Save results to a CSV file")
     _add_account_flags(p)
 
+    # ── history-bulk ─────────────────────────────────────────────────────────
+    p = sub.add_parser("history-bulk",
+                       help="Download history of many assets and timeframes "
+                            "into a SQLite store (resumable)")
+    p.add_argument("--assets", required=True,
+                   help="Comma-separated asset symbols")
+    p.add_argument("--periods", default="60",
+                   help="Comma-separated candle periods in seconds "
+                        "(default: 60)")
+    p.add_argument("--days", type=float, default=1.0,
+                   help="History window in days, up to now (default: 1)")
+    p.add_argument("--store", default="candles.sqlite",
+                   help="SQLite file, also the resume checkpoint "
+                        "(default: candles.sqlite)")
+    p.add_argument("--jobs", type=int, default=4,
+                   help="Jobs downloading at the same time (default: 4)")
+    p.add_argument("--rate", type=float, default=10.0,
+                   help="Max history requests per second (default: 10)")
+    _add_account_flags(p)
+
     # ── history-line ─────────────────────────────────────────────────────────
     p = sub.add_parser("history-line",
                        help="Fetch raw historical price-line data")
@@ -656,14 +680,10 @@ async def cmd_candles_v2(client: Quotex, args: argparse.Namespace) -> None:
 async def cmd_candles_deep(client: Quotex, args: argparse.Namespace) -> None:
     """Fetch deep historical candle data using parallel workers."""
     is_demo = _is_demo(args)
+    # Applies to the connection made below
+    client.history_rate = args.rate
     if not await connect_with_retry(client, is_demo):
         return
-    if args.workers > 10:
-        console.print(
-            "[bold red]⚠ WARNING:[/] workers > 10 may cause a ban. "
-            "Clamping to 10."
-        )
-        args.workers = 10
 
     asset, _ = await client.get_available_asset(args.asset, force_open=True)
 
@@ -691,7 +711,12 @@ async def cmd_candles_deep(client: Quotex, args: argparse.Namespace) -> None:
             progress_callback=_progress_cb,
         )
 
-    console.print(f"\n[green]✓[/] {len(candles)} candles fetched.")
+    stats = client.get_history_stats()
+    console.print(
+        f"\n[green]✓[/] {len(candles)} candles fetched "
+        f"({stats.get('completeness', 0)}% complete, "
+        f"{stats['throttle']['limit']} requests in flight at the end)."
+    )
     _print_candles_table(candles[-20:], asset, args.period,
                          title=f"Last 20 of {len(candles)} candles (deep)")
 
@@ -700,6 +725,73 @@ async def cmd_candles_deep(client: Quotex, args: argparse.Namespace) -> None:
         console.print(f"[green]✓ Saved to {args.output}[/]")
 
 
+async def cmd_history_bulk(client: Quotex, args: argparse.Namespace) -> None:
+    """Download the history of many assets × timeframes into a store."""
+    is_demo = _is_demo(args)
+    # Applies to the connection made below
+    client.history_rate = args.rate
+    if not await connect_with_retry(client, is_demo):
+        return
+
+    assets = [a.strip() for a in args.assets.split(",") if a.strip()]
+    periods = [int(p) for p in args.periods.split(",") if p.strip()]
+    start = time.time() - args.days * 86400
+    universe = [
+        (asset, period, start) for asset in assets for period in periods
+    ]
+    console.print(
+        f"[cyan]Downloading {len(universe)} jobs into {args.store} "
+        f"({args.jobs} at a time, ≤ {args.rate:g} requests/s)…[/]"
+    )
+
+    def _progress_cb(job) -> None:
+        if job.finished_at is None:
+            console.print(
+                f"  [dim]{job.asset} {job.period}s[/] {job.progress:.0f}% — "
+                f"{job.candles} candles, {job.throughput:g}/s",
+                end="\r",
+            )
+        else:
+            color = "green" if job.status == "done" else "red"
+            console.print(
+                f"  [{color}]{job.status}[/] {job.asset} {job.period}s — "
+                f"{job.candles} candles in {job.elapsed:.1f}s"
+            )
+
+    jobs = await client.download_history(
+        universe, store=args.store, max_jobs=args.jobs,
+        progress_callback=_progress_cb,
+    )
+
+    table = Table(
+        title="📦 [bold]History download[/]",
+        box=box.ROUNDED,
+        border_style="bright_blue",
+        show_header=True,
+        header_style="bold bright_white on blue",
+        row_styles=["none", "dim"],
+    )
+    table.add_column("Asset", style="bold")
+    table.add_column("Period", justify="right")
+    table.add_column("Status", justify="center")
+    table.add_column("Candles", justify="right")
+    table.add_column("Complete", justify="right")
+    table.add_column("Candles/s", justify="right")
+    for job in jobs:
+        table.add_row(
+            job.asset,
+            f"{job.period}s",
+            job.status if job.status == "done" else f"[red]{job.status}[/]",
+            str(job.candles),
+            f"{job.completeness or 0:.2f}%",
+            f"{job.throughput:g}",
+        )
+    console.print(table)
+    console.print(
+        "[dim]Run the same command again to resume or extend the store.[/]"
+    )
+
+
 async def cmd_history_line(client: Quotex, args: argparse.Namespace) -> None:
     """Fetch raw historical price-line data."""
     is_demo = _is_demo(args)
@@ -759,22 +851,15 @@ async def cmd_realtime_price(client: Quotex, args: argparse.Namespace) -> None:
         f"[cyan]Streaming live price for[/] [bold]{asset}[/] "
         f"[dim](Ctrl+C to stop)[/]"
     )
-    await client.start_realtime_price(asset, args.period)
     try:
-        while True:
-            prices = await client.get_realtime_price(asset)
-            if prices:
-                latest = prices[-1]
-                console.print(
-                    f"  [dim]{datetime.now().strftime('%H:%M:%S')}[/]  "
-                    f"[bold green]{latest.get('price', latest)}[/]",
-                    end="\r",
-                )
-            await asyncio.sleep(0.5)
+        async for _, price in client.stream_prices(asset):
+            console.print(
+                f"  [dim]{datetime.now().strftime('%H:%M:%S')}[/]  "
+                f"[bold green]{price}[/]",
+                end="\r",
+            )
     except KeyboardInterrupt:
         console.print("\n[yellow]Stream stopped.[/]")
-    finally:
-        await client.stop_candles_stream(asset)
 
 
 async def cmd_realtime_sentiment(
@@ -789,23 +874,17 @@ async def cmd_realtime_sentiment(
         f"[cyan]Streaming sentiment for[/] [bold]{asset}[/] "
         f"[dim](Ctrl+C to stop)[/]"
     )
-    await client.start_realtime_sentiment(asset, args.period)
     try:
-        while True:
-            sentiment = await client.get_realtime_sentiment(asset)
-            if sentiment:
-                bulls = sentiment.get("call", sentiment.get("bulls", "?"))
-                bears = sentiment.get("put", sentiment.get("bears", "?"))
-                console.print(
-                    f"  [dim]{datetime.now().strftime('%H:%M:%S')}[/]  "
-                    f"[green]CALL {bulls}%[/]  [red]PUT {bears}%[/]",
-                    end="\r",
-                )
-            await asyncio.sleep(1)
+        async for sentiment in client.stream_sentiment(asset):
+            bulls = sentiment.get("call", sentiment.get("bulls", "?"))
+            bears = sentiment.get("put", sentiment.get("bears", "?"))
+            console.print(
+                f"  [dim]{datetime.now().strftime('%H:%M:%S')}[/]  "
+                f"[green]CALL {bulls}%[/]  [red]PUT {bears}%[/]",
+                end="\r",
+            )
     except KeyboardInterrupt:
         console.print("\n[yellow]Stream stopped.[/]")
-    finally:
-        await client.stop_candles_stream(asset)
 
 
 async def cmd_realtime_candle(
@@ -821,19 +900,16 @@ async def cmd_realtime_candle(
         f"[dim](Ctrl+C to stop)[/]"
     )
     try:
-        while True:
-            candle = await client.start_realtime_candle(asset, args.period)
-            if candle:
-                console.print(
-                    f"  [dim]{datetime.now().strftime('%H:%M:%S')}[/]  "
-                    f"{candle}",
-                    end="\r",
-                )
-            await asyncio.sleep(0.5)
+        async for candle in client.stream_candles(
+                asset, args.period or 60, partial=True
+        ):
+            console.print(
+                f"  [dim]{datetime.now().strftime('%H:%M:%S')}[/]  "
+                f"{candle}",
+                end="\r",
+            )
     except KeyboardInterrupt:
         console.print("\n[yellow]Stream stopped.[/]")
-    finally:
-        await client.stop_candles_stream(asset)
 
 
 # ---------------------------------------------------------------------------
@@ -1195,33 +1271,25 @@ async def cmd_monitor(client: Quotex, args: argparse.Namespace) -> None:
         f"[cyan]Monitoring[/] [bold]{asset}[/] "
         f"[dim](period={args.period}s — Ctrl+C to stop)[/]"
     )
-    await client.start_candles_stream(asset, args.period)
     prev_price = None
     try:
-        while True:
-            prices = await client.get_realtime_price(asset)
-            if prices:
-                latest = prices[-1]
-                price = latest.get("price", latest)
-                change = ""
-                if prev_price is not None:
-                    delta = float(price) - float(prev_price)
-                    change = (
-                        f" [green]+{delta:.5f}[/]" if delta > 0
-                        else f" [red]{delta:.5f}[/]" if delta < 0
-                        else " [dim]—[/]"
-                    )
-                console.print(
-                    f"  [dim]{datetime.now().strftime('%H:%M:%S')}[/]  "
-                    f"[bold]{price}[/]{change}      ",
-                    end="\r",
+        async for _, price in client.stream_prices(asset):
+            change = ""
+            if prev_price is not None:
+                delta = float(price) - float(prev_price)
+                change = (
+                    f" [green]+{delta:.5f}[/]" if delta > 0
+                    else f" [red]{delta:.5f}[/]" if delta < 0
+                    else " [dim]—[/]"
                 )
-                prev_price = price
-            await asyncio.sleep(0.5)
+            console.print(
+                f"  [dim]{datetime.now().strftime('%H:%M:%S')}[/]  "
+                f"[bold]{price}[/]{change}      ",
+                end="\r",
+            )
+            prev_price = price
     except KeyboardInterrupt:
         console.print("\n[yellow]Monitor stopped.[/]")
-    finally:
-        await client.stop_candles_stream(asset)
 
 
 async def cmd_strategy(client: Quotex, args: argparse.Namespace) -> None:
@@ -1388,6 +1456,7 @@ COMMAND_MAP: dict[str, Any] = {
     "candles":             cmd_candles,
     "candles-v2":          cmd_candles_v2,
     "candles-deep":        cmd_candles_deep,
+    "history-bulk":        cmd_history_bulk,
     "history-line":        cmd_history_line,
     "candle-info":         cmd_candle_info,
     "realtime-price":      cmd_realtime_price,
@@ -0,0 +1,72 @@
+"""Benchmark: frames and order-to-ack latency of ``Quotex.buy``.
+
+Places orders against an in-process stand-in server that acknowledges
+``orders/open`` after a simulated round-trip time, and reports the frames
+sent per order and the ack latency histogram recorded by the client.
+
+Usage:
+    python benchmarks/bench_order_path.py [orders] [rtt_ms]
+"""
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyquotex.api import QuotexAPI  # noqa: E402
+from pyquotex.stable_api import Quotex  # noqa: E402
+
+
+class StandInServer:
+    """Counts frames and acks orders/open after ``rtt`` seconds."""
+
+    def __init__(self, api: QuotexAPI, rtt: float) -> None:
+        self.api = api
+        self.rtt = rtt
+        self.events: Counter = Counter()
+
+    async def send(self, frame: str) -> None:
+        event, payload = json.loads(frame[2:])
+        self.events[event] += 1
+        if event == "orders/open":
+            asyncio.get_running_loop().call_later(
+                self.rtt, self.api._handle_orders, "orders/open", {
+                    "id": f"order-{payload['requestId']}",
+                    "requestId": payload["requestId"],
+                }
+            )
+
+
+async def main(orders: int, rtt_ms: float) -> None:
+    client = Quotex(email="bench@example.com", password="bench")
+    client.api = QuotexAPI("qxbroker.com", "bench@example.com", "bench", "en")
+    server = StandInServer(client.api, rtt_ms / 1000)
+    client.api.websocket_client = SimpleNamespace(wss=server)
+    client.api._handle_authorization("s_authorization", None)
+    client.api.timesync.sync(time.time())
+
+    start = time.perf_counter()
+    for _ in range(orders):
+        await client.buy(1, "EURUSD_otc", "call", 60)
+    elapsed = time.perf_counter() - start
+
+    stats = client.get_order_ack_stats()["ack_latency"]
+    print(f"orders:            {orders}")
+    print(f"simulated RTT:     {rtt_ms:.1f} ms")
+    print(f"frames sent:       {dict(server.events)}")
+    print(f"frames per order:  {sum(server.events.values()) / orders:.2f}")
+    print(f"wall time / order: {elapsed / orders * 1000:.2f} ms")
+    print(
+        f"ack latency:       p50={stats['p50_ms']:.1f} ms "
+        f"p99={stats['p99_ms']:.1f} ms max={stats['max_ms']:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rtt = float(sys.argv[2]) if len(sys.argv) > 2 else 20.0
+    asyncio.run(main(count, rtt))
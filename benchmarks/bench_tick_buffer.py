@@ -0,0 +1,70 @@
+"""Microbenchmark: per-asset tick storage.
+
+Streams ticks for 100 assets into the previous ``defaultdict(list)`` of
+``{"time", "price"}`` dicts (with ``pop(0)`` past 1000 entries) and into
+the array-backed :class:`TickStore`, reporting time, peak traced memory
+and garbage-collector runs.
+
+Usage:
+    python benchmarks/bench_tick_buffer.py [ticks_per_asset]
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyquotex.utils.tick_buffer import TickStore  # noqa: E402
+
+ASSETS = [f"ASSET{i}_otc" for i in range(100)]
+
+
+def legacy_ingest(ticks: int) -> Any:
+    store: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for i in range(ticks):
+        ts = 1700000000 + i * 0.5
+        for asset in ASSETS:
+            price_list = store[asset]
+            price_list.append({"time": ts, "price": 1.1})
+            if len(price_list) > 1000:
+                price_list.pop(0)
+    return store
+
+
+def ring_ingest(ticks: int) -> Any:
+    store = TickStore(1000)
+    for i in range(ticks):
+        ts = 1700000000 + i * 0.5
+        for asset in ASSETS:
+            store[asset].append(ts, 1.1)
+    return store
+
+
+def measure(fn: Callable[[int], Any], ticks: int) -> tuple[float, int, int]:
+    gc.collect()
+    collections = sum(s["collections"] for s in gc.get_stats())
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(ticks)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    collections = sum(s["collections"] for s in gc.get_stats()) - collections
+    return elapsed, peak, collections
+
+
+def main(ticks: int = 3000) -> None:
+    for name, fn in (("list of dicts", legacy_ingest), ("ring buffer", ring_ingest)):
+        elapsed, peak, collections = measure(fn, ticks)
+        print(
+            f"{name:14}: {elapsed:6.2f}s  peak {peak / 1e6:7.1f} MB  "
+            f"gc runs {collections}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3000)
@@ -10,7 +10,12 @@ from typing import Any, Callable
 import certifi
 import httpx
 
-from .global_value import ConnectionState, WebsocketStatus, AuthStatus
+from .global_value import (
+    AuthStatus,
+    ConnectionState,
+    StateChange,
+    WebsocketStatus,
+)
 from .network.history import GetHistory
 from .network.login import Login
 from .network.logout import Logout
@@ -19,18 +24,41 @@ from .network.settings import Settings
 from .utils import json_utils as json
 from .utils.account_type import AccountType
 from .utils.async_utils import EventRegistry
+from .utils.bounded import BoundedDict, StateLimits, describe
+from .utils.latency import LatencyHistogram
+from .utils.tick_buffer import DEFAULT_TICK_CAPACITY, TickStore
+from .utils.timer_wheel import TimerWheel
 from .ws.channels.buy import Buy
 from .ws.channels.candles import GetCandles
 from .ws.channels.sell_option import SellOption
 from .ws.channels.ssid import Ssid
 from .ws.client import WebsocketClient
+from .ws.inflight import InflightTable
+from .ws.ingest import DEFAULT_INGEST_CAPACITY, DROP_OLDEST, IngestQueue
 from .ws.objects.candles import Candles
+from .ws.objects.instruments import InstrumentCatalog
 from .ws.objects.listinfodata import ListInfoData
 from .ws.objects.profile import Profile
 from .ws.objects.timesync import TimeSync
+from .ws.results import OrderResults
+from .ws.router import (
+    ENGINE_MESSAGE,
+    AttachmentAssembler,
+    BinaryEvent,
+    FrameStats,
+    MessageRouter,
+    classify_payload,
+    is_binary_frame,
+    parse_frame,
+)
+from .ws.streams import StreamHub
+from .ws.throttle import DEFAULT_RATE, AdaptiveThrottle
 
 logger = logging.getLogger(__name__)
 
+# Event registry keys signalled on connection state transitions.
+STATE_EVENTS = {"status": "status_changed", "auth_status": "auth_changed"}
+
 cert_path = certifi.where()
 os.environ['SSL_CERT_FILE'] = cert_path
 os.environ['WEBSOCKET_CLIENT_CA_BUNDLE'] = cert_path
@@ -61,7 +89,12 @@ class QuotexAPI:
             proxies: dict[str, str] | None = None,
             resource_path: str | None = None,
             user_data_dir: str = ".",
-            on_otp_callback: Callable | None = None
+            on_otp_callback: Callable | None = None,
+            tick_capacity: int = DEFAULT_TICK_CAPACITY,
+            ingest_capacity: int = DEFAULT_INGEST_CAPACITY,
+            market_policy: str = DROP_OLDEST,
+            state_limits: StateLimits | None = None,
+            history_rate: float = DEFAULT_RATE
     ):
         """
         :param str host: The hostname or ip address of a Quotex server.
@@ -71,8 +104,18 @@ class QuotexAPI:
         :param proxies: The proxies of a Quotex server.
         :param user_data_dir: The path browser user data dir.
         :param on_otp_callback: Callback function for OTP (2FA) input.
+        :param tick_capacity: Ticks kept per asset in realtime_price.
+        :param ingest_capacity: Items per lane in the ingest queue.
+        :param market_policy: "drop_oldest" or "conflate" for streaming
+            market data when the ingest queue is full.
+        :param state_limits: ``{structure: (capacity, ttl)}`` bounding the
+            long-lived per-connection state (see DEFAULT_STATE_LIMITS).
+            Structures not listed stay unbounded.
+        :param history_rate: Ceiling on history/load requests per second,
+            shared by all history callers on the connection.
         """
         self.state = ConnectionState()
+        self.state_limits = state_limits or {}
         self.on_otp_callback = on_otp_callback
         self._ws_send_lock = asyncio.Lock()
 
@@ -89,11 +132,12 @@ class QuotexAPI:
         self.account_type: int | None = AccountType.DEMO
         self.tournament_id: int = 0
         self.instruments: list[Any] = []
+        self.instrument_catalog = InstrumentCatalog()
         self.training_balance_edit_request: dict[str, Any] | None = None
         self.profit_in_operation: float | None = None
         self.sold_options_respond: Any = None
         self.sold_digital_options_respond: Any = None
-        self.listinfodata = ListInfoData()
+        self.listinfodata = ListInfoData(*self._limits("listinfodata"))
         self.timesync = TimeSync()
         self.candles = Candles()
         self.profile = Profile()
@@ -108,7 +152,6 @@ class QuotexAPI:
         self.object_id: Any = None
         self.token_login2fa: str | None = None
         self.is_logged: bool = False
-        self._temp_status: str = ""
         self.username = username
         self.password = password
         self.resource_path = resource_path
@@ -119,22 +162,50 @@ class QuotexAPI:
         self.signal_data: dict[str, Any] = {}
         self.get_candle_data: dict[str, Any] = {}
         self.historical_candles: dict[str, Any] = {}
-        self.candle_v2_data: dict[str, Any] = {}
-        self.realtime_price: dict[str, list[dict[str, Any]]] = (
-            defaultdict(list)
-        )
+        self.candle_v2_data: dict[str, Any] = self._state("candle_v2_data")
+        self.realtime_price = TickStore(tick_capacity)
         self.realtime_price_data: list[Any] = []
         self.realtime_candles: dict[str, Any] = {}
-        self.realtime_sentiment: dict[str, Any] = {}
-        self.traders_mood: dict[str, Any] = {}
-        self.candle_generated_check = defaultdict(lambda: defaultdict(dict))
-        self.candle_generated_all_size_check = defaultdict(dict)
+        self.ticks_ingested: dict[str, int] = defaultdict(int)
+        self.ticks_dropped: dict[str, int] = defaultdict(int)
+        self.realtime_sentiment: dict[str, Any] = self._state(
+            "realtime_sentiment"
+        )
+        self.traders_mood: dict[str, Any] = self._state("traders_mood")
+        self.candle_generated_check = self._state(
+            "candle_generated_check", lambda: defaultdict(dict)
+        )
+        self.candle_generated_all_size_check = self._state(
+            "candle_generated_all_size_check", dict
+        )
         self.top_list_leader: dict[str, Any] = {}
         self.session_data: dict[str, Any] = {}
         self.browser = Browser()
         self.browser.set_headers()
         self.settings = Settings(self)
-        self.event_registry = EventRegistry()
+        self.event_registry = EventRegistry(
+            *self._limits("event_registry")
+        )
+        self.inflight = InflightTable()
+        self.timers = TimerWheel()
+        self.order_results = OrderResults(self.timers)
+        # (asset, duration, is_fast_option) already subscribed and applied
+        self.prepared_orders: set[tuple[str, int, bool]] = set()
+        self.preparing_orders: dict[tuple[str, int, bool], asyncio.Task] = {}
+        self.order_ack_latency = LatencyHistogram()
+        # First cancel frame sent to last ticket settled, per sell batch
+        self.sell_latency = LatencyHistogram()
+        # Adaptive concurrency and rate ceiling for history/load
+        self.history_throttle = AdaptiveThrottle(rate=history_rate)
+        self.streams = StreamHub()
+        self.state.add_listener(self._on_state_change)
+        self.router = MessageRouter()
+        self.frame_stats = FrameStats()
+        self.assembler = AttachmentAssembler()
+        self.ingest = IngestQueue(
+            self._dispatch, ingest_capacity, market_policy
+        )
+        self._register_handlers()
         self._http_client = httpx.AsyncClient(
             verify=unified_ssl_context,
             timeout=30.0,
@@ -143,11 +214,49 @@ class QuotexAPI:
         self.profit_today: float | None = None
         self.heartbeat_task: asyncio.Task | None = None
 
+    def _limits(self, name: str) -> tuple[int | None, float | None]:
+        """Returns the (capacity, ttl) configured for a state structure."""
+        return self.state_limits.get(name, (None, None))
+
+    def _state(
+            self, name: str, default_factory: Callable[[], Any] | None = None
+    ) -> dict[Any, Any]:
+        """Creates a per-connection state dict, bounded if configured."""
+        capacity, ttl = self._limits(name)
+        if capacity is not None or ttl is not None:
+            return BoundedDict(capacity, ttl, default_factory)
+        if default_factory is not None:
+            return defaultdict(default_factory)
+        return {}
+
+    def memory_report(self) -> dict[str, dict[str, Any]]:
+        """
+        Estimates entries and bytes held by the long-lived state.
+
+        Returns:
+            dict: Per-structure ``entries`` and ``bytes`` (plus limits and
+            eviction counts for bounded structures).
+        """
+        structures = {
+            "candle_v2_data": self.candle_v2_data,
+            "traders_mood": self.traders_mood,
+            "realtime_sentiment": self.realtime_sentiment,
+            "candle_generated_check": self.candle_generated_check,
+            "candle_generated_all_size_check": (
+                self.candle_generated_all_size_check
+            ),
+            "listinfodata": self.listinfodata.listinfodata_dict,
+            "event_registry": self.event_registry._slots,
+            "realtime_price": self.realtime_price,
+            "realtime_candles": self.realtime_candles,
+        }
+        return {name: describe(obj) for name, obj in structures.items()}
+
     async def _on_open(self) -> None:
         """Called when WebSocket connection is established."""
         logger.info("Websocket client connected.")
+        self.assembler.clear()
         self.state.status = WebsocketStatus.CONNECTED
-        await self.event_registry.set_event("status_changed", self.state.status)
 
         # Start Heartbeat task to keep connection alive and stream active
         async def heartbeat() -> None:
@@ -167,314 +276,438 @@ class QuotexAPI:
         await self.websocket.send('42["chart_notification/get"]')
         await self.websocket.send('42["instruments/get"]')
 
-    async def _on_message(self, msg: bytes | str) -> None:
-        """Called for every WebSocket message received."""
+    def _receive(
+            self, msg: bytes | str
+    ) -> tuple[str | None, Any, bool] | None:
+        """
+        Parses a raw frame into a routable ``(event, data, fallback)``.
+
+        Attachments of a pending binary header are kept as raw frames and
+        only decoded when the completed event is dispatched, so large
+        payloads are not parsed on the socket read path.
+
+        Returns:
+            tuple | None: The routable event or None if nothing to route.
+        """
+        if self.assembler.pending and is_binary_frame(msg):
+            binary_event = self.assembler.add_attachment(msg)
+            if binary_event is None:
+                return None
+            return binary_event.event, binary_event, True
+
         try:
-            message: Any = None
-            msg_str = (
-                msg.decode("utf-8", errors="ignore")
-                if isinstance(msg, bytes)
-                else str(msg)
+            frame = parse_frame(msg, self.frame_stats)
+        except Exception as e:
+            logger.debug("Failed to parse raw data payload: %s", e)
+            return None
+
+        if frame.binary:
+            # Bare payload without a header: routed by its shape.
+            event = classify_payload(frame.data)
+            if event is None:
+                return None
+            return event, frame.data, False
+
+        if frame.engine_type != ENGINE_MESSAGE or frame.event is None:
+            return None
+
+        if frame.is_placeholder:
+            self.assembler.add_header(
+                frame.event, frame.data, frame.attachments or 1
             )
+            return None
 
-            if "authorization/reject" in msg_str:
-                self.state.websocket_error_reason = (
-                    "Websocket connection rejected."
-                )
-                self.state.auth_status = AuthStatus.FAILED
-                await self.event_registry.set_event(
-                    "auth_changed", self.state.auth_status
-                )
-                return
-            elif "s_authorization" in msg_str:
-                self.state.auth_status = AuthStatus.AUTHENTICATED
-                self.state.status = WebsocketStatus.CONNECTED
-                await self.event_registry.set_event(
-                    "auth_changed", self.state.auth_status
-                )
-                await self.event_registry.set_event(
-                    "status_changed", self.state.status
-                )
+        return frame.event, frame.data, False
 
-            # Detect Socket.IO prefix
-            is_control = msg_str and msg_str[0].isdigit()
-
-            # Clean JSON extraction
-            try:
-                # Find start of JSON
-                start_idx = -1
-                for idx, char in enumerate(msg_str):
-                    if char in ('[', '{'):
-                        start_idx = idx
-                        break
-
-                if start_idx != -1:
-                    clean_json = msg_str[start_idx:]
-                    data_json = json.loads(clean_json)
-                    message = data_json
-                    data = (
-                        data_json[0]
-                        if (
-                                isinstance(data_json, list)
-                                and len(data_json) == 1
-                        )
-                        else data_json
-                    )
+    def _decode_attachment(self, raw: bytes | str) -> Any:
+        return parse_frame(raw, self.frame_stats).data
 
-                    pass
-                else:
-                    pass
-            except Exception as e:
-                logger.debug("Failed to parse raw data payload: %s", e)
-
-            # 1. Handle Control Messages (Placeholders)
-            if is_control:
-                if "51-" in msg_str and "_placeholder" in msg_str:
-                    self._temp_status = msg_str
-                    return
-
-                # Standard Event Processing
-                if (
-                        isinstance(message, list)
-                        and len(message) > 1
-                        and isinstance(message[0], str)
-                ):
-                    event = message[0]
-                    data = message[1]
-
-                    if event == "s_authorization":
-                        self.state.auth_status = AuthStatus.AUTHENTICATED
-                        await self.event_registry.set_event(
-                            "auth_changed", self.state.auth_status
-                        )
-                    elif event == "instruments/list":
-                        if isinstance(data, dict) and data.get("_placeholder"):
-                            self._temp_status = (
-                                '451-["instruments/list",'
-                                f'{json.dumps_str(data)}]'
-                            )
-                        else:
-                            self.instruments = data
-                            await self.event_registry.set_event(
-                                'instruments_ready', data
-                            )
-                    elif event == "trader/history":
-                        await self.event_registry.set_event(
-                            'history_ready', data
-                        )
-                    elif event == "balance":
-                        self.account_balance = data
-                        await self.event_registry.set_event(
-                            'balance_ready', data
-                        )
-                    elif event == "candle-generated":
-                        asset = data.get("asset")
-                        period = data.get("period")
-                        if asset and period:
-                            self.candle_generated_check[str(asset)][
-                                int(period)
-                            ] = data
-                            self.candle_generated_all_size_check[
-                                str(asset)
-                            ] = data
-                    elif event == "sentiment":
-                        asset = data.get("asset")
-                        if asset:
-                            self.traders_mood[asset] = data
-                            self.realtime_sentiment[asset] = data
-
-            # 2. Handle Data Payloads (Placeholder fulfillment)
-            elif message is not None and not is_control:
-                data = (
-                    message[0]
-                    if isinstance(message, list) and len(message) == 1
-                    else message
-                )
+    async def _dispatch(
+            self, event: str | None, data: Any, fallback: bool = True
+    ) -> None:
+        """Dispatches a routable event, decoding deferred attachments."""
+        if type(data) is BinaryEvent:
+            data = data.payload(self._decode_attachment)
+        await self.router.dispatch(event, data, fallback)
 
-                if self._temp_status and 'instruments/list' in self._temp_status:
-                    if isinstance(data, list):
-                        self.instruments = data
-                    elif isinstance(data, dict) and "list" in data:
-                        self.instruments = data["list"]
+    async def _on_message(self, msg: bytes | str) -> None:
+        """Parses and dispatches a WebSocket message inline."""
+        try:
+            routed = self._receive(msg)
+            if routed is not None:
+                await self._dispatch(*routed)
+        except Exception as e:
+            logger.error("Error in _on_message: %s", e)
 
-                    if self.instruments:
-                        await self.event_registry.set_event(
-                            'instruments_ready', self.instruments
-                        )
+    async def _enqueue_message(self, msg: bytes | str) -> None:
+        """Parses a WebSocket message and queues it for the dispatcher."""
+        try:
+            routed = self._receive(msg)
+            if routed is not None:
+                await self.ingest.put(*routed)
+        except Exception as e:
+            logger.error("Error in _enqueue_message: %s", e)
 
-                elif (
-                        any(x in self._temp_status for x in ['history/list/v2', 'history/load'])
-                        or (isinstance(data, dict) and (data.get("candles") or data.get("data")))
-                ):
-                    if isinstance(data, dict) and data.get("asset"):
-                        asset = data["asset"]
-                        self.candle_v2_data[asset] = data
-                        await self.event_registry.set_event(
-                            f'candles_ready_{asset}', data
-                        )
-                        if data.get("index") is not None:
-                            await self.event_registry.set_event(
-                                f'candles_ready_{asset}_{data["index"]}',
-                                data
-                            )
-                    elif isinstance(data, list):
-                        # Fallback for old history format if needed
-                        await self.event_registry.set_event(
-                            'history_ready', data
-                        )
+    def _on_state_change(self, change: StateChange) -> None:
+        """Signals status/auth transitions to waiters and streams."""
+        self.event_registry.set(STATE_EVENTS[change.field], change.new)
+        self.streams.publish(("connection",), change)
 
-                elif self._temp_status and any(
-                        x in self._temp_status
-                        for x in [
-                            'orders/open', 'orders/close', 'orders/opened',
-                            'pending/create', 'pending/opened'
-                        ]
-                ):
-                    logger.debug(
-                        "Order event via placeholder! status=%s",
-                        self._temp_status
-                    )
+    @property
+    def is_connected(self) -> bool:
+        """True while the socket is open and the session authorized."""
+        return self.state.is_connected
 
-                    # Handle both single dict and list of dicts
-                    orders_to_process = []
-                    if isinstance(data, list):
-                        orders_to_process = data
-                    elif isinstance(data, dict):
-                        if data.get("deals"):
-                            orders_to_process = data["deals"]
-                        else:
-                            orders_to_process = [data]
-
-                    for order in orders_to_process:
-                        order_id = order.get("id")
-                        if order_id:
-                            profit = order.get("profit", 0)
-                            win = "win" if profit > 0 else "loss"
-                            # Check if it's in a closed list or has a 
-                            # close status
-                            is_closed = (
-                                    any(
-                                        x in self._temp_status
-                                        for x in ['closed', 'close']
-                                    )
-                                    or order.get("status") == "closed"
-                            )
-                            game_state = 1 if is_closed else 0
-
-                            logger.debug(
-                                "Processing order %s: win=%s, state=%s, "
-                                "profit=%s",
-                                order_id, win, game_state, profit
-                            )
-                            self.listinfodata.set(
-                                win, game_state, order_id, profit
-                            )
-                            self.listinfodata.set(
-                                win, game_state, str(order_id), profit
-                            )
-
-                    # Always set buy_confirmed if it was an open request
-                    if (
-                            any(x in self._temp_status for x in ['orders/open', 'pending/create'])
-                            and isinstance(data, dict)
-                    ):
-                        if 'pending' in self._temp_status:
-                            self.pending_id = data.get("id")
-                            self.pending_successful = True
-                            await self.event_registry.set_event(
-                                'pending_confirmed', data
-                            )
-                        else:
-                            self.buy_id = data.get("id")
-                            self.buy_successful = True
-                            await self.event_registry.set_event(
-                                'buy_confirmed', data
-                            )
-
-                self._temp_status = ""  # Clear after consuming data
-
-            # 3. Handle Real-time and Profile Dicts
-            if isinstance(message, dict):
-                if message.get("liveBalance") or message.get("demoBalance"):
-                    self.account_balance = message
-                    await self.event_registry.set_event(
-                        'balance_ready', message
-                    )
-                elif message.get("deals"):
-                    # Handle real-time deals update (usually closed deals)
-                    for order in message["deals"]:
-                        order_id = order.get("id")
-                        if order_id:
-                            profit = order.get("profit", 0)
-                            win = "win" if profit > 0 else "loss"
-                            logger.debug(
-                                "Real-time deal update for %s: "
-                                "win=%s, profit=%s",
-                                order_id, win, profit
-                            )
-                            self.listinfodata.set(win, 1, order_id, profit)
-                            self.listinfodata.set(
-                                win, 1, str(order_id), profit
-                            )
-                    await self.event_registry.set_event(
-                        'history_ready', message
-                    )
-                elif (
-                        "id" in message
-                        and ("asset" in message or "amount" in message)
-                ):
-                    # Potential order confirmation
-                    self.buy_id = message.get("id")
-                    await self.event_registry.set_event(
-                        'buy_confirmed', message
-                    )
+    async def wait_state(
+            self,
+            predicate: Callable[[ConnectionState], bool],
+            timeout: float | None = None
+    ) -> bool:
+        """
+        Waits until predicate holds for the connection state.
 
-            elif (
-                    isinstance(message, list)
-                    and len(message) > 1
-                    and message[0] == "order"
-            ):
-                # Explicit order event
-                data = message[1]
-                order_id = data.get("id")
-                self.buy_id = order_id
-
-                # Update listinfodata for check_win
-                if "profit" in data and "status" in data:
-                    profit = data.get("profit", 0)
-                    win = "win" if profit > 0 else "loss"
-                    game_state = 1 if data.get("status") == "closed" else 0
-                    self.listinfodata.set(
-                        win, game_state, str(order_id), profit
-                    )
+        The predicate is re-evaluated on every status/auth transition,
+        never by polling.
+
+        Args:
+            predicate (Callable): Called with the ConnectionState.
+            timeout (float, optional): Maximum seconds to wait.
+
+        Returns:
+            bool: False if the timeout expired first.
+        """
+        if predicate(self.state):
+            return True
+        future = asyncio.get_running_loop().create_future()
+
+        def check(_change: StateChange) -> None:
+            if not future.done() and predicate(self.state):
+                future.set_result(True)
+
+        self.state.add_listener(check)
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self.state.remove_listener(check)
+
+    async def wait_connected(self, timeout: float | None = None) -> bool:
+        """
+        Waits until the connection is open and authorized.
+
+        Returns early (False) if the authorization is rejected.
+
+        Returns:
+            bool: True once connected, False on rejection or timeout.
+        """
+        await self.wait_state(
+            lambda state: (
+                    state.is_connected
+                    or state.auth_status == AuthStatus.FAILED
+            ),
+            timeout
+        )
+        return self.state.is_connected
 
-                await self.event_registry.set_event('buy_confirmed', data)
-                await self.event_registry.set_event(
-                    f'order_closed_{order_id}', data
+    def get_inflight_stats(self) -> dict[str, Any]:
+        """
+        Returns the number of requests awaiting a response and counters.
+
+        Returns:
+            dict: In-flight table size, per-kind sizes and lifetime counts.
+        """
+        return self.inflight.metrics()
+
+    def get_ingest_stats(self) -> dict[str, Any]:
+        """
+        Returns ingest queue depth, shedding and processing lag metrics.
+
+        Returns:
+            dict: Queue metrics (lags in milliseconds).
+        """
+        return self.ingest.metrics()
+
+    def get_order_ack_stats(self) -> dict[str, Any]:
+        """
+        Returns the order-to-ack latency of orders/open requests.
+
+        Returns:
+            dict: Latency summary (milliseconds) and prepared order keys.
+        """
+        return {
+            "ack_latency": self.order_ack_latency.as_dict(),
+            "prepared": sorted(self.prepared_orders),
+        }
+
+    def get_sell_stats(self) -> dict[str, Any]:
+        """
+        Returns the latency of sell batches, first send to last ack.
+
+        Returns:
+            dict: Latency summary (milliseconds).
+        """
+        return self.sell_latency.as_dict()
+
+    def get_order_result_stats(self) -> dict[str, Any]:
+        """
+        Returns result waiters and the expiry-to-result latency histogram.
+
+        Returns:
+            dict: Waiter counts and latency summary (milliseconds).
+        """
+        return self.order_results.metrics()
+
+    def _register_handlers(self) -> None:
+        """Registers the built-in handlers on the message router."""
+        route = self.router.register
+        route("s_authorization", self._handle_authorization)
+        route("authorization/reject", self._handle_authorization_reject)
+        route("instruments/list", self._handle_instruments)
+        route("trader/history", self._handle_trader_history)
+        route("balance", self._handle_balance)
+        route("settings/list", self._handle_settings)
+        route("demo/refill", self._handle_demo_refill)
+        route("candle-generated", self._handle_candle_generated)
+        route("sentiment", self._handle_sentiment)
+        route("history/list/v2", self._handle_history)
+        route("history/load", self._handle_history)
+        route("deals", self._handle_deals)
+        route("order", self._handle_order)
+        route("orders/cancel", self._handle_sell)
+        route("quotes/stream", self._handle_quotes)
+        for event in (
+                "orders/open", "orders/close", "orders/opened",
+                "pending/create", "pending/opened"
+        ):
+            route(event, self._handle_orders)
+
+    @staticmethod
+    def _unwrap(data: Any) -> Any:
+        """Unwraps single-element list payloads."""
+        if isinstance(data, list) and len(data) == 1:
+            return data[0]
+        return data
+
+    def _handle_authorization(self, event: str, data: Any) -> None:
+        self.state.auth_status = AuthStatus.AUTHENTICATED
+        self.state.status = WebsocketStatus.CONNECTED
+
+    def _handle_authorization_reject(
+            self, event: str, data: Any
+    ) -> None:
+        self.state.websocket_error_reason = "Websocket connection rejected."
+        self.state.auth_status = AuthStatus.FAILED
+
+    def _handle_instruments(self, event: str, data: Any) -> None:
+        if isinstance(data, dict) and "list" in data:
+            data = data["list"]
+        if isinstance(data, list) and data:
+            self.instruments = data
+            publish = self.streams.publish
+            for change in self.instrument_catalog.update(data):
+                publish(("instruments",), change)
+            self.event_registry.set('instruments_ready', self.instruments)
+
+    def _handle_trader_history(self, event: str, data: Any) -> None:
+        self.event_registry.set('history_ready', data)
+
+    def _handle_balance(self, event: str, data: Any) -> None:
+        self.account_balance = data
+        self.event_registry.set('balance_ready', data)
+
+    def _handle_settings(self, event: str, data: Any) -> None:
+        # Answers settings/apply, which carries no correlation key.
+        data = self._unwrap(data)
+        self.settings_list = data
+        self.inflight.resolve_oldest("settings/list", data)
+
+    def _handle_demo_refill(self, event: str, data: Any) -> None:
+        data = self._unwrap(data)
+        self.training_balance_edit_request = data
+        self.inflight.resolve_oldest("demo/refill", data)
+
+    def _handle_candle_generated(self, event: str, data: Any) -> None:
+        asset = data.get("asset")
+        period = data.get("period")
+        if asset and period:
+            self.candle_generated_check[str(asset)][int(period)] = data
+            self.candle_generated_all_size_check[str(asset)] = data
+            self.event_registry.set(f'candle_generated_{asset}', data)
+            self.event_registry.set(
+                f'candle_generated_{asset}_{int(period)}', data
+            )
+
+    def _handle_sentiment(self, event: str, data: Any) -> None:
+        asset = data.get("asset")
+        if asset:
+            self.traders_mood[asset] = data
+            self.realtime_sentiment[asset] = data
+            self.streams.publish(("sentiment", asset), data)
+
+    def _handle_history(self, event: str, data: Any) -> None:
+        data = self._unwrap(data)
+        if isinstance(data, dict) and data.get("asset"):
+            asset = data["asset"]
+            self.candle_v2_data[asset] = data
+            self.historical_candles = data
+            self.event_registry.set(f'candles_ready_{asset}', data)
+            self.inflight.resolve("history/load", data.get("index"), data)
+        elif isinstance(data, list):
+            # Fallback for old history format if needed
+            self.event_registry.set('history_ready', data)
+
+    def _update_order(self, order: dict[str, Any], closed: bool) -> None:
+        """Records an order's state and wakes its result waiters."""
+        order_id = order["id"]
+        profit = order.get("profit", 0)
+        win = "win" if profit > 0 else "loss"
+        logger.debug(
+            "Order %s: win=%s, closed=%s, profit=%s",
+            order_id, win, closed, profit
+        )
+        self.listinfodata.set(win, 1 if closed else 0, order_id, profit)
+        if closed:
+            self.order_results.resolve(
+                order_id, win, profit, order.get("closeTimestamp")
+            )
+            if ("orders/cancel", order_id) in self.inflight:
+                # A sold option is closed; the close settles the sale.
+                self.inflight.resolve("orders/cancel", order_id, order)
+
+    def _handle_deals(self, event: str, data: Any) -> None:
+        """Real-time deals update (usually closed deals)."""
+        data = self._unwrap(data)
+        for order in data["deals"]:
+            order_id = order.get("id")
+            if order_id:
+                logger.debug("Real-time deal update for %s", order_id)
+                self._update_order(order, closed=True)
+        self.event_registry.set('history_ready', data)
+
+    def _handle_orders(self, event: str, data: Any) -> None:
+        """Order lifecycle events: open, opened, close and pending."""
+        data = self._unwrap(data)
+        logger.debug("Order event %s", event)
+
+        # Handle both single dict and list of dicts
+        orders_to_process = []
+        if isinstance(data, list):
+            orders_to_process = data
+        elif isinstance(data, dict):
+            if data.get("deals"):
+                orders_to_process = data["deals"]
+            else:
+                orders_to_process = [data]
+
+        is_close_event = "close" in event
+        for order in orders_to_process:
+            if order.get("id"):
+                self._update_order(
+                    order,
+                    closed=is_close_event or order.get("status") == "closed"
                 )
 
-            elif (
-                    isinstance(message, list)
-                    and len(message) > 0
-                    and isinstance(message[0], list)
-            ):
-                if len(message[0]) == 4:  # Price
-                    asset, ts, price = (
-                        message[0][0], message[0][1], message[0][2]
+        if isinstance(data, dict):
+            if event == "pending/create":
+                self.pending_id = data.get("id")
+                self.pending_successful = True
+                self.event_registry.set('pending_confirmed', data)
+                request_id = data.get("requestId")
+                if request_id is not None:
+                    self.inflight.resolve("pending/create", request_id, data)
+                else:
+                    self.inflight.resolve_oldest("pending/create", data)
+            elif event == "orders/open":
+                self.buy_id = data.get("id")
+                self.buy_successful = True
+                self.event_registry.set('buy_confirmed', data)
+                request_id = data.get("requestId")
+                if request_id is not None:
+                    self.inflight.resolve("orders/open", request_id, data)
+                else:
+                    # FIFO per asset: orders of one asset are acked in order
+                    self.inflight.resolve_oldest(
+                        "orders/open", data, tag=data.get("asset")
                     )
-                    self.timesync.server_timestamp = ts  # Sync server clock
+            elif data.get("deals"):
+                self.event_registry.set('history_ready', data)
+
+    def _handle_order(self, event: str, data: Any) -> None:
+        """Explicit ``order`` event."""
+        order_id = data.get("id")
+        self.buy_id = order_id
+
+        if order_id and "profit" in data and "status" in data:
+            self._update_order(data, closed=data.get("status") == "closed")
+
+        self.event_registry.set('buy_confirmed', data)
+        self.event_registry.set(f'order_closed_{order_id}', data)
+
+    def _handle_sell(self, event: str, data: Any) -> None:
+        """Responses to ``orders/cancel``, one per sold ticket."""
+        data = self._unwrap(data)
+        self.sold_options_respond = data
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, dict):
+                ticket = item.get("ticket", item.get("id"))
+                self.inflight.resolve("orders/cancel", ticket, item)
+
+    def _handle_quotes(self, event: str, data: Any) -> None:
+        """
+        Price ticks: ``[[asset, timestamp, price, direction], ...]``.
 
-                    # Limit realtime_price history to 1000 entries 
-                    # to prevent memory bloat
-                    price_list = self.realtime_price[asset]
-                    price_list.append({"time": ts, "price": price})
-                    if len(price_list) > 1000:
-                        price_list.pop(0)
+        Frames may batch quotes for several assets; every quote is applied
+        in one pass and malformed ones are counted as dropped.
+        """
+        realtime_price = self.realtime_price
+        realtime_candles = self.realtime_candles
+        ingested = self.ticks_ingested
+        dropped = self.ticks_dropped
+        publish = self.streams.publish_tick
+        newest = None
+
+        for quote in data:
+            if not isinstance(quote, list) or len(quote) != 4:
+                asset = (
+                    quote[0] if isinstance(quote, list) and quote else None
+                )
+                dropped[str(asset)] += 1
+                continue
+            asset, ts, price = quote[0], quote[1], quote[2]
+            if (
+                    not isinstance(ts, (int, float))
+                    or not isinstance(price, (int, float))
+            ):
+                dropped[str(asset)] += 1
+                continue
 
-                    self.realtime_candles[asset] = message[0]
+            realtime_price[asset].append(ts, price)
+            realtime_candles[asset] = quote
+            ingested[asset] += 1
+            publish(asset, ts, price)
+            if newest is None or ts > newest:
+                newest = ts
 
-        except Exception as e:
-            logger.error("Error in _on_message: %s", e)
+        if newest is not None:
+            self.timesync.sync(newest)  # Sync server clock
+
+    def get_tick_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Returns per-asset counts of ingested and dropped ticks.
+
+        Returns:
+            dict: ``{asset: {"ingested": int, "dropped": int}}``.
+        """
+        assets = set(self.ticks_ingested) | set(self.ticks_dropped)
+        return {
+            asset: {
+                "ingested": self.ticks_ingested.get(asset, 0),
+                "dropped": self.ticks_dropped.get(asset, 0),
+            }
+            for asset in assets
+        }
 
     def _on_error(self, error: Exception | str) -> None:
         """
@@ -486,14 +719,6 @@ class QuotexAPI:
         logger.error(error)
         self.state.websocket_error_reason = str(error)
         self.state.status = WebsocketStatus.ERROR
-        try:
-            loop = asyncio.get_running_loop()
-            if loop.is_running():
-                loop.create_task(
-                    self.event_registry.set_event("status_changed", self.state.status)
-                )
-        except RuntimeError:
-            pass
 
     def _on_close(self, code: int, msg: str) -> None:
         """
@@ -509,14 +734,12 @@ class QuotexAPI:
             self.heartbeat_task = None
 
         self.state.status = WebsocketStatus.DISCONNECTED
-        try:
-            loop = asyncio.get_running_loop()
-            if loop.is_running():
-                loop.create_task(
-                    self.event_registry.set_event("status_changed", self.state.status)
-                )
-        except RuntimeError:
-            pass
+        self.inflight.fail_all(
+            ConnectionError("WebSocket connection closed.")
+        )
+        self.order_results.fail_all(
+            ConnectionError("WebSocket connection closed.")
+        )
 
     @property
     def websocket(self) -> Any:
@@ -593,6 +816,21 @@ class QuotexAPI:
             if self.websocket:
                 await self.websocket.send(data)
 
+    async def send_websocket_requests(self, frames: list[str]) -> None:
+        """
+        Sends several raw Socket.IO strings back to back.
+
+        The send lock is taken once for the whole batch, so no other
+        request is interleaved and each frame skips the lock round-trip.
+
+        Args:
+            frames (list[str]): The raw Socket.IO strings to send.
+        """
+        async with self._ws_send_lock:
+            if self.websocket:
+                for data in frames:
+                    await self.websocket.send(data)
+
     async def check_connect(self) -> bool:
         """Checks if the WebSocket is currently connected."""
         return self.state.status == WebsocketStatus.CONNECTED
@@ -602,9 +840,16 @@ class QuotexAPI:
             asset: str,
             expiration: int,
             is_fast_option: bool = False,
-            end_time: int | None = None
+            end_time: int | None = None,
+            deal: float | int | None = None,
+            percent_mode: bool | None = None,
+            percent_deal: float | int | None = None
     ) -> None:
-        """Apply asset and time settings before placing an order."""
+        """Apply asset and time settings before placing an order.
+
+        ``deal``, ``percent_mode`` and ``percent_deal`` (stored trade
+        amount settings) are only sent when given.
+        """
         payload = {
             "asset": asset,
             "time": expiration,
@@ -612,6 +857,12 @@ class QuotexAPI:
         }
         if end_time:
             payload["endTime"] = end_time
+        if deal is not None:
+            payload["dealValue"] = deal
+        if percent_mode is not None:
+            payload["isFastAmountOption"] = percent_mode
+        if percent_deal is not None:
+            payload["dealPercentValue"] = percent_deal
 
         data = f'42["settings/apply", {json.dumps_str(payload)}]'
         await self.send_websocket_request(data)
@@ -723,7 +974,8 @@ class QuotexAPI:
             asset: str,
             direction: str,
             duration: int,
-            open_time: int
+            open_time: int,
+            request_id: int | None = None
     ) -> None:
         """Places a pending order to be executed at a specific future time."""
         payload = {
@@ -734,7 +986,9 @@ class QuotexAPI:
             "openTime": open_time,
             "isDemo": int(self.account_type) if self.account_type is not None else AccountType.DEMO,
             "tournamentId": self.tournament_id,
-            "requestId": int(time.time())
+            "requestId": (
+                request_id if request_id is not None else int(time.time())
+            )
         }
         data = f'42["pending/create", {json.dumps_str(payload)}]'
         await self.send_websocket_request(data)
@@ -760,7 +1014,6 @@ class QuotexAPI:
         """
         self.state.status = WebsocketStatus.CONNECTING
         self.state.auth_status = AuthStatus.NOT_AUTHENTICATED
-        await self.event_registry.set_event("status_changed", self.state.status)
         if not self.state.SSID:
             await self.authenticate()
 
@@ -779,12 +1032,16 @@ class QuotexAPI:
                 url=self.wss_url, extra_headers=extra_headers, ssl=unified_ssl_context
             )
         )
-        for _ in range(100):
-            if self.state.status == WebsocketStatus.ERROR:
-                return False, self.state.websocket_error_reason
-            if self.state.status == WebsocketStatus.CONNECTED:
-                return True, "Connected"
-            await asyncio.sleep(0.1)
+        await self.wait_state(
+            lambda state: state.status in (
+                WebsocketStatus.CONNECTED, WebsocketStatus.ERROR
+            ),
+            timeout=10
+        )
+        if self.state.status == WebsocketStatus.ERROR:
+            return False, self.state.websocket_error_reason
+        if self.state.status == WebsocketStatus.CONNECTED:
+            return True, "Connected"
         return False, "Timeout"
 
     async def send_ssid(self) -> bool:
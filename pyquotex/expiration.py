@@ -1,13 +1,18 @@
-import calendar
 import time
 from datetime import (
     datetime,
     timedelta
 )
+from typing import Callable
 
+# Signature of the ``clock`` argument of the helpers below: returns the
+# current UNIX time in seconds. Clients pass their server clock estimate
+# (``TimeSync.server_now``); the default is the local clock.
+Clock = Callable[[], float]
 
-def get_timestamp() -> int:
-    return calendar.timegm(time.gmtime())
+
+def get_timestamp(clock: Clock = time.time) -> int:
+    return int(clock())
 
 
 def date_to_timestamp(dt: datetime) -> float:
@@ -18,8 +23,8 @@ def timestamp_to_date(timestamp: float | int) -> datetime:
     return datetime.fromtimestamp(timestamp)
 
 
-def get_timestamp_days_ago(days: int) -> int:
-    current_time = int(time.time())
+def get_timestamp_days_ago(days: int, clock: Clock = time.time) -> int:
+    current_time = int(clock())
     seconds_in_day = 86400
     timestamp_days_ago = current_time - (days * seconds_in_day)
     return timestamp_days_ago
@@ -63,6 +68,20 @@ def get_expiration_time_quotex(timestamp: int, duration: int) -> int:
     return int(expiration_time.timestamp())
 
 
+def get_next_candle_time(timestamp: int | float, timeframe: int) -> int:
+    """
+    Returns the first candle boundary strictly after the timestamp.
+
+    Args:
+        timestamp: timestamp in seconds.
+        timeframe (int): Candle period in seconds.
+
+    Returns:
+        int: UNIX timestamp of the next multiple of the timeframe.
+    """
+    return (int(timestamp) // timeframe + 1) * timeframe
+
+
 def get_next_timeframe(
         timestamp: int | float,
         time_zone: int,
@@ -113,21 +132,25 @@ def get_next_timeframe(
     return next_time.strftime('%Y-%m-%dT%H:%M:%S.000Z')
 
 
-def get_expiration_time(timestamp: int | float, duration: int) -> int:
-    now = datetime.now()
+def get_expiration_time(
+        timestamp: int | float, duration: int, clock: Clock = time.time
+) -> int:
+    now = datetime.fromtimestamp(clock())
     new_date = now.replace(second=0, microsecond=0)
     exp = new_date + timedelta(seconds=duration)
     exp_date = exp.replace(second=0, microsecond=0)
     return int(date_to_timestamp(exp_date))
 
 
-def get_period_time(duration: int) -> int:
-    now = datetime.now()
+def get_period_time(duration: int, clock: Clock = time.time) -> int:
+    now = datetime.fromtimestamp(clock())
     period_date = now - timedelta(seconds=duration)
     return int(date_to_timestamp(period_date))
 
 
-def get_remaning_time(timestamp: int | float) -> list[tuple[int, int]]:
+def get_remaning_time(
+        timestamp: int | float, clock: Clock = time.time
+) -> list[tuple[int, int]]:
     now_date = datetime.fromtimestamp(timestamp)
     exp_date = now_date.replace(second=0, microsecond=0)
     if (
@@ -159,18 +182,21 @@ def get_remaning_time(timestamp: int | float) -> list[tuple[int, int]]:
             dr = 15 * (idx - 4)
         else:
             dr = idx + 1
-        remaning.append((dr, int(t) - int(time.time())))
+        remaning.append((dr, int(t) - int(clock())))
     return remaning
 
 
-def get_server_timer(time_offset_seconds: int) -> int:
+def get_server_timer(
+        time_offset_seconds: int, clock: Clock = time.time
+) -> int:
     """
-    Returns the server (UTC) timestamp based on local time and offset.
+    Returns the server (UTC) timestamp based on the clock and offset.
 
     :param time_offset_seconds: The offset in seconds between local time 
                                  and UTC. Example: -10800 for UTC-3.
+    :param clock: Source of the current time; defaults to the local clock.
     :return: An integer representing the server time as a Unix timestamp (UTC).
     """
-    local_time = datetime.now()
-    server_time = local_time - timedelta(seconds=time_offset_seconds)
-    return int(server_time.timestamp())
+    local_time = datetime.fromtimestamp(clock())
+    shifted = local_time - timedelta(seconds=time_offset_seconds)
+    return int(shifted.timestamp())
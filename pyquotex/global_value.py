@@ -4,8 +4,9 @@ Replaces the old module-level global variables with an instanciable
 dataclass so that multiple QuotexAPI instances can coexist without
 sharing state (multi-account support).
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import IntEnum
+from typing import Any, Callable, NamedTuple
 
 
 class WebsocketStatus(IntEnum):
@@ -24,9 +25,26 @@ class AuthStatus(IntEnum):
     FAILED = -1
 
 
+class StateChange(NamedTuple):
+    """A transition of ``status`` or ``auth_status``."""
+    field: str
+    old: Any
+    new: Any
+    connected: bool
+
+
+# Fields whose changes are reported to the state listeners.
+WATCHED_FIELDS = frozenset({"status", "auth_status"})
+
+
 @dataclass
 class ConnectionState:
-    """Mutable state scoped to a single QuotexAPI connection."""
+    """Mutable state scoped to a single QuotexAPI connection.
+
+    Listeners added with :meth:`add_listener` are called synchronously with
+    a :class:`StateChange` whenever ``status`` or ``auth_status`` changes
+    value.
+    """
 
     SSID: str | None = None
     status: WebsocketStatus = WebsocketStatus.DISCONNECTED
@@ -34,6 +52,40 @@ class ConnectionState:
     started_listen_instruments: bool = True
     websocket_error_reason: str | None = None
     balance_id: int | None = None
+    _listeners: list[Callable[[StateChange], Any]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in WATCHED_FIELDS:
+            object.__setattr__(self, name, value)
+            return
+        old = self.__dict__.get(name)
+        object.__setattr__(self, name, value)
+        listeners = self.__dict__.get("_listeners")
+        if listeners and old != value:
+            change = StateChange(name, old, value, self.is_connected)
+            for listener in list(listeners):
+                listener(change)
+
+    @property
+    def is_connected(self) -> bool:
+        """True while the socket is open and the session authorized."""
+        return (
+                self.status == WebsocketStatus.CONNECTED
+                and self.auth_status == AuthStatus.AUTHENTICATED
+        )
+
+    def add_listener(self, listener: Callable[[StateChange], Any]) -> None:
+        """Calls listener with every status/auth_status transition."""
+        self._listeners.append(listener)
+
+    def remove_listener(
+            self, listener: Callable[[StateChange], Any]
+    ) -> None:
+        """Removes a listener added with add_listener."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
 
     @property
     def check_websocket_if_connect(self) -> int:
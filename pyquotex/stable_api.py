@@ -2,8 +2,18 @@ import asyncio
 import itertools
 import logging
 import time
+from collections import deque
 from datetime import datetime
-from typing import Any, Callable
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+)
 
 from pyquotex.utils import json_utils as json
 from . import expiration
@@ -13,8 +23,11 @@ from .config import (
     update_session,
     resource_path
 )
-from .global_value import AuthStatus
+from .global_value import StateChange
 from .utils.account_type import AccountType
+from .utils.bounded import DEFAULT_STATE_LIMITS, StateLimits
+from .utils.candle_store import CandleStore
+from .utils.range_planner import DEFAULT_CHUNK_CANDLES, RangePlanner
 from .utils.indicators import TechnicalIndicators
 from .utils.processor import (
     calculate_candles,
@@ -25,12 +38,38 @@ from .utils.processor import (
 )
 from .utils.optimization import OptimizedQuotexMixin
 from .utils.services import truncate
+from .utils.tick_buffer import DEFAULT_TICK_CAPACITY, TickBuffer
+from .ws.history_jobs import (
+    DEFAULT_MAX_JOBS,
+    DEFAULT_PREFETCH,
+    BulkHistoryDownloader,
+    HistoryJob,
+)
+from .ws.ingest import DEFAULT_INGEST_CAPACITY, DROP_OLDEST
+from .ws.objects.instruments import Instrument, InstrumentChange
+from .ws.scheduler import OrderScheduler, ScheduledOrder
+from .ws.streams import (
+    DEFAULT_STREAM_SIZE,
+    StreamClosed,
+    StreamHub,
+    Subscription,
+)
+from .ws.throttle import DEFAULT_RATE
 
 logger = logging.getLogger(__name__)
 
 # Default timeout (seconds) for async polling loops
 DEFAULT_TIMEOUT = 30
 
+# Seconds to wait for the authorization reply after connecting
+AUTH_TIMEOUT = 10
+
+# Safety limit (seconds) for check_win
+CHECK_WIN_TIMEOUT = 300
+
+# Seconds prepare_order() waits for the first tick of an asset
+PREPARE_TIMEOUT = 5
+
 # Monotonically-increasing counter for WebSocket request indices.
 # Seeded from the current millisecond timestamp so indices remain
 # browser-style large integers while being globally unique across
@@ -52,7 +91,14 @@ class Quotex(OptimizedQuotexMixin):
             asset_default: str = "EURUSD",
             period_default: int = 60,
             proxies: dict[str, str] | None = None,
-            on_otp_callback: Callable | None = None
+            on_otp_callback: Callable | None = None,
+            tick_capacity: int = DEFAULT_TICK_CAPACITY,
+            ingest_capacity: int = DEFAULT_INGEST_CAPACITY,
+            market_policy: str = DROP_OLDEST,
+            bounded_state: bool = False,
+            state_limits: StateLimits | None = None,
+            candle_store: CandleStore | str | None = None,
+            history_rate: float = DEFAULT_RATE
     ):
         """
         Initializes the Quotex stable API wrapper.
@@ -71,6 +117,26 @@ class Quotex(OptimizedQuotexMixin):
                 Defaults to 60.
             proxies (dict, optional): Proxy configuration.
             on_otp_callback (callable, optional): Callback for 2FA/OTP input.
+            tick_capacity (int): Real-time ticks kept per asset.
+                Defaults to 1000.
+            ingest_capacity (int): Items per lane of the ingest queue
+                between the socket and the handlers. Defaults to 1024.
+            market_policy (str): What to do with streaming market data
+                when the queue is full: "drop_oldest" (default) or
+                "conflate" (keep only the newest update per asset).
+            bounded_state (bool): Bound the long-lived per-connection state
+                (candle, sentiment and order caches, event keys) with the
+                capacity/TTL limits of DEFAULT_STATE_LIMITS. Defaults to
+                False.
+            state_limits (dict, optional): ``{structure: (capacity, ttl)}``
+                overrides, merged over the defaults when bounded_state is
+                enabled.
+            candle_store (CandleStore | str, optional): Store (or SQLite
+                file path) used by get_historical_candles() to download
+                only the ranges it does not cover yet.
+            history_rate (float): Ceiling on history requests per second,
+                shared by all history calls on the connection. Defaults
+                to 10.
         """
         self.size = [
             5, 10, 15, 30, 60, 120, 300, 600, 900, 1800,
@@ -100,6 +166,26 @@ class Quotex(OptimizedQuotexMixin):
         session = load_session(self.email, user_agent)
         self.session_data = session
         self.on_otp_callback = on_otp_callback
+        self.tick_capacity = tick_capacity
+        self.ingest_capacity = ingest_capacity
+        self.market_policy = market_policy
+        self.history_rate = history_rate
+        self.state_limits: StateLimits = (
+            {**DEFAULT_STATE_LIMITS, **(state_limits or {})}
+            if bounded_state else dict(state_limits or {})
+        )
+        self._event_handlers: list[tuple[str, Callable]] = []
+        # Outlives reconnections, like the event handlers.
+        self.streams = StreamHub()
+        self.scheduler = OrderScheduler(self)
+        self.candle_store: CandleStore | None = (
+            CandleStore(candle_store)
+            if isinstance(candle_store, (str, Path)) else candle_store
+        )
+        # Plan of the last get_historical_candles() call
+        self.history_plan: RangePlanner | None = None
+        # Candles per history/load response, once a plan learned it
+        self.history_capacity: int | None = None
 
     @property
     def websocket(self) -> Any:
@@ -111,14 +197,76 @@ class Quotex(OptimizedQuotexMixin):
     @staticmethod
     async def _check_connect(state: Any) -> bool:
         """Check connection using the per-instance state object."""
-        await asyncio.sleep(2)
-        return state.auth_status == AuthStatus.AUTHENTICATED
+        return state.is_connected
 
     async def check_connect(self) -> bool:
         """Check connection using the current API's state."""
+        return self.is_connected
+
+    @property
+    def is_connected(self) -> bool:
+        """True while the WebSocket is open and the session authorized."""
+        return self.api is not None and self.api.state.is_connected
+
+    async def wait_connected(
+            self, timeout: float | None = DEFAULT_TIMEOUT
+    ) -> bool:
+        """
+        Waits until the connection is open and authorized.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait.
+
+        Returns:
+            bool: True once connected; False if the authorization was
+            rejected, the timeout expired or connect() was never called.
+        """
         if self.api is None:
             return False
-        return await self._check_connect(self.api.state)
+        return await self.api.wait_connected(timeout)
+
+    def stream_connection_state(
+            self, maxsize: int = DEFAULT_STREAM_SIZE
+    ) -> AsyncIterator[StateChange]:
+        """
+        Streams connection state transitions.
+
+        Yields a StateChange ``(field, old, new, connected)`` every time
+        the WebSocket ``status`` or the ``auth_status`` changes, across
+        reconnections.
+
+        Returns:
+            AsyncIterator: StateChange tuples.
+        """
+        return self._iterate(lambda: self.streams.subscribe(
+            ("connection",), "connection", maxsize=maxsize
+        ))
+
+    def add_event_handler(
+            self, event: str, handler: Callable[[str, Any], Any]
+    ) -> None:
+        """
+        Registers a handler for a raw WebSocket event.
+
+        The handler is called as ``handler(event, data)`` (sync or async)
+        after the built-in handlers, and is kept across reconnections.
+
+        Args:
+            event (str): Socket.IO event name, e.g. ``"orders/close"``.
+            handler (callable): The callback to invoke.
+        """
+        self._event_handlers.append((event, handler))
+        if self.api:
+            self.api.router.register(event, handler)
+
+    def remove_event_handler(
+            self, event: str, handler: Callable[[str, Any], Any]
+    ) -> None:
+        """Removes a handler registered with add_event_handler."""
+        if (event, handler) in self._event_handlers:
+            self._event_handlers.remove((event, handler))
+        if self.api:
+            self.api.router.unregister(event, handler)
 
     def set_session(
             self,
@@ -196,13 +344,44 @@ class Quotex(OptimizedQuotexMixin):
         Returns:
             list: List of assets with ID and display name.
         """
-        if self.api and self.api.instruments:
+        if self.api and len(self.api.instrument_catalog):
             return [
-                [i[1], i[2].replace("\n", "")]
-                for i in self.api.instruments
+                [instrument.symbol, instrument.name]
+                for instrument in self.api.instrument_catalog
             ]
         return None
 
+    def get_instrument(self, asset_name: str) -> Instrument | None:
+        """
+        Looks an asset up in the instrument catalog, without I/O.
+
+        Args:
+            asset_name (str): Asset symbol, e.g. "EURUSD_otc".
+
+        Returns:
+            Instrument | None: The decoded instruments/list row.
+        """
+        if self.api is None:
+            return None
+        return self.api.instrument_catalog.get(asset_name)
+
+    def stream_instrument_changes(
+            self, maxsize: int = DEFAULT_STREAM_SIZE
+    ) -> AsyncIterator[InstrumentChange]:
+        """
+        Streams instrument changes from ``instruments/list`` pushes.
+
+        Yields an InstrumentChange ``(symbol, field, old, new)`` when an
+        asset opens or closes, its payout changes, or it is added or
+        removed.
+
+        Returns:
+            AsyncIterator: InstrumentChange tuples.
+        """
+        return self._iterate(lambda: self.streams.subscribe(
+            ("instruments",), "instruments", maxsize=maxsize
+        ))
+
     async def get_available_asset(
             self, asset_name: str, force_open: bool = False
     ) -> tuple[str, Any]:
@@ -240,14 +419,12 @@ class Quotex(OptimizedQuotexMixin):
         Returns:
             tuple: (Raw instrument data, Formatted status info).
         """
-        instruments = await self.get_instruments()
-        for i in instruments:
-            if asset_name == i[1]:
-                if self.api:
-                    self.api.current_asset = asset_name
-                return i, (i[0], i[2].replace("\n", ""), i[14])
-
-        return None, (None, None, None)
+        await self.get_instruments()
+        instrument = self.get_instrument(asset_name)
+        if instrument is None:
+            return None, (None, None, None)
+        self.api.current_asset = asset_name
+        return instrument.raw, (instrument.id, instrument.name, instrument.open)
 
     async def get_all_assets(self) -> dict[str, str]:
         """
@@ -256,10 +433,11 @@ class Quotex(OptimizedQuotexMixin):
         Returns:
             dict: Mapping of asset names to codes.
         """
-        instruments = await self.get_instruments()
-        for i in instruments:
-            if i[0] != "":
-                self.codes_asset[i[1]] = i[0]
+        await self.get_instruments()
+        if self.api:
+            for instrument in self.api.instrument_catalog:
+                if instrument.id != "":
+                    self.codes_asset[instrument.symbol] = instrument.id
 
         return self.codes_asset
 
@@ -279,27 +457,38 @@ class Quotex(OptimizedQuotexMixin):
         if end_from_time is None:
             end_from_time = time.time()
 
-        index = expiration.get_timestamp()
+        index = next(_request_counter)
         self.api.candles.candles_data = None
 
-        # Clear event state before requesting data to prevent
-        # race with WS response
-        await self.api.event_registry.clear_event(f'candles_ready_{asset}')
-
         await self.start_candles_stream(asset, period)
-        await self.api.get_candles(asset, index, end_from_time, offset, period)
 
+        throttle = self.api.history_throttle
+        started = await throttle.acquire()
+        # Released on every path; None frees the slot without feedback
+        ok = None
         try:
-            # Wait for WebSocket event signaling candles' arrival
-            history_data = await self.api.event_registry.wait_event(
-                f'candles_ready_{asset}', timeout=timeout
+            # The response echoes the index, which resolves this request
+            history_data = await self.api.inflight.request(
+                "history/load",
+                index,
+                lambda: self.api.get_candles(
+                    asset, index, end_from_time, offset, period
+                ),
+                timeout=timeout
             )
+            ok = True
         except TimeoutError:
+            ok = False
             logger.error(
                 "Timeout waiting for candles for %s after %ds",
                 asset, timeout
             )
             return None
+        except ConnectionError as e:
+            logger.error("Candles request for %s failed: %s", asset, e)
+            return None
+        finally:
+            throttle.release(started, ok)
 
         # Pass the asset-specific history directly to avoid
         # multi-asset state races
@@ -332,22 +521,41 @@ class Quotex(OptimizedQuotexMixin):
         }
         ws_msg = f'42["history/load",{json.dumps_str(payload)}]'
 
-        # Clear specific event to ensure fresh wait
-        event_name = f'candles_ready_{asset}_{index}'
-        await self.api.event_registry.clear_event(event_name)
-
-        await self.api.send_websocket_request(ws_msg)
-
+        throttle = self.api.history_throttle
+        started = await throttle.acquire()
+        # Released on every path; None frees the slot without feedback
+        ok = None
         try:
-            return await self.api.event_registry.wait_event(
-                event_name, timeout=timeout
+            data = await self.api.inflight.request(
+                "history/load",
+                index,
+                lambda: self.api.send_websocket_request(ws_msg),
+                timeout=timeout
             )
+            ok = not (isinstance(data, dict) and data.get("error"))
         except TimeoutError:
+            ok = False
             logger.warning(
                 "Batch fetch timeout at %d (index %d) for %s",
                 fetch_time, index, asset
             )
             return None
+        except ConnectionError as e:
+            logger.warning(
+                "Batch fetch at %d (index %d) for %s failed: %s",
+                fetch_time, index, asset, e
+            )
+            return None
+        finally:
+            throttle.release(started, ok)
+
+        if not ok:
+            logger.warning(
+                "Batch fetch at %d (index %d) for %s failed: %s",
+                fetch_time, index, asset, data["error"]
+            )
+            return None
+        return data
 
     def _parse_historical_candles(
             self, raw_data: dict[str, Any]
@@ -371,6 +579,75 @@ class Quotex(OptimizedQuotexMixin):
                 parsed.append(c)
         return parsed
 
+    async def _run_history_plan(
+            self,
+            asset: str,
+            period: int,
+            planner: RangePlanner,
+            candles: dict[int, dict[str, Any]],
+            timeout: int,
+            workers: int,
+            progress_callback: Callable[[int, int, int, str], None] | None = None
+    ) -> None:
+        """
+        Requests the ranges of a plan with parallel workers until it is
+        finished, collecting the candles of each range by time.
+        """
+        total = planner.end - planner.start
+        # Set whenever a range is answered or fails, to wake idle workers
+        changed = asyncio.Event()
+
+        async def worker(worker_id: int) -> None:
+            worker_label = f"Worker-{worker_id}"
+            while True:
+                task = planner.next_task()
+                if task is None:
+                    if planner.finished:
+                        return
+                    # Wait for a range to come back or a retry to be due
+                    changed.clear()
+                    try:
+                        await asyncio.wait_for(
+                            changed.wait(), planner.retry_delay()
+                        )
+                    except TimeoutError:
+                        pass
+                    continue
+
+                # Use a monotonically-increasing counter so that parallel
+                # workers and back-to-back iterations within the same worker
+                # never produce the same index — the index is the in-flight
+                # correlation key, so a collision would mix up responses.
+                index = next(_request_counter)
+
+                batch_data = await self._fetch_historical_batch(
+                    asset, task.fetch_time, task.offset, period, index,
+                    timeout
+                )
+
+                if not batch_data:
+                    planner.fail(task)
+                else:
+                    new_batch = self._parse_historical_candles(batch_data)
+                    for c in new_batch:
+                        if task.start <= c['time'] < task.end:
+                            candles[c['time']] = c
+                    planner.complete(task, [c['time'] for c in new_batch])
+
+                    if progress_callback:
+                        # Report progress based on how much is covered
+                        progress_callback(
+                            planner.covered.covered(
+                                planner.start, planner.end
+                            ),
+                            total,
+                            len(candles),
+                            worker_label
+                        )
+                changed.set()
+
+        await asyncio.gather(*(worker(i) for i in range(workers)))
+
     # https://t.me/pyquotex/1/16064
     # https://github.com/usmanch96/quotex-historical-data
     async def get_historical_candles(
@@ -379,100 +656,281 @@ class Quotex(OptimizedQuotexMixin):
             amount_of_seconds: int,
             period: int,
             timeout: int = DEFAULT_TIMEOUT,
-            max_workers: int = 5,
-            progress_callback: Callable[[int, int, int, str], None] | None = None
+            max_workers: int | None = None,
+            progress_callback: Callable[[int, int, int, str], None] | None = None,
+            store: CandleStore | None = None
     ) -> list[dict[str, Any]]:
         """
-        Retrieves extensive historical candle data using a hybrid parallel-sequential approach.
-        Divides the total time range into blocks assigned to parallel workers.
-        Each worker fetches its block sequentially to ensure no gaps.
+        Retrieves extensive historical candle data using parallel workers.
+        A :class:`RangePlanner` hands each idle worker the newest range not
+        covered yet, sized to the candles the server returns per response,
+        and retries failed ranges with backoff. The plan of the last call
+        is reported by :meth:`get_history_stats`.
+
+        How many requests are in flight is adapted to the server by the
+        connection's history throttle (AIMD, with a requests-per-second
+        ceiling); ``max_workers`` only caps it further.
+
+        With a candle store (``store`` or the client's ``candle_store``),
+        only the ranges the store does not cover yet are downloaded; the
+        fetched candles and the ranges they cover are written back, and
+        the result is read from the store.
         """
+        if self.api is None:
+            return []
+        store = store if store is not None else self.candle_store
         all_candles: dict[int, dict[str, Any]] = {}
         current_time = int(time.time())
         target_start_time = current_time - amount_of_seconds
+        # Coverage is tracked in candle open times, from the first open
+        # time in range up to the candle still forming, which is always
+        # downloaded again.
+        first_open = -(-target_start_time // period) * period
+        complete_end = current_time // period * period
+
+        known = ()
+        if store is not None:
+            known = [
+                (s, min(e, complete_end))
+                for s, e in store.coverage(asset, period)
+            ]
+        # The server's limit per response carries over between calls
+        planner = RangePlanner(
+            first_open, current_time + 1, period, covered=known,
+            capacity=self.history_capacity
+        )
+        self.history_plan = planner
+        await self.start_candles_stream(asset, period)
 
-        # Divide total range into large blocks for each worker
-        block_size = amount_of_seconds // max_workers
-        chunk_seconds = period * 200  # Request size per batch
-        semaphore = asyncio.Semaphore(max_workers)
+        # The throttle decides how many of them have a request in flight
+        workers = max_workers or int(self.api.history_throttle.maximum)
+        await self._run_history_plan(
+            asset, period, planner, all_candles, timeout, workers,
+            progress_callback
+        )
+        self._learn_history_capacity(planner)
 
-        async def worker(start_t: int, end_t: int, worker_id: int) -> list[dict[str, Any]]:
-            worker_candles = {}
-            worker_label = f"Worker-{worker_id}"
-            async with semaphore:
-                oldest_t = start_t
-                while oldest_t > end_t:
-                    # Use a monotonically-increasing counter so that parallel
-                    # workers and back-to-back iterations within the same worker
-                    # never produce the same index — prevents event-registry
-                    # key collisions where one worker steals another's response.
-                    index = next(_request_counter)
-
-                    batch_data = await self._fetch_historical_batch(
-                        asset, oldest_t, chunk_seconds, period, index, timeout
-                    )
+        if planner.completeness() < 100:
+            logger.warning(
+                "History of %s (%ds) is %.2f%% complete: %s",
+                asset, period, planner.completeness(), list(planner.failed)
+            )
 
-                    if not batch_data:
-                        # Gap or error, jump back to try continuing
-                        oldest_t -= chunk_seconds
-                        continue
+        if store is not None:
+            store.add(asset, period, all_candles.values(), [
+                (s, min(e, complete_end)) for s, e in planner.covered
+            ])
+            return store.load(
+                asset, period, target_start_time, current_time + 1
+            )
 
-                    new_batch = self._parse_historical_candles(batch_data)
-                    if not new_batch:
-                        oldest_t -= chunk_seconds
-                        continue
+        return sorted(all_candles.values(), key=lambda x: x['time'])
 
-                    # Process and find new boundary
-                    batch_times = []
-                    for c in new_batch:
-                        ts = c['time']
-                        if ts >= end_t and ts <= start_t:
-                            worker_candles[ts] = c
-                            batch_times.append(ts)
+    async def iter_historical_candles(
+            self,
+            asset: str,
+            start: float,
+            end: float | None,
+            period: int,
+            timeout: int = DEFAULT_TIMEOUT,
+            prefetch: int = 4,
+            store: CandleStore | None = None,
+            subscribe: bool = True
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Streams historical candles in time order, batch by batch.
 
-                    if not batch_times:
-                        oldest_t -= chunk_seconds
-                        continue
+        The range is split into consecutive windows of about one response
+        each. Up to ``prefetch`` windows are downloaded ahead of the one
+        being yielded, so memory stays bounded by ``prefetch`` windows
+        whatever the length of the range.
 
-                    batch_times.sort()
-                    new_oldest = batch_times[0]
+        With a candle store (``store`` or the client's ``candle_store``),
+        windows the store covers are read from it, and every downloaded
+        window is written to it before it is yielded.
 
-                    if progress_callback:
-                        # Report progress based on how much of the block is covered
-                        progress_callback(
-                            start_t - new_oldest,
-                            start_t - end_t,
-                            len(worker_candles),
-                            worker_label
-                        )
+        Args:
+            asset (str): Asset symbol.
+            start (float): Oldest candle time wanted (unix seconds).
+            end (float | None): End of the range (exclusive); None for now.
+            period (int): Candle period in seconds.
+            timeout (int): Timeout per request in seconds.
+            prefetch (int): Windows downloaded ahead of the consumer.
+            store (CandleStore, optional): Store read from and written to.
+            subscribe (bool): Start the asset's candle stream first, as
+                the other history calls do.
+
+        Yields:
+            list[dict]: Non-empty batches of candles, oldest first, each
+            newer than everything yielded before.
+        """
+        if self.api is None:
+            return
+        store = store if store is not None else self.candle_store
+        current_time = int(time.time())
+        end = current_time + 1 if end is None else min(
+            int(end), current_time + 1
+        )
+        first_open = -(-int(start) // period) * period
+        complete_end = current_time // period * period
+
+        if subscribe:
+            await self.start_candles_stream(asset, period)
+
+        # Learned from the windows in the order they are yielded, so the
+        # window sizes do not depend on which download finishes first
+        capacity = self.history_capacity
+
+        async def fetch(
+                window_start: int, window_end: int, capacity: int | None
+        ) -> tuple[RangePlanner, list[dict[str, Any]]]:
+            known = ()
+            if store is not None:
+                known = [
+                    (s, min(e, complete_end))
+                    for s, e in store.coverage(asset, period)
+                ]
+            planner = RangePlanner(
+                window_start, window_end, period, covered=known,
+                capacity=capacity
+            )
+            candles: dict[int, dict[str, Any]] = {}
+            if not planner.finished:
+                await self._run_history_plan(
+                    asset, period, planner, candles, timeout, workers=1
+                )
+            if planner.completeness() < 100:
+                logger.warning(
+                    "History of %s (%ds) in [%d, %d) is %.2f%% complete",
+                    asset, period, window_start, window_end,
+                    planner.completeness()
+                )
+            if store is None:
+                return planner, sorted(
+                    candles.values(), key=lambda x: x['time']
+                )
+            store.add(asset, period, candles.values(), [
+                (s, min(e, complete_end)) for s, e in planner.covered
+            ])
+            return planner, store.load(
+                asset, period, window_start, window_end
+            )
 
-                    if new_oldest >= oldest_t:
-                        oldest_t -= chunk_seconds
-                    else:
-                        oldest_t = new_oldest
+        def windows() -> Iterator[tuple[int, int]]:
+            window_start = first_open
+            while window_start < end:
+                chunk = capacity or DEFAULT_CHUNK_CANDLES
+                window_end = min(end, window_start + chunk * period)
+                yield window_start, window_end
+                window_start = window_end
+
+        pending: deque[asyncio.Task] = deque()
+        planned = windows()
+        last_time = None
+        try:
+            while True:
+                while len(pending) < max(1, prefetch):
+                    window = next(planned, None)
+                    if window is None:
+                        break
+                    pending.append(
+                        asyncio.create_task(fetch(*window, capacity))
+                    )
+                if not pending:
+                    return
+                planner, batch = await pending.popleft()
+                if planner.capacity is not None:
+                    capacity = planner.capacity
+                    self._learn_history_capacity(planner)
+                # Drop anything a window boundary let through twice
+                if last_time is not None:
+                    batch = [c for c in batch if c['time'] > last_time]
+                if batch:
+                    last_time = batch[-1]['time']
+                    yield batch
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def download_history(
+            self,
+            jobs: Iterable[HistoryJob | tuple],
+            store: CandleStore | str | None = None,
+            max_jobs: int = DEFAULT_MAX_JOBS,
+            prefetch: int = DEFAULT_PREFETCH,
+            timeout: int = DEFAULT_TIMEOUT,
+            progress_callback: Callable[[HistoryJob], None] | None = None
+    ) -> list[HistoryJob]:
+        """
+        Downloads the history of many ``(asset, period, range)`` jobs.
 
-                    # Small throttle
-                    await asyncio.sleep(0.1)
+        Jobs run ``max_jobs`` at a time over this connection, sharing its
+        history throttle (adaptive concurrency and requests-per-second
+        ceiling). Candles are written to the store window by window, and
+        the store doubles as the checkpoint: running the same jobs again
+        after a crash only downloads what was not written yet.
 
-            return list(worker_candles.values())
+        Args:
+            jobs (Iterable): HistoryJob objects or
+                ``(asset, period, start[, end])`` tuples; ``end`` defaults
+                to now.
+            store (CandleStore | str, optional): Store (or SQLite path);
+                defaults to the client's ``candle_store``.
+            max_jobs (int): Jobs downloading at the same time.
+            prefetch (int): Windows each job downloads ahead.
+            timeout (int): Timeout per request in seconds.
+            progress_callback (Callable, optional): Called with the job
+                after every window written and when it finishes.
 
-        await self.start_candles_stream(asset, period)
+        Returns:
+            list[HistoryJob]: The jobs with their status, candle counts,
+            completeness and throughput.
 
-        # Launch workers for each block
-        tasks = []
-        for i in range(max_workers):
-            s = current_time - (i * block_size)
-            e = max(target_start_time, s - block_size)
-            tasks.append(worker(s, e, i))
+        Raises:
+            ValueError: If there is no store to write to.
+        """
+        if self.api is None:
+            raise RuntimeError("API not initialized")
+        store = store if store is not None else self.candle_store
+        if store is None:
+            raise ValueError("download_history needs a candle store.")
+        # A store opened from a path here is closed here
+        opened = isinstance(store, (str, Path))
+        if opened:
+            store = CandleStore(store)
+        try:
+            downloader = BulkHistoryDownloader(
+                self, store, max_jobs=max_jobs, prefetch=prefetch,
+                timeout=timeout
+            )
+            return await downloader.run(jobs, progress_callback)
+        finally:
+            if opened:
+                store.close()
 
-        results = await asyncio.gather(*tasks)
+    def _learn_history_capacity(self, planner: RangePlanner) -> None:
+        """Keeps the candles per response a plan learned for later ones."""
+        if planner.capacity is not None:
+            self.history_capacity = planner.capacity
 
-        # Merge results and deduplicate
-        for batch in results:
-            for c in batch:
-                all_candles[c['time']] = c
+    def get_history_stats(self) -> dict[str, Any]:
+        """
+        Returns the plan of the last ``get_historical_candles`` call.
 
-        return sorted(all_candles.values(), key=lambda x: x['time'])
+        Returns:
+            dict: ``completeness`` (percent of the range covered), request
+            and retry counts, ``failed`` ranges given up, the request size
+            ``chunk_candles`` and the learned ``capacity`` per response,
+            plus the connection's history ``throttle`` (current limit of
+            requests in flight, cuts, failures and latency).
+        """
+        stats = {}
+        if self.history_plan is not None:
+            stats = self.history_plan.as_dict()
+        if self.api is not None:
+            stats["throttle"] = self.api.history_throttle.as_dict()
+        return stats
 
     async def get_candles_deep(
             self, *args: Any, **kwargs: Any
@@ -495,26 +953,24 @@ class Quotex(OptimizedQuotexMixin):
         if self.api is None:
             return None
 
-        index = expiration.get_timestamp()
+        index = next(_request_counter)
         self.api.current_asset = asset
-        # Reset to None (not {}) so the poll loop below can detect arrival.
-        # An empty dict is a valid response; None is the sentinel for
-        # "not yet received".
-        self.api.historical_candles = None
         await self.start_candles_stream(asset)
-        await self.api.get_history_line(
-            self.codes_asset[asset], index, end_from_time, offset
-        )
-        start_time = time.time()
-        while await self.check_connect() and self.api.historical_candles is None:
-            if time.time() - start_time > timeout:
-                logger.error(
-                    "Timeout waiting for history line data for %s.",
-                    asset
-                )
-                return None
-            await asyncio.sleep(0.2)
-        return self.api.historical_candles
+        try:
+            # The history/load response echoes the index
+            return await self.api.inflight.request(
+                "history/load",
+                index,
+                lambda: self.api.get_history_line(
+                    self.codes_asset[asset], index, end_from_time, offset
+                ),
+                timeout=timeout
+            )
+        except (TimeoutError, ConnectionError):
+            logger.error(
+                "Timeout waiting for history line data for %s.", asset
+            )
+            return None
 
     async def get_candle_v2(
             self, asset: str, period: int, timeout: int = DEFAULT_TIMEOUT
@@ -530,7 +986,7 @@ class Quotex(OptimizedQuotexMixin):
         # Previous code returned None on every iteration because the
         # return statement was inside the while-body instead of the
         # timeout branch, so data was never awaited.
-        while self.api.candle_v2_data[asset] is None:
+        while self.api.candle_v2_data.get(asset) is None:
             if time.time() - start_time > timeout:
                 logger.error(
                     "Timeout waiting for get_candle_v2 data for %s.",
@@ -576,7 +1032,12 @@ class Quotex(OptimizedQuotexMixin):
             resource_path=self.resource_path,
             user_data_dir=self.user_data_dir,
             proxies=self.proxies,
-            on_otp_callback=self.on_otp_callback
+            on_otp_callback=self.on_otp_callback,
+            tick_capacity=self.tick_capacity,
+            ingest_capacity=self.ingest_capacity,
+            market_policy=self.market_policy,
+            state_limits=self.state_limits,
+            history_rate=self.history_rate
         )
 
         self.api.trace_ws = self.debug_ws_enable
@@ -584,6 +1045,9 @@ class Quotex(OptimizedQuotexMixin):
         self.api.current_asset = self.asset_default
         self.api.current_period = self.period_default
         self.api.state.SSID = self.session_data.get("token")
+        for event, handler in self._event_handlers:
+            self.api.router.register(event, handler)
+        self.api.streams = self.streams
 
         if not self.session_data.get("token"):
             check, reason = await self.api.authenticate()
@@ -591,13 +1055,15 @@ class Quotex(OptimizedQuotexMixin):
                 return check, reason
 
         check, reason = await self.api.connect(self.account_is_demo == AccountType.DEMO)
-        if not await self.check_connect():
+        if not check or not await self.wait_connected(AUTH_TIMEOUT):
             logger.error(
                 "Websocket failed to connect or connection was rejected."
             )
             self.session_data = {}
             return False, "Websocket connection rejected."
 
+        if self.streams.groups():
+            await self.streams.restart()
         return check, reason
 
     async def reconnect(self) -> None:
@@ -649,18 +1115,20 @@ class Quotex(OptimizedQuotexMixin):
         if self.api is None:
             raise RuntimeError("API not initialized")
 
-        self.api.training_balance_edit_request = None
-        await self.api.edit_training_balance(
-            amount if amount is not None else 0
-        )
-        start = time.time()
-        while self.api.training_balance_edit_request is None:
-            if time.time() - start > timeout:
-                raise TimeoutError(
-                    "Timeout waiting for practice balance edit response."
-                )
-            await asyncio.sleep(0.2)
-        return self.api.training_balance_edit_request
+        try:
+            # Resolved by the demo/refill response
+            return await self.api.inflight.request(
+                "demo/refill",
+                next(_request_counter),
+                lambda: self.api.edit_training_balance(
+                    amount if amount is not None else 0
+                ),
+                timeout=timeout
+            )
+        except TimeoutError:
+            raise TimeoutError(
+                "Timeout waiting for practice balance edit response."
+            ) from None
 
     async def get_balance(self, timeout: int = DEFAULT_TIMEOUT) -> float:
         """Get account balance using a true event-driven approach."""
@@ -1042,16 +1510,28 @@ class Quotex(OptimizedQuotexMixin):
         return None
 
     async def get_server_time(self) -> int:
-        """Retrieves and syncs the server time."""
+        """
+        Returns the current server time, without any network call.
+
+        The time comes from the clock estimated from tick timestamps and
+        order round-trip times; see ``get_clock_stats()``.
+        """
         if self.api is None:
             return int(time.time())
+        return int(self.api.timesync.server_now())
 
-        user_settings = await self.get_profile()
-        offset_zone = user_settings.offset if user_settings else 0
-        self.api.timesync.server_timestamp = (
-            expiration.get_server_timer(offset_zone)
-        )
-        return self.api.timesync.server_timestamp
+    def get_clock_stats(self) -> dict[str, Any]:
+        """
+        Returns the server clock estimate.
+
+        Returns:
+            dict: ``synced``, ``offset_ms`` and ``drift_ppm`` of the
+            estimate, the smallest recent round-trip time ``rtt_ms`` and
+            sample counts.
+        """
+        if self.api is None:
+            return {}
+        return self.api.timesync.clock.as_dict()
 
     async def get_history(self) -> list[dict[str, Any]]:
         """Get the trader's history based on account type."""
@@ -1061,6 +1541,61 @@ class Quotex(OptimizedQuotexMixin):
         account_type = AccountType.DEMO if self.account_is_demo else AccountType.REAL
         return await self.api.get_trader_history(account_type, page=1)
 
+    async def prepare_order(
+            self, asset: str, duration: int, time_mode: str = "TIME"
+    ) -> None:
+        """
+        Pre-warms the order path for an asset.
+
+        Subscribes to the asset's price stream and applies its trade
+        settings once per connection, so that buy() only has to send the
+        ``orders/open`` frame. Call it ahead of time to keep the first
+        order fast as well.
+
+        Args:
+            asset (str): Asset symbol.
+            duration (int): Order duration in seconds.
+            time_mode (str): "TIME" (default) or "TIMER", as in buy().
+        """
+        if self.api is None:
+            raise RuntimeError("API not initialized")
+
+        is_fast_option = time_mode.upper() == "TIME"
+        key = (asset, duration, is_fast_option)
+        if key in self.api.prepared_orders:
+            return
+        # Concurrent first orders share one preparation.
+        task = self.api.preparing_orders.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._prepare_order(key))
+            self.api.preparing_orders[key] = task
+            task.add_done_callback(
+                lambda _: self.api.preparing_orders.pop(key, None)
+            )
+        await asyncio.shield(task)
+
+    async def _prepare_order(self, key: tuple[str, int, bool]) -> None:
+        asset, duration, is_fast_option = key
+        if not any(k[0] == asset for k in self.api.prepared_orders):
+            await self.start_candles_stream(asset, duration)
+        await self.api.settings_apply(asset, duration, is_fast_option)
+        if not self.api.timesync.synced:
+            # Ticks carry the server time used for expirations.
+            try:
+                await self._wait_first(
+                    ("prices", asset), PREPARE_TIMEOUT,
+                    f"No price data for {asset}."
+                )
+            except TimeoutError as e:
+                logger.warning("%s Using the local clock.", e)
+        self.api.prepared_orders.add(key)
+
+    def get_order_ack_stats(self) -> dict[str, Any]:
+        """Retrieves the order-to-ack latency of buy()."""
+        if self.api:
+            return self.api.get_order_ack_stats()
+        return {}
+
     async def buy(
             self,
             amount: float,
@@ -1073,34 +1608,47 @@ class Quotex(OptimizedQuotexMixin):
         if self.api is None:
             return False, "API not initialized"
 
-        self.api.buy_id = None
-        self.api.buy_successful = None
-        request_id = expiration.get_timestamp()
+        # Correlated by requestId (or FIFO per asset), never through the
+        # shared buy_id/buy_successful, so any number of orders may be in
+        # flight at once.
+        request_id = next(_request_counter)
         is_fast_option = time_mode.upper() == "TIME"
 
-        # Clear event state before requesting buy to prevent
-        # race with WS response
-        await self.api.event_registry.clear_event('buy_confirmed')
-
-        # Ensure price data is arriving and server is synced
-        await self.start_realtime_price(asset, duration)
-        await self.get_server_time()
-        await self.api.settings_apply(asset, duration, is_fast_option)
+        # No-op once the asset is subscribed and its settings applied
+        await self.prepare_order(asset, duration, time_mode)
 
-        await self.api.buy(
-            amount, asset, direction, duration, request_id, is_fast_option
+        return await self._submit_order(
+            request_id, asset, duration,
+            lambda: self.api.buy(
+                amount, asset, direction, duration, request_id,
+                is_fast_option
+            )
         )
 
+    async def _submit_order(
+            self,
+            request_id: int,
+            asset: str,
+            duration: int,
+            send: Callable[[], Awaitable[Any]]
+    ) -> tuple[bool, Any]:
+        """Sends an ``orders/open`` request and waits for its ack."""
         timeout = duration + 5 if duration else 30
 
+        sent = time.perf_counter()
         try:
-            # Wait for WebSocket event signaling buy confirmation
-            event_data = await self.api.event_registry.wait_event(
-                'buy_confirmed', timeout=timeout
+            # Resolved by the orders/open response carrying our requestId
+            event_data = await self.api.inflight.request(
+                "orders/open", request_id, send, timeout=timeout, tag=asset
             )
         except TimeoutError as e:
             logger.error(str(e))
             return False, "Timeout"
+        except ConnectionError as e:
+            return False, str(e)
+        rtt = time.perf_counter() - sent
+        self.api.order_ack_latency.record(rtt)
+        self.api.timesync.clock.observe_rtt(rtt)
 
         if self.api.state.check_websocket_if_error:
             return False, self.api.state.websocket_error_reason
@@ -1114,6 +1662,62 @@ class Quotex(OptimizedQuotexMixin):
 
         return True, event_data
 
+    async def schedule_order(
+            self,
+            at: float,
+            amount: float,
+            asset: str,
+            direction: str,
+            duration: int,
+            time_mode: str = "TIME"
+    ) -> ScheduledOrder:
+        """
+        Schedules an order to be sent at server time ``at``.
+
+        The frame is serialized immediately, with the expiration buy()
+        would compute at ``at``, and sent by ``loop.call_at`` against the
+        server clock estimate. Use
+        ``expiration.get_next_candle_time(await client.get_server_time(),
+        60)`` to target the next candle boundary.
+
+        Args:
+            at (float): Server UNIX time at which to send the order.
+            amount (float): Order amount.
+            asset (str): Asset symbol.
+            direction (str): "call" or "put".
+            duration (int): Order duration in seconds.
+            time_mode (str): "TIME" (default) or "TIMER", as in buy().
+
+        Returns:
+            ScheduledOrder: Awaitable resolving to buy()'s
+            ``(status, data)``; pass it to ``cancel_scheduled_order()``
+            to cancel it before it fires.
+
+        Raises:
+            ValueError: If ``at`` is already past.
+        """
+        if self.api is None:
+            raise RuntimeError("API not initialized")
+        return await self.scheduler.schedule(
+            at, amount, asset, direction, duration,
+            next(_request_counter), time_mode
+        )
+
+    def cancel_scheduled_order(self, order: ScheduledOrder) -> bool:
+        """Cancels a scheduled order; False if it already fired."""
+        return self.scheduler.cancel(order)
+
+    def get_scheduler_stats(self) -> dict[str, Any]:
+        """
+        Retrieves scheduled order counters and firing jitter.
+
+        Returns:
+            dict: ``pending``, ``scheduled``, ``fired``, ``cancelled``,
+            ``missed`` (not connected at firing time) and ``jitter``, the
+            histogram of the delay from target time to send.
+        """
+        return self.scheduler.metrics()
+
     async def open_pending(
             self,
             amount: float,
@@ -1126,76 +1730,165 @@ class Quotex(OptimizedQuotexMixin):
         if self.api is None:
             return False, "API not initialized"
 
-        self.api.pending_id = None
         user_settings = await self.get_profile()
         offset_zone = user_settings.offset if user_settings else 0
         open_time_int = expiration.get_next_timeframe(
-            int(time.time()),
+            int(self.api.timesync.server_now()),
             offset_zone,
             duration,
             open_time
         )
-        await self.api.open_pending(
-            amount, asset, direction, duration, open_time_int
-        )
-        start = time.time()
-        while await self.check_connect() and self.api.pending_id is None:
-            if time.time() - start > 30:
-                logger.error("Timeout pending order.")
-                return False, "Timeout waiting for pending ID"
-            await asyncio.sleep(0.2)
-            if self.api.state.check_websocket_if_error:
-                return False, self.api.state.websocket_error_reason
-
-        # Loop exited normally — pending_id was set (success path).
-        # Only follow up when we actually have an id; if the loop was
-        # broken by disconnect the early returns above already handled it.
-        if self.api.pending_id is not None:
-            status_buy = True
-            await self.api.instruments_follow(
-                amount, asset, direction, duration, open_time_int
+        request_id = next(_request_counter)
+        try:
+            # Resolved by the pending/create response
+            event_data = await self.api.inflight.request(
+                "pending/create", request_id,
+                lambda: self.api.open_pending(
+                    amount, asset, direction, duration, open_time_int,
+                    request_id
+                ),
+                timeout=30
             )
+        except TimeoutError:
+            logger.error("Timeout pending order.")
+            return False, "Timeout waiting for pending ID"
+        except ConnectionError as e:
+            return False, str(e)
 
-        return status_buy, self.api.pending_successful
+        if self.api.state.check_websocket_if_error:
+            return False, self.api.state.websocket_error_reason
+        if isinstance(event_data, dict) and "error" in event_data:
+            return False, event_data["error"]
+
+        await self.api.instruments_follow(
+            amount, asset, direction, duration, open_time_int
+        )
+        return True, self.api.pending_successful
 
     async def sell_option(
             self,
             options_ids: list[str] | str,
             timeout: int = DEFAULT_TIMEOUT
     ) -> dict[str, Any]:
-        """Sells active options back to the broker before expiration."""
+        """
+        Sells active options back to the broker before expiration.
+
+        Args:
+            options_ids (list[str] | str): One ticket or a list of tickets.
+            timeout (int): Seconds to wait for the responses.
+
+        Returns:
+            dict: The broker's response for a single ticket; for a list,
+            the per-ticket results of ``sell_options()``.
+
+        Raises:
+            TimeoutError: If a single ticket's response does not arrive.
+        """
+        if isinstance(options_ids, list):
+            return await self.sell_options(options_ids, timeout)
+        status, data = (
+            await self.sell_options([options_ids], timeout)
+        )[str(options_ids)]
+        if not status and data == "Timeout":
+            raise TimeoutError("Timeout waiting for sell option response.")
+        return data
+
+    async def sell_options(
+            self,
+            tickets: Iterable[str | int],
+            timeout: float = DEFAULT_TIMEOUT
+    ) -> dict[str, tuple[bool, Any]]:
+        """
+        Sells several options in one pipelined batch.
+
+        Returns:
+            dict: ``{ticket: (status, data)}`` as in buy(); tickets
+            without a response in time map to ``(False, "Timeout")``.
+        """
+        return {
+            ticket: (status, data)
+            async for ticket, status, data in self.stream_sell_options(
+                tickets, timeout
+            )
+        }
+
+    async def stream_sell_options(
+            self,
+            tickets: Iterable[str | int],
+            timeout: float = DEFAULT_TIMEOUT
+    ) -> AsyncIterator[tuple[str, bool, Any]]:
+        """
+        Sells several options and yields each result as it arrives.
+
+        Every ``orders/cancel`` frame is written under one socket lock
+        acquisition, and each response is matched to its ticket, either by
+        the ``orders/cancel`` reply or by the order's close event. The
+        time from the first send to the last response is recorded in
+        ``get_sell_stats()``.
+
+        Args:
+            tickets (Iterable): Tickets (order ids) to sell.
+            timeout (float): Seconds to wait for the whole batch.
+
+        Yields:
+            tuple: ``(ticket, status, data)`` in completion order; tickets
+            still unanswered at the deadline yield
+            ``(ticket, False, "Timeout")``.
+        """
         if self.api is None:
             raise RuntimeError("API not initialized")
+        api = self.api
+        tickets = list(dict.fromkeys(str(ticket) for ticket in tickets))
+        pending: dict[asyncio.Future, str] = {}
+        loop = asyncio.get_running_loop()
+        try:
+            for ticket in tickets:
+                pending[api.inflight.register("orders/cancel", ticket)] = (
+                    ticket
+                )
+            sent = time.perf_counter()
+            await api.sell_option(tickets)
+            deadline = loop.time() + timeout
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, timeout=max(0.0, deadline - loop.time()),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                for future in done:
+                    ticket = pending.pop(future)
+                    if future.exception() is not None:
+                        yield ticket, False, str(future.exception())
+                        continue
+                    data = future.result()
+                    if isinstance(data, dict) and data.get("error"):
+                        yield ticket, False, data["error"]
+                    else:
+                        yield ticket, True, data
+            if not pending:
+                api.sell_latency.record(time.perf_counter() - sent)
+            for future, ticket in list(pending.items()):
+                api.inflight.cancel(future)
+                del pending[future]
+                yield ticket, False, "Timeout"
+        finally:
+            # Also reached when the consumer stops early.
+            for future in pending:
+                api.inflight.cancel(future)
 
-        # Reset sentinel BEFORE sending the request — if the WS response
-        # arrives before the next line, it must not be wiped out.
-        self.api.sold_options_respond = None
-        await self.api.sell_option(options_ids)
-        start = time.time()
-        while self.api.sold_options_respond is None:
-            if time.time() - start > timeout:
-                raise TimeoutError("Timeout waiting for sell option response.")
-            await asyncio.sleep(0.2)
-        return self.api.sold_options_respond
+    def get_sell_stats(self) -> dict[str, Any]:
+        """Retrieves the first-send-to-last-ack latency of sell batches."""
+        if self.api:
+            return self.api.get_sell_stats()
+        return {}
 
     def get_payment(self) -> dict[str, Any]:
         """Retrieves the payout/payment percentages for all instruments."""
         if self.api is None:
             return {}
-
-        assets_data = {}
-        for i in self.api.instruments:
-            assets_data[i[2].replace("\n", "")] = {
-                "turbo_payment": i[18],
-                "payment": i[5],
-                "profit": {
-                    "1M": i[-9],
-                    "5M": i[-8]
-                },
-                "open": i[14]
-            }
-
-        return assets_data
+        # Rebuilt only when an instruments/list push changed something
+        return self.api.instrument_catalog.payments()
 
     def get_payout_by_asset(
             self, asset_name: str, timeframe: str = "1"
@@ -1205,31 +1898,15 @@ class Quotex(OptimizedQuotexMixin):
         if self.api is None:
             return None
 
-        assets_data = {}
-        for i in self.api.instruments:
-            if asset_name == i[1]:
-                assets_data[i[1].replace("\n", "")] = {
-                    "turbo_payment": i[18],
-                    "payment": i[5],
-                    "profit": {
-                        "24H": i[-10],
-                        "1M": i[-9],
-                        "5M": i[-8]
-                    },
-                    "open": i[14]
-                }
-                break
-
-        data = assets_data.get(asset_name)
-        if data is None:
+        instrument = self.api.instrument_catalog.get(asset_name)
+        if instrument is None:
             return None
-
         if timeframe == "all":
-            return data.get("profit")
-
-        profit = data.get("profit")
-        if profit:
-            return profit.get(f"{timeframe}M")
+            return instrument.payout()["profit"]
+        if timeframe == "1":
+            return instrument.profit_1m
+        if timeframe == "5":
+            return instrument.profit_5m
         return None
 
     async def start_remaing_time(self) -> None:
@@ -1238,7 +1915,9 @@ class Quotex(OptimizedQuotexMixin):
         if self.api is None:
             return
 
-        now_stamp = datetime.fromtimestamp(expiration.get_timestamp())
+        now_stamp = datetime.fromtimestamp(
+            expiration.get_timestamp(self.api.timesync.server_now)
+        )
         expiration_stamp = datetime.fromtimestamp(
             self.api.timesync.server_timestamp
         )
@@ -1249,27 +1928,98 @@ class Quotex(OptimizedQuotexMixin):
             await asyncio.sleep(1)
 
     async def check_win(
-            self, order_id: str | int, duration: int = 0
+            self,
+            order_id: str | int,
+            duration: int = 0,
+            timeout: float = CHECK_WIN_TIMEOUT
     ) -> tuple[str, float]:
-        """Checks if a trade operation resulted in a win based on its ID."""
-        if self.api is None:
+        """
+        Waits for the result of a trade operation.
+
+        Returns as soon as the order-close message is handled; a result
+        that arrived earlier is returned immediately.
+
+        Args:
+            order_id (str | int): Order id returned by buy().
+            duration (int): Unused; kept for compatibility.
+            timeout (float): Maximum seconds to wait. Defaults to 300.
+
+        Returns:
+            tuple[str, float]: ``(win, profit)``; ``("loss", 0.0)`` if not
+            connected, on timeout or when the connection drops.
+        """
+        if self.api is None or not await self.check_connect():
             return "loss", 0.0
 
-        start_time = time.time()
-        while await self.check_connect():
-            # Safety timeout after 5 minutes
-            if time.time() - start_time > 300:
-                break
+        data_dict = self.api.listinfodata.get(order_id)
+        if data_dict and data_dict.get("game_state") == 1:
+            self.api.listinfodata.delete(order_id)
+            return data_dict.get("win", "loss"), float(
+                data_dict.get("profit", 0)
+            )
+        try:
+            win, profit = await self.api.order_results.wait(order_id, timeout)
+        except (TimeoutError, ConnectionError) as e:
+            logger.warning("No result for order %s: %s", order_id, e)
+            return "loss", 0.0
+        self.api.listinfodata.delete(order_id)
+        return win, profit
+
+    async def watch_results(
+            self,
+            order_ids: Iterable[str | int],
+            timeout: float | None = CHECK_WIN_TIMEOUT
+    ) -> AsyncIterator[tuple[str | int, str, float]]:
+        """
+        Yields the results of many orders in completion order.
+
+        Results that already arrived are yielded first; the others as their
+        close messages are handled. All orders share one deadline.
+
+        Args:
+            order_ids (Iterable): Order ids returned by buy().
+            timeout (float, optional): Seconds to wait for the whole batch.
+                Defaults to 300.
+
+        Yields:
+            tuple: ``(order_id, win, profit)``.
 
-            data_dict = self.api.listinfodata.get(order_id)
+        Raises:
+            TimeoutError: If some results do not arrive in time. The
+                remaining orders are no longer watched.
+            ConnectionError: If the connection drops.
+        """
+        if self.api is None or not await self.check_connect():
+            raise ConnectionError("Not connected to Quotex")
+
+        ids = {str(order_id): order_id for order_id in order_ids}
+        settled = []
+        for key in ids:
+            data_dict = self.api.listinfodata.get(key)
             if data_dict and data_dict.get("game_state") == 1:
-                self.api.listinfodata.delete(order_id)
-                win = data_dict.get("win", "loss")
-                profit = float(data_dict.get("profit", 0))
-                return win, profit
-            await asyncio.sleep(0.2)
+                settled.append((key, (
+                    data_dict.get("win", "loss"),
+                    float(data_dict.get("profit", 0))
+                )))
+        done = {key for key, _ in settled}
+        watch = self.api.order_results.watch(
+            [key for key in ids if key not in done], timeout
+        )
+        try:
+            for key, (win, profit) in settled:
+                self.api.listinfodata.delete(key)
+                yield ids[key], win, profit
+            async for key, (win, profit) in watch:
+                self.api.listinfodata.delete(key)
+                yield ids[key], win, profit
+        finally:
+            watch.close()
 
-        return "loss", 0.0
+    def get_order_result_stats(self) -> dict[str, Any]:
+        """Retrieves result waiters and the expiry-to-result latency."""
+        if self.api:
+            return self.api.get_order_result_stats()
+        return {}
 
     async def start_candles_stream(
             self, asset: str = "EURUSD", period: int = 0
@@ -1297,25 +2047,25 @@ class Quotex(OptimizedQuotexMixin):
 
         is_fast_option = False if time_mode.upper() == "TIMER" else True
         self.api.current_asset = asset
-        await self.api.settings_apply(
-            asset,
-            period,
-            is_fast_option=is_fast_option,
-            deal=deal,
-            percent_mode=percent_mode,
-            percent_deal=percent_deal
-        )
-        await asyncio.sleep(0.2)
-        start = time.time()
-        while True:
-            if self.api.settings_list:
-                investments_settings = self.api.settings_list
-                break
-            if time.time() - start > timeout:
-                raise TimeoutError("Timeout waiting for settings response.")
-            await asyncio.sleep(0.2)
-
-        return investments_settings
+        try:
+            # Resolved by the settings/list response
+            return await self.api.inflight.request(
+                "settings/list",
+                next(_request_counter),
+                lambda: self.api.settings_apply(
+                    asset,
+                    period,
+                    is_fast_option=is_fast_option,
+                    deal=deal,
+                    percent_mode=percent_mode,
+                    percent_deal=percent_deal
+                ),
+                timeout=timeout
+            )
+        except TimeoutError:
+            raise TimeoutError(
+                "Timeout waiting for settings response."
+            ) from None
 
     async def stop_candles_stream(self, asset: str) -> None:
         """Stops streaming candle data for a specified asset."""
@@ -1349,7 +2099,9 @@ class Quotex(OptimizedQuotexMixin):
         candles_dict = list(aggregate.values())[0]
         candles_dict['opening'] = candles_dict.pop('timestamp')
         candles_dict['closing'] = candles_dict['opening'] + period
-        candles_dict['remaining'] = candles_dict['closing'] - int(time.time())
+        candles_dict['remaining'] = (
+            candles_dict['closing'] - await self.get_server_time()
+        )
         return candles_dict
 
     async def start_realtime_price(
@@ -1363,15 +2115,12 @@ class Quotex(OptimizedQuotexMixin):
             raise RuntimeError("API not initialized")
 
         await self.start_candles_stream(asset, period)
-        start = time.time()
-        while True:
-            if self.api.realtime_price.get(asset):
-                return self.api.realtime_price
-            if time.time() - start > timeout:
-                raise TimeoutError(
-                    f"Timeout waiting for realtime price data for {asset}."
-                )
-            await asyncio.sleep(0.2)
+        if not self.api.realtime_price.get(asset):
+            await self._wait_first(
+                ("prices", asset), timeout,
+                f"Timeout waiting for realtime price data for {asset}."
+            )
+        return self.api.realtime_price
 
     async def start_realtime_sentiment(
             self,
@@ -1384,15 +2133,12 @@ class Quotex(OptimizedQuotexMixin):
             raise RuntimeError("API not initialized")
 
         await self.start_candles_stream(asset, period)
-        start = time.time()
-        while True:
-            if self.api.realtime_sentiment.get(asset):
-                return self.api.realtime_sentiment[asset]
-            if time.time() - start > timeout:
-                raise TimeoutError(
-                    f"Timeout waiting for realtime sentiment data for {asset}."
-                )
-            await asyncio.sleep(0.2)
+        if not self.api.realtime_sentiment.get(asset):
+            await self._wait_first(
+                ("sentiment", asset), timeout,
+                f"Timeout waiting for realtime sentiment data for {asset}."
+            )
+        return self.api.realtime_sentiment[asset]
 
     async def start_realtime_candle(
             self,
@@ -1407,18 +2153,116 @@ class Quotex(OptimizedQuotexMixin):
 
         await self.start_candles_stream(asset, period)
         data: dict[int, Any] = {}
-        start = time.time()
-        while True:
-            candle_data = self.api.realtime_candles.get(asset)
-            if candle_data:
-                if isinstance(candle_data, list) and len(candle_data) >= 4:
-                    return process_tick(candle_data, period, data)
-                return data
-            if time.time() - start > timeout:
-                raise TimeoutError(
-                    f"Timeout waiting for realtime candle data for {asset}."
-                )
-            await asyncio.sleep(0.2)
+        if not self.api.realtime_candles.get(asset):
+            await self._wait_first(
+                ("prices", asset), timeout,
+                f"Timeout waiting for realtime candle data for {asset}."
+            )
+        candle_data = self.api.realtime_candles.get(asset)
+        if isinstance(candle_data, list) and len(candle_data) >= 4:
+            return process_tick(candle_data, period, data)
+        return data
+
+    async def _wait_first(
+            self, topic: tuple[Hashable, ...], timeout: float, message: str
+    ) -> Any:
+        """Waits for the next item published on topic."""
+        # A group of its own, so that waiting never stops the upstream.
+        subscription = await self.streams.subscribe(topic, ("wait", topic))
+        try:
+            return await asyncio.wait_for(subscription.get(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(message) from None
+        finally:
+            await self.streams.unsubscribe(subscription)
+
+    async def _iterate(
+            self, subscribe: Callable[[], Awaitable[Subscription]]
+    ) -> AsyncIterator[Any]:
+        """Yields the items of a hub subscription until it is closed."""
+        subscription = await subscribe()
+        try:
+            while True:
+                try:
+                    item = await subscription.get()
+                except StreamClosed:
+                    return
+                yield item
+        finally:
+            await self.streams.unsubscribe(subscription)
+
+    def _stream(
+            self,
+            topic: tuple[Hashable, ...],
+            period: int,
+            maxsize: int,
+            partial: bool = False
+    ) -> AsyncIterator[Any]:
+        """Streams a market topic, sharing the asset's upstream feed."""
+        asset = topic[1]
+        return self._iterate(lambda: self.streams.subscribe(
+            topic,
+            asset,
+            start=lambda: self.start_candles_stream(asset, period),
+            stop=lambda: self.stop_candles_stream(asset),
+            maxsize=maxsize,
+            partial=partial
+        ))
+
+    def stream_prices(
+            self, asset: str, maxsize: int = DEFAULT_STREAM_SIZE
+    ) -> AsyncIterator[tuple[float, float]]:
+        """
+        Streams live price ticks for an asset.
+
+        The upstream subscription is shared by every stream of the asset
+        and released when the last one is closed. A consumer that falls
+        more than ``maxsize`` ticks behind loses the oldest ones.
+
+        Args:
+            asset (str): Asset symbol, e.g. "EURUSD_otc".
+            maxsize (int): Ticks buffered for this subscriber.
+
+        Returns:
+            AsyncIterator: ``(timestamp, price)`` tuples.
+        """
+        return self._stream(("prices", asset), 0, maxsize)
+
+    def stream_candles(
+            self,
+            asset: str,
+            period: int = 60,
+            maxsize: int = DEFAULT_STREAM_SIZE,
+            partial: bool = False
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Streams candles built from the live ticks of an asset.
+
+        Args:
+            asset (str): Asset symbol.
+            period (int): Candle period in seconds.
+            maxsize (int): Candles buffered for this subscriber.
+            partial (bool): Also yield the forming candle after every tick.
+
+        Returns:
+            AsyncIterator: Candle dicts with ``time``, ``open``, ``close``,
+            ``high``, ``low`` and ``ticks``; closed candles are yielded
+            when the first tick of the next period arrives.
+        """
+        return self._stream(
+            ("candles", asset, period), period, maxsize, partial
+        )
+
+    def stream_sentiment(
+            self, asset: str, maxsize: int = DEFAULT_STREAM_SIZE
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Streams trader sentiment updates for an asset.
+
+        Returns:
+            AsyncIterator: Raw sentiment payloads as sent by the server.
+        """
+        return self._stream(("sentiment", asset), 0, maxsize)
 
     async def get_realtime_candles(
             self, asset: str
@@ -1439,10 +2283,46 @@ class Quotex(OptimizedQuotexMixin):
         """Retrieves current real-time price history for an asset from
         shared state."""
         if self.api:
-            # Convert deque to list for compatibility with existing strategies
+            # Materialize dicts for compatibility with existing strategies
             return list(self.api.realtime_price.get(asset, []))
         return []
 
+    def get_realtime_ticks(self, asset: str) -> TickBuffer | None:
+        """
+        Returns the live tick buffer for an asset without copying.
+
+        Use ``buffer.segments()`` for zero-copy ``memoryview`` access to
+        the time and price columns, or ``buffer.last()`` for the latest
+        tick.
+        """
+        if self.api:
+            return self.api.realtime_price.get(asset)
+        return None
+
+    def get_tick_stats(self) -> dict[str, dict[str, int]]:
+        """Retrieves per-asset counts of ingested and dropped price ticks."""
+        if self.api:
+            return self.api.get_tick_stats()
+        return {}
+
+    def memory_report(self) -> dict[str, dict[str, Any]]:
+        """Estimates entries and bytes held by each long-lived structure."""
+        if self.api:
+            return self.api.memory_report()
+        return {}
+
+    def get_inflight_stats(self) -> dict[str, Any]:
+        """Retrieves the number of requests still awaiting a response."""
+        if self.api:
+            return self.api.get_inflight_stats()
+        return {}
+
+    def get_ingest_stats(self) -> dict[str, Any]:
+        """Retrieves ingest queue depth, shed counts and processing lag."""
+        if self.api:
+            return self.api.get_ingest_stats()
+        return {}
+
     def get_signal_data(self) -> dict[str, Any]:
         """Retrieves the list of active signals received via signals stream."""
         if self.api:
@@ -1473,33 +2353,22 @@ class Quotex(OptimizedQuotexMixin):
 
         if not (str(asset + "," + str(size)) in self.subscribe_candle):
             self.subscribe_candle.append((asset + "," + str(size)))
-        start = time.time()
         # This part assumes api has these attributes, might need check
         if not hasattr(self.api, "candle_generated_check"):
             return False
 
         self.api.candle_generated_check[str(asset)][int(size)] = {}
-        # Send the subscribe request exactly once before polling.
-        # Calling follow_candle() inside the loop would spam the server
-        # with up to 100 subscribe messages (20 s / 0.2 s) before data
-        # arrives — a ban/rate-limit risk explicitly warned about in README.
-        try:
-            await self.api.follow_candle(self.codes_asset[asset])
-        except Exception as e:
-            logger.error('**error** start_candles_stream reconnect: %s', e)
-            await self.connect()
-        while True:
-            if time.time() - start > 20:
-                logger.error(
-                    '**error** start_candles_one_stream late for 20 sec'
-                )
-                return False
-            try:
-                if self.api.candle_generated_check[str(asset)][int(size)]:
-                    return True
-            except (KeyError, TypeError):
-                pass
-            await asyncio.sleep(0.2)
+        # Subscribed exactly once, then woken by the first candle: calling
+        # follow_candle() repeatedly would spam the server with subscribe
+        # messages before data arrives — a ban/rate-limit risk explicitly
+        # warned about in README.
+        if not await self._await_candle_generated(
+                f'candle_generated_{asset}_{int(size)}',
+                lambda: self.api.follow_candle(self.codes_asset[asset])
+        ):
+            logger.error('**error** start_candles_one_stream late for 20 sec')
+            return False
+        return True
 
     async def start_candles_all_size_stream(self, asset: str) -> bool:
         """Internal helper to subscribe to all candle sizes for an asset."""
@@ -1512,31 +2381,47 @@ class Quotex(OptimizedQuotexMixin):
         self.api.candle_generated_all_size_check[str(asset)] = {}
         if not (str(asset) in self.subscribe_candle_all_size):
             self.subscribe_candle_all_size.append(str(asset))
-        start = time.time()
-        while await self.check_connect():
-            if self.api is None: break
-            if time.time() - start > 20:
-                logger.error(
-                    f'**error** fail {asset} '
-                    'start_candles_all_size_stream late for 10 sec'
-                )
-                return False
-            try:
-                if self.api.candle_generated_all_size_check[str(asset)]:
-                    return True
-            except (KeyError, TypeError):
-                pass
-            try:
-                # Assuming api has subscribe_all_size
-                if hasattr(self.api, "subscribe_all_size"):
-                    self.api.subscribe_all_size(self.codes_asset[asset])
-            except Exception as e:
-                logger.error(
-                    '**error** start_candles_all_size_stream reconnect: %s', e
-                )
-                await self.connect()
-            await asyncio.sleep(0.2)
-        return False
+        if not await self._await_candle_generated(
+                f'candle_generated_{asset}',
+                lambda: self.api.subscribe_all_size(self.codes_asset[asset])
+        ):
+            logger.error(
+                '**error** fail %s start_candles_all_size_stream late for '
+                '20 sec', asset
+            )
+            return False
+        return True
+
+    async def _await_candle_generated(
+            self,
+            key: str,
+            subscribe: Callable[[], Awaitable[None]],
+            timeout: float = 20
+    ) -> bool:
+        """
+        Sends a candle subscription and waits for the first candle.
+
+        Waits for the connection first, then on the ``candle-generated``
+        event latched under ``key``; nothing is polled.
+
+        Returns:
+            bool: False if not connected or no candle arrived in time.
+        """
+        if not await self.wait_connected(timeout):
+            return False
+        # Only a candle generated after this subscription counts
+        self.api.event_registry.clear(key)
+        try:
+            await subscribe()
+        except Exception as e:
+            logger.error('**error** candle stream reconnect: %s', e)
+            await self.connect()
+            return False
+        try:
+            await self.api.event_registry.wait(key, timeout)
+        except TimeoutError:
+            return False
+        return True
 
     async def start_mood_stream(
             self, asset: str, instrument: str = "turbo-option"
@@ -1547,20 +2432,15 @@ class Quotex(OptimizedQuotexMixin):
 
         if asset not in self.subscribe_mood:
             self.subscribe_mood.append(asset)
-        while True:
-            if self.api is None: break
-            if hasattr(self.api, "subscribe_Traders_mood"):
-                self.api.subscribe_Traders_mood(asset, instrument)
-            try:
-                if hasattr(self.api, "traders_mood"):
-                    asset_code = self.codes_asset[asset]
-                    self.api.traders_mood[asset_code] = asset_code
-                break
-            finally:
-                await asyncio.sleep(0.2)
+        await self.api.subscribe_Traders_mood(asset, instrument)
+        asset_code = self.codes_asset.get(asset)
+        if asset_code is not None:
+            self.api.traders_mood[asset_code] = asset_code
 
     async def close(self) -> bool:
         """Closes the API connection and stops all tasks."""
+        self.streams.close_all()
+        self.scheduler.cancel_all()
         if self.api:
             return await self.api.close()
         return True
@@ -2,9 +2,10 @@
 import asyncio
 import time
 import uuid
+from collections import deque
 from typing import Any, Dict, Optional, Callable
 
-from ..global_value import AuthStatus
+from pyquotex.utils.bounded import BoundedDict
 
 
 class AsyncEvent:
@@ -106,39 +107,211 @@ class EventRequest:
         return self.event.is_set()
 
 
+class _EventSlot:
+    """State of a single registry key."""
+
+    __slots__ = ("value", "is_set", "waiters", "history")
+
+    def __init__(self, history: int = 0):
+        self.value: Optional[Any] = None
+        self.is_set = False
+        self.waiters: list = []
+        self.history: Optional[deque] = (
+            deque(maxlen=history) if history else None
+        )
+
+
+def _has_waiters(slot: _EventSlot) -> bool:
+    return bool(slot.waiters)
+
+
 class EventRegistry:
-    """Registry for managing multiple events by key."""
-    
-    def __init__(self):
-        self._events: Dict[str, AsyncEvent] = {}
-        self._lock = asyncio.Lock()
-    
-    async def get_event(self, key: str, auto_reset: bool = False) -> AsyncEvent:
-        """Get or create an event by key.
+    """Registry of keyed events backed by plain futures.
 
-        Events don't auto-reset by default to support multiple concurrent waiters.
-        All pending waiters see the data when an event fires.
+    asyncio is single-threaded, so the registry needs no lock: setting a
+    key resolves every pending waiter future in one pass and lookups are a
+    dict access.
+
+    Two delivery modes are supported:
+
+    * latched (``set``/``set_event``): the value stays available, so a
+      waiter arriving after the set returns immediately until the key is
+      cleared. This is the historical behaviour.
+    * broadcast (``broadcast``): only waiters already pending are woken;
+      nothing is latched.
+
+    ``wait_event(..., consume=True)`` gives one-shot semantics: the latched
+    value is returned once and the key is cleared. With ``history > 0`` the
+    registry also keeps a ring of the most recent values per key.
+    """
+
+    def __init__(
+            self,
+            capacity: Optional[int] = None,
+            ttl: Optional[float] = None,
+            history: int = 0
+    ):
         """
-        async with self._lock:
-            if key not in self._events:
-                self._events[key] = AsyncEvent(auto_reset=auto_reset)
-            return self._events[key]
-    
+        Args:
+            capacity (int, optional): Maximum number of keys kept; least
+                recently used keys without waiters are forgotten first.
+            ttl (float, optional): Seconds a key without waiters is kept
+                after its last use.
+            history (int): Recent values kept per key (0 disables).
+        """
+        self.history = history
+        self._slots: Dict[str, _EventSlot] = (
+            BoundedDict(capacity, ttl, pinned=_has_waiters)
+            if capacity is not None or ttl is not None
+            else {}
+        )
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._slots
+
+    def _slot(self, key: str) -> _EventSlot:
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = _EventSlot(self.history)
+        return slot
+
+    def _wake(self, slot: _EventSlot, data: Any) -> int:
+        woken = 0
+        if slot.waiters:
+            waiters, slot.waiters = slot.waiters, []
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(data)
+                    woken += 1
+        if slot.history is not None:
+            slot.history.append(data)
+        return woken
+
+    def set(self, key: str, data: Optional[Any] = None) -> int:
+        """Latches data under key and wakes all pending waiters.
+
+        Returns:
+            int: Number of waiters woken.
+        """
+        slot = self._slot(key)
+        slot.value = data
+        slot.is_set = True
+        return self._wake(slot, data)
+
+    def broadcast(self, key: str, data: Optional[Any] = None) -> int:
+        """Wakes the pending waiters of key without latching data.
+
+        Returns:
+            int: Number of waiters woken.
+        """
+        slot = self._slots.get(key)
+        if slot is None:
+            if not self.history:
+                return 0
+            slot = self._slot(key)
+        return self._wake(slot, data)
+
+    def clear(self, key: str) -> None:
+        """Un-latches key; pending waiters keep waiting."""
+        slot = self._slots.get(key)
+        if slot is not None:
+            slot.is_set = False
+            slot.value = None
+
+    def discard(self, key: str) -> None:
+        """Forgets key entirely, cancelling its pending waiters."""
+        slot = self._slots.pop(key, None)
+        if slot is not None:
+            for waiter in slot.waiters:
+                waiter.cancel()
+
+    def is_set(self, key: str) -> bool:
+        """Checks if a value is latched under key."""
+        slot = self._slots.get(key)
+        return slot is not None and slot.is_set
+
+    def peek(self, key: str, default: Any = None) -> Any:
+        """Returns the latched value without waiting."""
+        slot = self._slots.get(key)
+        return slot.value if slot is not None and slot.is_set else default
+
+    def recent(self, key: str) -> list:
+        """Returns the recent values of key, oldest first."""
+        slot = self._slots.get(key)
+        if slot is None or slot.history is None:
+            return []
+        return list(slot.history)
+
+    def waiter_count(self, key: Optional[str] = None) -> int:
+        """Counts pending waiters for key, or for all keys."""
+        if key is not None:
+            slot = self._slots.get(key)
+            return len(slot.waiters) if slot is not None else 0
+        return sum(len(slot.waiters) for slot in self._slots.values())
+
+    async def wait(
+            self,
+            key: str,
+            timeout: Optional[float] = None,
+            consume: bool = False,
+            fresh: bool = False
+    ) -> Any:
+        """Waits for a value under key.
+
+        Args:
+            key (str): Event key.
+            timeout (float, optional): Seconds to wait.
+            consume (bool): Clear the latched value once returned.
+            fresh (bool): Ignore an already latched value and wait for
+                the next set or broadcast.
+
+        Raises:
+            TimeoutError: If nothing arrives in time.
+        """
+        slot = self._slot(key)
+        if slot.is_set and not fresh:
+            data = slot.value
+            if consume:
+                slot.is_set = False
+                slot.value = None
+            return data
+
+        waiter = asyncio.get_running_loop().create_future()
+        slot.waiters.append(waiter)
+        try:
+            data = await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Event wait timeout after {timeout}s")
+        finally:
+            if not waiter.done() or waiter.cancelled():
+                try:
+                    slot.waiters.remove(waiter)
+                except ValueError:
+                    pass
+        if consume and slot.is_set:
+            slot.is_set = False
+            slot.value = None
+        return data
+
     async def set_event(self, key: str, data: Optional[Any] = None):
         """Set event data by key."""
-        event = await self.get_event(key)
-        event.set(data)
-    
-    async def wait_event(self, key: str, timeout: Optional[float] = None):
+        self.set(key, data)
+
+    async def wait_event(
+            self,
+            key: str,
+            timeout: Optional[float] = None,
+            consume: bool = False
+    ):
         """Wait for event by key."""
-        event = await self.get_event(key)
-        return await event.wait(timeout=timeout)
-    
+        return await self.wait(key, timeout, consume=consume)
+
     async def clear_event(self, key: str):
         """Clear event by key."""
-        async with self._lock:
-            if key in self._events:
-                self._events[key].reset()
+        self.clear(key)
 
 
 from pyquotex.utils import json_utils
@@ -266,66 +439,3 @@ async def gather_with_limit(
         return_exceptions=return_exceptions
     )
 
-
-class EventDispatcher:
-    """O(1) event dispatcher for Quotex WebSocket messages."""
-
-    def __init__(self, api: Any):
-        self.api = api
-        # Static routing map for common events
-        self._routes: Dict[str, Callable[[Any], Any]] = {
-            "s_authorization": self._on_auth,
-            "authorization/reject": self._on_reject,
-            "instruments/list": self._on_instruments,
-            "quotes/stream": self.api._handle_candles_v2,
-            "liveBalance": self._on_balance,
-            "demoBalance": self._on_balance,
-            "signals": self._on_signals,
-            "pending": self._on_pending,
-            "id": self._on_buy_confirmed,  # Special case for buy result
-        }
-
-    async def dispatch(self, event: str, data: Any):
-        """Dispatch event to the appropriate handler."""
-        # 1. Check static routes
-        handler = self._routes.get(event)
-        if handler:
-            if asyncio.iscoroutinefunction(handler):
-                await handler(data)
-            else:
-                handler(data)
-            return
-
-        # 2. Handle dynamic fulfillment (placeholders)
-        if isinstance(data, dict) and data.get("_placeholder"):
-            # These are definitions, handled by the dispatcher's registry logic in _on_message
-            return
-
-        # 3. Fallback to generic registry for waiting calls
-        await self.api.event_registry.set_event(event, data)
-
-    def _on_auth(self, data):
-        self.api.state.auth_status = AuthStatus.AUTHENTICATED
-
-    def _on_reject(self, data):
-        self.api.state.auth_status = AuthStatus.FAILED
-
-    def _on_instruments(self, data):
-        self.api.state.started_listen_instruments = True
-
-    def _on_balance(self, data):
-        self.api.account_balance = data
-
-    def _on_signals(self, data):
-        # Basic signal mapping logic (can be expanded)
-        self.api.signal_data = data
-
-    def _on_pending(self, data):
-        self.api.pending_successful = data
-        self.api.pending_id = data.get("ticket")
-
-    async def _on_buy_confirmed(self, data):
-        if not data.get("ticket"):  # It's a real order ID
-            self.api.buy_successful = data
-            self.api.buy_id = data.get("id")
-            await self.api.event_registry.set_event("buy_confirmed", data)
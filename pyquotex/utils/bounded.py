@@ -0,0 +1,235 @@
+"""Bounded containers and memory accounting for long-running sessions.
+
+:class:`BoundedDict` is a mapping with an optional capacity (least recently
+used entries are evicted first) and an optional time-to-live measured from
+the last write. It is a drop-in replacement for the per-asset state dicts
+of :class:`~pyquotex.api.QuotexAPI` when bounded-state mode is enabled.
+"""
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Callable, Hashable, Iterator
+
+StateLimits = dict[str, tuple[int | None, float | None]]
+
+# Default (capacity, ttl seconds) per structure in bounded-state mode.
+DEFAULT_STATE_LIMITS: StateLimits = {
+    "candle_v2_data": (256, 3600.0),
+    "traders_mood": (512, 900.0),
+    "realtime_sentiment": (512, 900.0),
+    "candle_generated_check": (512, 3600.0),
+    "candle_generated_all_size_check": (512, 3600.0),
+    "listinfodata": (10_000, 86_400.0),
+    "event_registry": (4096, 3600.0),
+}
+
+# Writes between full sweeps of expired entries.
+_SWEEP_INTERVAL = 1024
+
+
+class BoundedDict(MutableMapping):
+    """Mapping with LRU capacity and write-based TTL eviction."""
+
+    def __init__(
+            self,
+            capacity: int | None = None,
+            ttl: float | None = None,
+            default_factory: Callable[[], Any] | None = None,
+            pinned: Callable[[Any], bool] | None = None
+    ) -> None:
+        """
+        Args:
+            capacity (int, optional): Maximum number of entries.
+            ttl (float, optional): Seconds an entry lives after its last
+                write.
+            default_factory (Callable, optional): Creates missing values on
+                lookup, like ``collections.defaultdict``.
+            pinned (Callable, optional): Returns True for values that must
+                not be evicted (e.g. events with pending waiters).
+        """
+        if capacity is not None and capacity <= 0:
+            raise ValueError("Capacity must be positive.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("TTL must be positive.")
+        self.capacity = capacity
+        self.ttl = ttl
+        self.default_factory = default_factory
+        self.pinned = pinned
+        self.evicted = 0
+        self.expired = 0
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._written: dict[Hashable, float] = {}
+        self._writes = 0
+
+    def _is_expired(self, key: Hashable, now: float) -> bool:
+        return (
+                self.ttl is not None
+                and now - self._written[key] > self.ttl
+                and not (self.pinned and self.pinned(self._data[key]))
+        )
+
+    def _drop(self, key: Hashable) -> None:
+        del self._data[key]
+        self._written.pop(key, None)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        try:
+            value = self._data[key]
+        except KeyError:
+            if self.default_factory is None:
+                raise
+            value = self[key] = self.default_factory()
+            return value
+        if self.ttl is not None and self._is_expired(key, time.monotonic()):
+            self._drop(key)
+            self.expired += 1
+            if self.default_factory is None:
+                raise KeyError(key)
+            value = self[key] = self.default_factory()
+            return value
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        data = self._data
+        data[key] = value
+        data.move_to_end(key)
+        if self.ttl is not None:
+            self._written[key] = time.monotonic()
+            self._writes += 1
+            if self._writes >= _SWEEP_INTERVAL:
+                self.sweep()
+        if self.capacity is not None and len(data) > self.capacity:
+            self._evict()
+
+    def _evict(self) -> None:
+        data = self._data
+        overflow = len(data) - self.capacity
+        newest = next(reversed(data))
+        victims = []
+        for key in data:
+            if len(victims) >= overflow:
+                break
+            # The newest entry is never the victim, even if the rest is
+            # pinned.
+            if key == newest or (self.pinned and self.pinned(data[key])):
+                continue
+            victims.append(key)
+        for key in victims:
+            self._drop(key)
+        self.evicted += len(victims)
+
+    def __delitem__(self, key: Hashable) -> None:
+        self._drop(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key not in self._data:
+            return False
+        if self.ttl is not None and self._is_expired(key, time.monotonic()):
+            self._drop(key)
+            self.expired += 1
+            return False
+        return True
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        # Unlike __getitem__, never creates a missing entry.
+        return self[key] if key in self else default
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return (
+            f"BoundedDict(size={len(self._data)}, capacity={self.capacity}, "
+            f"ttl={self.ttl})"
+        )
+
+    def sweep(self) -> int:
+        """
+        Removes every expired entry.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        self._writes = 0
+        if self.ttl is None:
+            return 0
+        now = time.monotonic()
+        expired = [key for key in self._data if self._is_expired(key, now)]
+        for key in expired:
+            self._drop(key)
+        self.expired += len(expired)
+        return len(expired)
+
+
+def estimate_size(obj: Any, _seen: set[int] | None = None) -> int:
+    """
+    Estimates the memory held by obj and everything it references.
+
+    Follows containers, instance dicts and ``__slots__``; shared objects
+    are counted once. The result is an approximation suitable for
+    comparing structures, not an exact accounting.
+
+    Returns:
+        int: Estimated size in bytes.
+    """
+    seen = _seen if _seen is not None else set()
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item, 0)
+        if (
+                isinstance(item, (str, bytes, bytearray, int, float, bool))
+                or callable(item)
+        ):
+            # Scalars hold no references; callables would lead back into
+            # the owning objects.
+            continue
+        if isinstance(item, BoundedDict):
+            stack.append(item._data)
+            stack.append(item._written)
+        elif isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, "__dict__") and not isinstance(item, type):
+            stack.append(vars(item))
+        for cls in type(item).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                value = getattr(item, name, None)
+                if value is not None:
+                    stack.append(value)
+    return total
+
+
+def describe(obj: Any) -> dict[str, Any]:
+    """
+    Summarizes a state structure for a memory report.
+
+    Returns:
+        dict: ``entries``, estimated ``bytes`` and, for bounded
+        structures, ``capacity``, ``ttl``, ``evicted`` and ``expired``.
+    """
+    if isinstance(obj, BoundedDict):
+        obj.sweep()
+    report: dict[str, Any] = {
+        "entries": len(obj),
+        "bytes": estimate_size(obj),
+    }
+    if isinstance(obj, BoundedDict):
+        report.update(
+            capacity=obj.capacity,
+            ttl=obj.ttl,
+            evicted=obj.evicted,
+            expired=obj.expired,
+        )
+    return report
@@ -0,0 +1,145 @@
+"""SQLite store of historical candles and of the time ranges they cover.
+
+Candles are keyed by ``(asset, period, time)``. Coverage records which
+ranges of candle open times were fetched completely, including ranges in
+which the market had no candles at all (weekends), so that a history
+request only has to download what the store does not cover yet.
+"""
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable
+
+from pyquotex.utils.intervals import Interval, IntervalSet
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS candles (
+    asset TEXT NOT NULL,
+    period INTEGER NOT NULL,
+    time INTEGER NOT NULL,
+    open REAL NOT NULL,
+    close REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    PRIMARY KEY (asset, period, time)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS coverage (
+    asset TEXT NOT NULL,
+    period INTEGER NOT NULL,
+    start INTEGER NOT NULL,
+    end INTEGER NOT NULL,
+    PRIMARY KEY (asset, period, start)
+) WITHOUT ROWID;
+"""
+
+CANDLE_FIELDS = ("time", "open", "close", "high", "low")
+
+
+class CandleStore:
+    """Persistent candles plus per-(asset, period) coverage intervals."""
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        """
+        Args:
+            path (str | Path): SQLite database file; ``":memory:"`` keeps
+                the store in memory.
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.executescript(_SCHEMA)
+        self._coverage: dict[tuple[str, int], IntervalSet] = {}
+
+    def close(self) -> None:
+        """Closes the database."""
+        self._db.close()
+
+    def coverage(self, asset: str, period: int) -> IntervalSet:
+        """Returns the covered ranges of candle open times (cached)."""
+        key = (asset, period)
+        intervals = self._coverage.get(key)
+        if intervals is None:
+            intervals = IntervalSet(self._db.execute(
+                "SELECT start, end FROM coverage "
+                "WHERE asset = ? AND period = ? ORDER BY start",
+                key
+            ))
+            self._coverage[key] = intervals
+        return intervals
+
+    def missing(
+            self, asset: str, period: int, start: int, end: int
+    ) -> list[Interval]:
+        """Returns the parts of ``[start, end)`` not covered yet."""
+        return self.coverage(asset, period).missing(start, end)
+
+    def add(
+            self,
+            asset: str,
+            period: int,
+            candles: Iterable[dict[str, Any]],
+            covered: Iterable[Interval] = ()
+    ) -> int:
+        """
+        Stores candles and marks ranges as covered, in one transaction.
+
+        Existing candles with the same time are replaced.
+
+        Args:
+            asset (str): Asset symbol.
+            period (int): Candle period in seconds.
+            candles (Iterable[dict]): Candles with ``time``, ``open``,
+                ``close``, ``high`` and ``low``.
+            covered (Iterable[tuple]): ``[start, end)`` ranges of open
+                times that were fetched completely.
+
+        Returns:
+            int: Number of candles written.
+        """
+        rows = [
+            (asset, period, int(c["time"]), c["open"], c["close"],
+             c["high"], c["low"])
+            for c in candles
+        ]
+        # Built on a copy: the cache only changes once the commit succeeds
+        intervals = IntervalSet(self.coverage(asset, period))
+        covered = list(covered)
+        for start, end in covered:
+            intervals.add(start, end)
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO candles VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            if covered:
+                self._db.execute(
+                    "DELETE FROM coverage WHERE asset = ? AND period = ?",
+                    (asset, period)
+                )
+                self._db.executemany(
+                    "INSERT INTO coverage VALUES (?, ?, ?, ?)",
+                    [(asset, period, s, e) for s, e in intervals]
+                )
+        if covered:
+            self._coverage[(asset, period)] = intervals
+        return len(rows)
+
+    def load(
+            self, asset: str, period: int, start: int, end: int
+    ) -> list[dict[str, Any]]:
+        """Returns the stored candles with ``start <= time < end``, in
+        time order."""
+        cursor = self._db.execute(
+            "SELECT time, open, close, high, low FROM candles "
+            "WHERE asset = ? AND period = ? AND time >= ? AND time < ? "
+            "ORDER BY time",
+            (asset, period, start, end)
+        )
+        return [dict(zip(CANDLE_FIELDS, row)) for row in cursor]
+
+    def count(self, asset: str, period: int) -> int:
+        """Returns the number of stored candles of ``(asset, period)``."""
+        return self._db.execute(
+            "SELECT COUNT(*) FROM candles WHERE asset = ? AND period = ?",
+            (asset, period)
+        ).fetchone()[0]
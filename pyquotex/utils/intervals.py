@@ -0,0 +1,93 @@
+"""Sets of half-open integer intervals ``[start, end)``."""
+import bisect
+from typing import Iterable, Iterator
+
+Interval = tuple[int, int]
+
+
+class IntervalSet:
+    """Disjoint, sorted intervals; adjacent or overlapping ones merge."""
+
+    __slots__ = ("_starts", "_ends")
+
+    def __init__(self, intervals: Iterable[Interval] = ()) -> None:
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        for start, end in intervals:
+            self.add(start, end)
+
+    def __iter__(self) -> Iterator[Interval]:
+        return zip(self._starts, self._ends)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __bool__(self) -> bool:
+        return bool(self._starts)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, IntervalSet):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+    def add(self, start: int, end: int) -> None:
+        """Adds ``[start, end)``, merging with touching intervals."""
+        if end <= start:
+            return
+        starts, ends = self._starts, self._ends
+        # First interval whose end reaches start, last whose start <= end.
+        lo = bisect.bisect_left(ends, start)
+        hi = bisect.bisect_right(starts, end)
+        if lo < hi:
+            start = min(start, starts[lo])
+            end = max(end, ends[hi - 1])
+        starts[lo:hi] = [start]
+        ends[lo:hi] = [end]
+
+    def remove(self, start: int, end: int) -> None:
+        """Removes ``[start, end)``, splitting intervals as needed."""
+        if end <= start:
+            return
+        starts, ends = self._starts, self._ends
+        lo = bisect.bisect_right(ends, start)
+        hi = bisect.bisect_left(starts, end)
+        if lo >= hi:
+            return
+        kept: list[Interval] = []
+        if starts[lo] < start:
+            kept.append((starts[lo], start))
+        if ends[hi - 1] > end:
+            kept.append((end, ends[hi - 1]))
+        starts[lo:hi] = [s for s, _ in kept]
+        ends[lo:hi] = [e for _, e in kept]
+
+    def contains(self, start: int, end: int) -> bool:
+        """Whether ``[start, end)`` is entirely covered."""
+        index = bisect.bisect_right(self._starts, start) - 1
+        return index >= 0 and self._ends[index] >= end
+
+    def missing(self, start: int, end: int) -> list[Interval]:
+        """Returns the parts of ``[start, end)`` not covered, in order."""
+        gaps: list[Interval] = []
+        cursor = start
+        index = max(0, bisect.bisect_right(self._ends, start))
+        starts, ends = self._starts, self._ends
+        while cursor < end and index < len(starts):
+            if starts[index] >= end:
+                break
+            if starts[index] > cursor:
+                gaps.append((cursor, starts[index]))
+            cursor = max(cursor, ends[index])
+            index += 1
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def covered(self, start: int, end: int) -> int:
+        """Returns how much of ``[start, end)`` is covered."""
+        if end <= start:
+            return 0
+        return (end - start) - sum(b - a for a, b in self.missing(start, end))
@@ -28,6 +28,21 @@ def loads(data):
     return json.loads(data)
 
 
+def loads_from(data, offset=0):
+    """
+    Parses JSON starting at offset of a bytes-like buffer.
+
+    With orjson the buffer is handed over as a memoryview slice, so no
+    intermediate copy is made. The standard library cannot parse a
+    memoryview, so the fallback copies the tail into bytes.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(memoryview(data)[offset:] if offset else data)
+    if offset or isinstance(data, memoryview):
+        data = bytes(memoryview(data)[offset:])
+    return json.loads(data)
+
+
 def dumps(obj, indent=None) -> bytes:
     """Serializes an object to JSON bytes."""
     if HAS_ORJSON:
@@ -0,0 +1,96 @@
+"""Fixed-bucket latency histogram.
+
+Recording is O(log buckets) with constant memory, so it can stay enabled
+on hot paths for the whole session.
+"""
+import bisect
+import math
+from typing import Any, Iterable
+
+# Upper bounds (milliseconds) of the default buckets; the last bucket is
+# open-ended.
+DEFAULT_BOUNDS_MS = (
+    1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000,
+)
+
+
+class LatencyHistogram:
+    """Counts latencies into buckets and keeps count, sum, min and max."""
+
+    __slots__ = ("bounds", "counts", "count", "total", "min", "max")
+
+    def __init__(self, bounds_ms: Iterable[float] = DEFAULT_BOUNDS_MS) -> None:
+        self.bounds = tuple(sorted(bounds_ms))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def record(self, seconds: float) -> None:
+        """Adds one latency, in seconds."""
+        ms = seconds * 1000
+        self.counts[bisect.bisect_left(self.bounds, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms < self.min:
+            self.min = ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, q: float) -> float | None:
+        """
+        Estimates the q-th percentile (0-100) in milliseconds.
+
+        Returns the upper bound of the bucket holding the percentile,
+        clamped to the observed maximum; None if nothing was recorded.
+        """
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                if index < len(self.bounds):
+                    return min(self.bounds[index], self.max)
+                return self.max
+        return self.max
+
+    def reset(self) -> None:
+        """Discards every recorded latency."""
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Returns a summary of the histogram.
+
+        Returns:
+            dict: ``count``, ``mean_ms``, ``min_ms``, ``max_ms``,
+            ``p50_ms``, ``p90_ms``, ``p99_ms`` and ``buckets``
+            (``{"<=bound": count, ">last": count}``, empty buckets
+            omitted).
+        """
+        if not self.count:
+            return {"count": 0, "buckets": {}}
+        buckets = {
+            f"<={bound:g}": count
+            for bound, count in zip(self.bounds, self.counts)
+            if count
+        }
+        if self.counts[-1]:
+            buckets[f">{self.bounds[-1]:g}"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count,
+            "min_ms": self.min,
+            "max_ms": self.max,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "buckets": buckets,
+        }
@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Any
 
@@ -149,12 +150,12 @@ def process_candles(history: list[Any], period: int) -> list[dict[str, Any]]:
 
 
 def process_candles_v2(
-        history: dict[str, Any],
+        history: Mapping[str, Any],
         asset: str,
         data: list[dict[str, Any]] | None
 ) -> list[dict[str, Any]]:
     """Process and merge historical + realtime candles with deduplication."""
-    if not history or not isinstance(history, dict):
+    if not history or not isinstance(history, Mapping):
         return data if data else []
 
     candles_data = history.get(asset, {})
@@ -0,0 +1,235 @@
+"""Plans the ``history/load`` requests that cover a range of candle times.
+
+The range is tracked as an :class:`IntervalSet` of covered open times plus
+the parts claimed by requests in flight, waiting for a retry or given up.
+Idle workers take the newest free part, sized to the number of candles
+the server returns per response. A response covers everything from its
+oldest candle to the end of its window; when it stops short of the start,
+the rest goes back to the pool for the next idle worker. Sizing is
+learned: a response is known to be cut by the server's limit when the
+request for the rest returns the candle right below it. Until then the
+request size doubles while responses fill their windows completely.
+"""
+import heapq
+import logging
+import time
+from typing import Any, Callable, Iterable, NamedTuple
+
+from pyquotex.utils.intervals import Interval, IntervalSet
+
+logger = logging.getLogger(__name__)
+
+# Candles per request until the server's limit is known.
+DEFAULT_CHUNK_CANDLES = 200
+# Ceiling for the guessed request size while no response was cut short.
+MAX_CHUNK_CANDLES = 2000
+# Attempts per range before it is given up.
+MAX_ATTEMPTS = 4
+# Delay before the first retry of a failed range, doubled per attempt.
+RETRY_BACKOFF = 0.5
+
+
+class RangeTask(NamedTuple):
+    """A ``[start, end)`` range of open times to request."""
+    start: int
+    end: int
+    attempt: int = 0
+
+    @property
+    def fetch_time(self) -> int:
+        """The ``time`` of the request: the newest open time included."""
+        return self.end - 1
+
+    @property
+    def offset(self) -> int:
+        """The ``offset`` of the request: the window length."""
+        return self.end - self.start
+
+
+class RangePlanner:
+    """Hands out, tracks and retries the requests of one history range."""
+
+    def __init__(
+            self,
+            start: int,
+            end: int,
+            period: int,
+            covered: Iterable[Interval] = (),
+            chunk_candles: int = DEFAULT_CHUNK_CANDLES,
+            capacity: int | None = None,
+            max_attempts: int = MAX_ATTEMPTS,
+            backoff: float = RETRY_BACKOFF,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Args:
+            start (int): Oldest open time of the range.
+            end (int): End of the range (exclusive).
+            period (int): Candle period in seconds.
+            covered (Iterable[tuple]): Ranges known already, e.g. from a
+                candle store.
+            chunk_candles (int): Initial guess of candles per response.
+            capacity (int, optional): Candles per response learned by an
+                earlier plan.
+            max_attempts (int): Attempts per range before giving up.
+            backoff (float): Delay before the first retry, in seconds.
+            clock (Callable): Monotonic clock for the retry delays.
+        """
+        self.start = start
+        self.end = end
+        self.period = period
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self._clock = clock
+        self.covered = IntervalSet()
+        for s, e in covered:
+            self.covered.add(max(s, start), min(e, end))
+        # Learned limit of candles per response; None until observed.
+        self.capacity = capacity
+        self._guess = chunk_candles
+        # In flight, waiting for a retry or given up.
+        self._claimed = IntervalSet()
+        # Heap of (due, start, end, attempt) for failed ranges.
+        self._retries: list[tuple[float, int, int, int]] = []
+        # Candle counts of responses cut short, by their oldest time.
+        self._short: dict[int, int] = {}
+        self.failed = IntervalSet()
+        self.in_flight = 0
+        self.requests = 0
+        self.retried = 0
+
+    @property
+    def chunk_candles(self) -> int:
+        """Candles asked for per request."""
+        return self.capacity or self._guess
+
+    @property
+    def finished(self) -> bool:
+        """Whether nothing is in flight, waiting or left to request."""
+        return (
+            self.in_flight == 0
+            and not self._retries
+            and self._free() is None
+        )
+
+    def completeness(self) -> float:
+        """Returns the covered share of the range, in percent."""
+        if self.end <= self.start:
+            return 100.0
+        covered = self.covered.covered(self.start, self.end)
+        return round(covered * 100 / (self.end - self.start), 2)
+
+    def retry_delay(self) -> float | None:
+        """Returns the seconds until the next retry is due, if any."""
+        if not self._retries:
+            return None
+        return max(0.0, self._retries[0][0] - self._clock())
+
+    def next_task(self) -> RangeTask | None:
+        """
+        Claims the next range to request.
+
+        Due retries come first, then the newest free range.
+
+        Returns:
+            RangeTask | None: The claimed range, or None when nothing can
+            be requested right now (see :attr:`finished` and
+            :meth:`retry_delay`).
+        """
+        if self._retries and self._retries[0][0] <= self._clock():
+            _, start, end, attempt = heapq.heappop(self._retries)
+            return self._issue(RangeTask(start, end, attempt))
+        free = self._free()
+        if free is None:
+            return None
+        start, end = free
+        start = max(start, end - self.chunk_candles * self.period)
+        self._claimed.add(start, end)
+        return self._issue(RangeTask(start, end))
+
+    def complete(self, task: RangeTask, times: Iterable[int]) -> None:
+        """
+        Records the response to a task.
+
+        Args:
+            task (RangeTask): The task answered.
+            times (Iterable[int]): Open times of all candles returned.
+        """
+        self.in_flight -= 1
+        self._claimed.remove(task.start, task.end)
+        times = list(times)
+        in_window = [t for t in times if task.start <= t < task.end]
+
+        # The candle right below a short response exists, so that
+        # response was cut by the server's limit.
+        if in_window and max(in_window) + self.period in self._short:
+            count = self._short.pop(max(in_window) + self.period)
+            self.capacity = max(self.capacity or 0, count)
+        if self.capacity is not None and len(in_window) > self.capacity:
+            self.capacity = len(in_window)
+
+        # Candles newer than the window say nothing about it
+        oldest = min((t for t in times if t < task.end), default=task.start)
+        if oldest > self._first_slot(task.start):
+            # The rest of the window goes back to the pool
+            self.covered.add(oldest, task.end)
+            self._short[oldest] = len(in_window)
+            self._settle(task.start, oldest)
+            return
+
+        self.covered.add(task.start, task.end)
+        slots = -(-(task.end - self._first_slot(task.start)) // self.period)
+        if (self.capacity is None and in_window
+                and len(in_window) >= slots == self._guess):
+            self._guess = min(self._guess * 2, MAX_CHUNK_CANDLES)
+
+    def fail(self, task: RangeTask) -> None:
+        """Schedules a failed task for a retry, or gives it up."""
+        self.in_flight -= 1
+        attempt = task.attempt + 1
+        if attempt >= self.max_attempts:
+            # Stays claimed, so it is not handed out again
+            self.failed.add(task.start, task.end)
+            logger.warning(
+                "Giving up history range [%d, %d) after %d attempts",
+                task.start, task.end, attempt
+            )
+            return
+        self.retried += 1
+        due = self._clock() + self.backoff * 2 ** task.attempt
+        heapq.heappush(self._retries, (due, task.start, task.end, attempt))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Returns the progress and request counters of the plan."""
+        return {
+            "completeness": self.completeness(),
+            "requests": self.requests,
+            "retries": self.retried,
+            "failed": list(self.failed),
+            "chunk_candles": self.chunk_candles,
+            "capacity": self.capacity,
+        }
+
+    def _issue(self, task: RangeTask) -> RangeTask:
+        self.in_flight += 1
+        self.requests += 1
+        return task
+
+    def _first_slot(self, start: int) -> int:
+        """Returns the first candle open time at or after ``start``."""
+        return -(-start // self.period) * self.period
+
+    def _settle(self, start: int, end: int) -> None:
+        """Covers ``[start, end)`` at once when it holds no open time."""
+        if self._first_slot(start) >= end:
+            self.covered.add(start, end)
+
+    def _free(self) -> Interval | None:
+        """Returns the newest range neither covered nor claimed."""
+        for gap_start, gap_end in reversed(
+                self.covered.missing(self.start, self.end)
+        ):
+            free = self._claimed.missing(gap_start, gap_end)
+            if free:
+                return free[-1]
+        return None
@@ -0,0 +1,185 @@
+"""Local estimate of the broker's clock.
+
+Every tick carries the server time at which it was produced, so
+``server_ts - local_receive_time`` is the clock offset minus the network
+delay of that tick. The delay is never negative, so the largest samples
+are the least delayed ones: :class:`ServerClock` keeps the per-window
+maximum (a min-filter on delay), fits the drift across windows, and adds
+half of the smallest measured round-trip time for the remaining one-way
+delay. Reading the clock is a monotonic counter read plus arithmetic.
+"""
+import time
+from collections import deque
+from typing import Any, Callable
+
+DEFAULT_WINDOW = 10.0
+DEFAULT_WINDOWS = 30
+# Clamp for the fitted drift (seconds per second): 100 ppm.
+MAX_DRIFT = 1e-4
+# Samples this far from the estimate are outliers; enough consecutive
+# outliers mean the server clock stepped and the estimate restarts.
+OUTLIER_THRESHOLD = 5.0
+OUTLIERS_BEFORE_RESET = 3
+
+
+class ServerClock:
+    """Offset and drift estimator fed by server timestamps and RTTs."""
+
+    def __init__(
+            self,
+            window: float = DEFAULT_WINDOW,
+            windows: int = DEFAULT_WINDOWS,
+            monotonic: Callable[[], float] = time.perf_counter,
+            wall: Callable[[], float] = time.time
+    ) -> None:
+        """
+        Args:
+            window (float): Seconds per min-filter window.
+            windows (int): Windows kept for the drift fit.
+            monotonic (Callable): High-resolution monotonic clock.
+            wall (Callable): Wall clock, read once to anchor the monotonic
+                one, so later system clock steps do not affect the
+                estimate.
+        """
+        self.window = window
+        self._monotonic = monotonic
+        self._anchor = wall() - monotonic()
+        # (time of the best sample, best sample) per window
+        self._windows: deque[tuple[float, float]] = deque(maxlen=windows)
+        self._window_start = 0.0
+        self._rtts: deque[float] = deque(maxlen=64)
+        # Half of the smallest RTT, updated with _rtts
+        self._half_rtt = 0.0
+        # Upper envelope of the window samples at _ref, before the RTT
+        # correction; _base adds _half_rtt to it
+        self._envelope = 0.0
+        self._base = 0.0
+        self._drift = 0.0
+        self._ref = 0.0
+        self._outliers = 0
+        self.samples = 0
+        self.resets = 0
+
+    def local_now(self) -> float:
+        """Local wall time derived from the monotonic clock."""
+        return self._anchor + self._monotonic()
+
+    @property
+    def synced(self) -> bool:
+        """Whether at least one server timestamp was observed."""
+        return bool(self._windows)
+
+    @property
+    def drift(self) -> float:
+        """Estimated drift of the server clock, in seconds per second."""
+        return self._drift
+
+    @property
+    def rtt(self) -> float | None:
+        """Smallest recent round-trip time, in seconds."""
+        return min(self._rtts) if self._rtts else None
+
+    @property
+    def offset(self) -> float:
+        """Current estimate of ``server time - local time``, in seconds."""
+        return self._offset_at(self.local_now())
+
+    def _offset_at(self, local: float) -> float:
+        return self._base + self._drift * (local - self._ref)
+
+    def server_now(self) -> float:
+        """
+        Returns the estimated server time without any I/O.
+
+        Falls back to the local wall clock until a server timestamp has
+        been observed.
+        """
+        local = self.local_now()
+        return local + self._offset_at(local)
+
+    def observe(
+            self, server_ts: float, received_at: float | None = None
+    ) -> None:
+        """
+        Adds a server timestamp.
+
+        Args:
+            server_ts (float): Server UNIX time carried by a message.
+            received_at (float, optional): Local time (``local_now()``)
+                at which the message arrived; defaults to now.
+        """
+        # Runs for every tick: no helper calls on the common path
+        local = (
+            received_at if received_at is not None
+            else self._anchor + self._monotonic()
+        )
+        sample = float(server_ts) - local
+        windows = self._windows
+        if windows:
+            # Compare against the raw envelope, before the RTT correction.
+            error = sample - (
+                self._envelope + self._drift * (local - self._ref)
+            )
+            if abs(error) > OUTLIER_THRESHOLD:
+                self._outliers += 1
+                if self._outliers < OUTLIERS_BEFORE_RESET:
+                    return
+                windows.clear()
+                self.resets += 1
+            self._outliers = 0
+        self.samples += 1
+        if not windows or local - self._window_start >= self.window:
+            # The previous window closed: refit the drift
+            self._window_start = local
+            windows.append((local, sample))
+            self._fit()
+        elif sample > windows[-1][1]:
+            # A new window maximum only lifts the envelope along the
+            # current slope; the drift waits for the window to close
+            windows[-1] = (local, sample)
+            envelope = sample - self._drift * (local - self._ref)
+            if envelope > self._envelope:
+                self._envelope = envelope
+                self._base = envelope + self._half_rtt
+
+    def observe_rtt(self, rtt: float) -> None:
+        """Adds a measured request/response round-trip time, in seconds."""
+        if rtt >= 0:
+            self._rtts.append(rtt)
+            self._half_rtt = min(self._rtts) / 2
+            if self._windows:
+                self._base = self._envelope + self._half_rtt
+
+    def _fit(self) -> None:
+        windows = self._windows
+        ref = windows[-1][0]
+        drift = 0.0
+        # Only closed windows hold their final maximum
+        closed = list(windows)[:-1]
+        if len(closed) >= 4:
+            n = len(closed)
+            mean_t = sum(t for t, _ in closed) / n
+            mean_y = sum(y for _, y in closed) / n
+            var = sum((t - mean_t) ** 2 for t, _ in closed)
+            if var > 0:
+                cov = sum((t - mean_t) * (y - mean_y) for t, y in closed)
+                drift = max(-MAX_DRIFT, min(MAX_DRIFT, cov / var))
+        # Upper envelope of the samples along the fitted slope.
+        base = max(y - drift * (t - ref) for t, y in windows)
+        self._drift = drift
+        self._ref = ref
+        self._envelope = base
+        self._base = base + self._half_rtt
+
+    def as_dict(self) -> dict[str, Any]:
+        """Returns the current estimate and sample counts."""
+        rtt = self.rtt
+        return {
+            "synced": self.synced,
+            "offset_ms": self.offset * 1000,
+            "drift_ppm": self._drift * 1e6,
+            "rtt_ms": rtt * 1000 if rtt is not None else None,
+            "windows": len(self._windows),
+            "samples": self.samples,
+            "resets": self.resets,
+        }
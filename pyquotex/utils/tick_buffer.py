@@ -0,0 +1,141 @@
+"""Fixed-capacity, array-backed tick storage.
+
+Each asset gets a circular buffer with two ``array('d')`` columns (time and
+price). Appends are O(1) and allocation-free once the buffer is created;
+reads can be zero-copy through :meth:`TickBuffer.segments`, while iteration
+and indexing still yield ``{"time", "price"}`` dicts for compatibility with
+the previous list-of-dicts storage.
+"""
+from array import array
+from typing import Any, Iterator
+
+DEFAULT_TICK_CAPACITY = 1000
+
+
+class TickBuffer:
+    """Circular buffer of ``(time, price)`` ticks for a single asset."""
+
+    __slots__ = ("capacity", "_times", "_prices", "_head", "_size")
+
+    def __init__(self, capacity: int = DEFAULT_TICK_CAPACITY) -> None:
+        """
+        Args:
+            capacity (int): Maximum number of ticks kept; older ticks are
+                overwritten once the buffer is full.
+        """
+        if capacity <= 0:
+            raise ValueError("Tick buffer capacity must be positive.")
+        self.capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._prices = array("d", bytes(8 * capacity))
+        self._head = 0  # Next write position
+        self._size = 0
+
+    def append(self, timestamp: float, price: float) -> None:
+        """Appends a tick, overwriting the oldest one when full."""
+        head = self._head
+        self._times[head] = timestamp
+        self._prices[head] = price
+        head += 1
+        self._head = 0 if head == self.capacity else head
+        if self._size < self.capacity:
+            self._size += 1
+
+    def clear(self) -> None:
+        """Drops all ticks without releasing the storage."""
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _start(self) -> int:
+        """Physical index of the oldest tick."""
+        start = self._head - self._size
+        return start + self.capacity if start < 0 else start
+
+    def _physical(self, index: int) -> int:
+        size = self._size
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("tick index out of range")
+        pos = self._start() + index
+        return pos - self.capacity if pos >= self.capacity else pos
+
+    def segments(self) -> list[tuple[memoryview, memoryview]]:
+        """
+        Returns zero-copy views over the stored ticks in time order.
+
+        The ring is stored in at most two contiguous runs, so this returns
+        up to two ``(times, prices)`` pairs of ``memoryview`` slices. The
+        views alias the live buffer and are overwritten by later appends.
+
+        Returns:
+            list: ``[(times_view, prices_view), ...]`` oldest run first.
+        """
+        if not self._size:
+            return []
+        start = self._start()
+        end = start + self._size
+        times = memoryview(self._times)
+        prices = memoryview(self._prices)
+        if end <= self.capacity:
+            return [(times[start:end], prices[start:end])]
+        wrap = end - self.capacity
+        return [
+            (times[start:], prices[start:]),
+            (times[:wrap], prices[:wrap]),
+        ]
+
+    def times(self) -> array:
+        """Returns an ordered copy of the tick timestamps."""
+        out = array("d")
+        for times, _ in self.segments():
+            out.frombytes(times.tobytes())
+        return out
+
+    def prices(self) -> array:
+        """Returns an ordered copy of the tick prices."""
+        out = array("d")
+        for _, prices in self.segments():
+            out.frombytes(prices.tobytes())
+        return out
+
+    def last(self) -> tuple[float, float] | None:
+        """Returns the most recent ``(time, price)`` tick, if any."""
+        if not self._size:
+            return None
+        pos = self._head - 1
+        if pos < 0:
+            pos += self.capacity
+        return self._times[pos], self._prices[pos]
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [
+                self[i] for i in range(*index.indices(self._size))
+            ]
+        pos = self._physical(index)
+        return {"time": self._times[pos], "price": self._prices[pos]}
+
+    def __iter__(self) -> Iterator[dict[str, float]]:
+        for times, prices in self.segments():
+            for ts, price in zip(times, prices):
+                yield {"time": ts, "price": price}
+
+    def __repr__(self) -> str:
+        return f"TickBuffer(size={self._size}, capacity={self.capacity})"
+
+
+class TickStore(dict):
+    """Mapping of asset to :class:`TickBuffer`, created on first access."""
+
+    def __init__(self, capacity: int = DEFAULT_TICK_CAPACITY) -> None:
+        super().__init__()
+        self.capacity = capacity
+
+    def __missing__(self, asset: str) -> TickBuffer:
+        buffer = TickBuffer(self.capacity)
+        self[asset] = buffer
+        return buffer
@@ -0,0 +1,188 @@
+"""Hierarchical timer wheel for large numbers of coarse deadlines.
+
+Scheduling and cancelling a timer are O(1): a timer is stored in the slot
+of the coarsest wheel level that covers its distance and cascades down one
+level at a time as the clock approaches its deadline. A single loop
+callback per tick drives every timer, and it is only armed while timers
+are pending.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESOLUTION = 0.1
+DEFAULT_SLOTS = 64
+DEFAULT_LEVELS = 4
+
+
+class Timer:
+    """Handle of a scheduled callback."""
+
+    __slots__ = ("tick", "callback", "args", "bucket")
+
+    def __init__(
+            self, tick: int, callback: Callable[..., Any], args: tuple
+    ) -> None:
+        self.tick = tick
+        self.callback = callback
+        self.args = args
+        self.bucket: set | None = None
+
+    @property
+    def active(self) -> bool:
+        return self.bucket is not None
+
+
+class TimerWheel:
+    """Hashed hierarchical timing wheel driven by the running event loop."""
+
+    def __init__(
+            self,
+            resolution: float = DEFAULT_RESOLUTION,
+            slots: int = DEFAULT_SLOTS,
+            levels: int = DEFAULT_LEVELS,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Args:
+            resolution (float): Seconds per tick of the finest level.
+            slots (int): Slots per level.
+            levels (int): Number of levels. Deadlines beyond
+                ``resolution * slots ** levels`` are parked in the last
+                level and re-cascaded until they are in range.
+            clock (Callable): Monotonic clock in seconds.
+        """
+        if resolution <= 0 or slots < 2 or levels < 1:
+            raise ValueError("Invalid timer wheel geometry.")
+        self.resolution = resolution
+        self.slots = slots
+        self.levels = levels
+        self.clock = clock
+        self._wheels: list[list[set[Timer]]] = [
+            [set() for _ in range(slots)] for _ in range(levels)
+        ]
+        self._spans = [slots ** level for level in range(levels + 1)]
+        self._origin = clock()
+        self._tick = 0
+        self._count = 0
+        self._handle: asyncio.TimerHandle | None = None
+        self.fired = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _now_tick(self) -> int:
+        return int((self.clock() - self._origin) / self.resolution)
+
+    def _place(self, timer: Timer) -> None:
+        distance = timer.tick - self._tick
+        slots = self.slots
+        for level in range(self.levels):
+            if distance < self._spans[level + 1] or level == self.levels - 1:
+                index = (timer.tick // self._spans[level]) % slots
+                if level == self.levels - 1 and distance >= self._spans[-1]:
+                    # Out of range: park one full turn ahead and re-place
+                    # when the slot cascades.
+                    index = (self._tick // self._spans[level] - 1) % slots
+                bucket = self._wheels[level][index]
+                bucket.add(timer)
+                timer.bucket = bucket
+                return
+
+    def call_later(
+            self, delay: float, callback: Callable[..., Any], *args: Any
+    ) -> Timer:
+        """
+        Schedules callback(*args) after delay seconds.
+
+        The callback runs on the first tick at or after the deadline, so it
+        may be late by up to one ``resolution``; it is never early.
+
+        Returns:
+            Timer: Handle accepted by :meth:`cancel`.
+        """
+        self._catch_up()
+        # First tick whose start is at or after the absolute deadline;
+        # the current tick may be partly elapsed already.
+        elapsed = self.clock() - self._origin + max(delay, 0.0)
+        tick = max(self._tick + 1, int(-(-elapsed // self.resolution)))
+        timer = Timer(tick, callback, args)
+        self._place(timer)
+        self._count += 1
+        self._arm()
+        return timer
+
+    def cancel(self, timer: Timer) -> bool:
+        """Cancels a pending timer; returns False if it already ran."""
+        bucket = timer.bucket
+        if bucket is None:
+            return False
+        bucket.discard(timer)
+        timer.bucket = None
+        self._count -= 1
+        if not self._count and self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        return True
+
+    def _arm(self) -> None:
+        if self._handle is not None or not self._count:
+            return
+        loop = asyncio.get_running_loop()
+        when = self._origin + (self._tick + 1) * self.resolution
+        # Convert from our clock to the loop's clock.
+        delay = max(0.0, when - self.clock())
+        self._handle = loop.call_at(loop.time() + delay, self._on_tick)
+
+    def _on_tick(self) -> None:
+        self._handle = None
+        self._catch_up()
+        self._arm()
+
+    def _catch_up(self) -> None:
+        target = self._now_tick()
+        if not self._count:
+            self._tick = max(self._tick, target)
+            return
+        while self._tick < target and self._count:
+            self._tick += 1
+            self._advance(self._tick)
+        if self._tick < target:
+            self._tick = target
+
+    def _advance(self, tick: int) -> None:
+        slots = self.slots
+        # Cascade coarse levels first so their timers land in finer slots
+        # before those are processed.
+        for level in range(self.levels - 1, 0, -1):
+            span = self._spans[level]
+            if tick % span:
+                continue
+            bucket = self._wheels[level][(tick // span) % slots]
+            if bucket:
+                timers = list(bucket)
+                bucket.clear()
+                for timer in timers:
+                    timer.bucket = None
+                    if timer.tick <= tick:
+                        self._fire(timer)
+                    else:
+                        self._place(timer)
+        bucket = self._wheels[0][tick % slots]
+        if bucket:
+            due = [timer for timer in bucket if timer.tick <= tick]
+            for timer in due:
+                bucket.discard(timer)
+                timer.bucket = None
+                self._fire(timer)
+
+    def _fire(self, timer: Timer) -> None:
+        self._count -= 1
+        self.fired += 1
+        try:
+            timer.callback(*timer.args)
+        except Exception:
+            logger.exception("Timer callback failed")
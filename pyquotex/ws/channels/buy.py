@@ -1,5 +1,4 @@
 import logging
-import time
 
 from pyquotex.utils import json_utils as json
 from pyquotex.ws.channels.base import Base
@@ -13,41 +12,45 @@ class Buy(Base):
 
     name = "buy"
 
-    async def __call__(
+    def build(
             self,
             price: float | int,
             asset: str,
             direction: str,
             duration: int,
             request_id: int,
-            is_fast_option: bool
-    ) -> None:
+            is_fast_option: bool,
+            server_time: float | None = None
+    ) -> str:
+        """Builds the ``orders/open`` frame.
+
+        The expiration is computed from the locally tracked server time,
+        so building a frame needs no network round-trip.
+
+        :param server_time: Server time at which the frame will be sent,
+            for frames built ahead of time; defaults to now.
+        :returns: The raw Socket.IO frame.
+        """
+        if server_time is None:
+            server_time = self.api.timesync.server_now()
         option_type = 3 if is_fast_option else 1
 
-        expiration_time = get_expiration_time_quotex(
-            int(time.time()),
+        expiration = get_expiration_time_quotex(
+            int(server_time),
             duration
         )
-        expiration = expiration_time
 
         if asset.endswith("_otc") and not is_fast_option:
             option_type = 100
             expiration = duration
 
         if option_type == 1 and duration < 60:
-            print(
-                f"{duration}s duration is not allowed for this type of "
-                "operation, except for OTC assets. 60 seconds will be added "
-                "to meet Quotex requirements."
+            logger.warning(
+                "%ss duration is not allowed for this type of operation, "
+                "except for OTC assets. 60 seconds will be added to meet "
+                "Quotex requirements.", duration
             )
 
-        await self.api.settings_apply(
-            asset,
-            expiration,
-            is_fast_option=is_fast_option,
-            end_time=expiration_time,
-        )
-
         payload = {
             "asset": asset,
             "amount": price,
@@ -58,10 +61,21 @@ class Buy(Base):
             "requestId": request_id,
             "optionType": option_type
         }
+        return f'42["orders/open",{json.dumps_str(payload)}]'
 
-        data = f'42["tick"]'
-        await self.send_websocket_request(data)
-
-        data = f'42["orders/open",{json.dumps_str(payload)}]'
+    async def __call__(
+            self,
+            price: float | int,
+            asset: str,
+            direction: str,
+            duration: int,
+            request_id: int,
+            is_fast_option: bool
+    ) -> None:
+        # Subscription and settings are sent once per asset by
+        # Quotex.prepare_order(), so only orders/open is on this path.
+        data = self.build(
+            price, asset, direction, duration, request_id, is_fast_option
+        )
         logger.debug(data)
         await self.send_websocket_request(data)
@@ -8,22 +8,24 @@ class SellOption(Base):
 
     name = "sell_option"
 
+    @staticmethod
+    def build(ticket: int | str) -> str:
+        """Builds the ``orders/cancel`` frame of one ticket.
+
+        :returns: The raw Socket.IO frame.
+        """
+        payload = {
+            "ticket": ticket
+        }
+        return f'42["orders/cancel",{json.dumps_str(payload)}]'
+
     async def __call__(self, options_ids: list[int | str] | int | str) -> None:
         """
         :param options_ids: list or int/str
         """
         if not isinstance(options_ids, list):
-            payload = {
-                "ticket": options_ids
-            }
-            await self.send_websocket_request(
-                f'42["orders/cancel",{json.dumps_str(payload)}]'
-            )
-        else:
-            for ids in options_ids:
-                payload = {
-                    "ticket": ids
-                }
-                await self.send_websocket_request(
-                    f'42["orders/cancel",{json.dumps_str(payload)}]'
-                )
+            options_ids = [options_ids]
+        # Pipelined: every frame is written under one socket lock.
+        await self.api.send_websocket_requests(
+            [self.build(ticket) for ticket in options_ids]
+        )
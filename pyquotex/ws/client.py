@@ -76,8 +76,18 @@ class WebsocketClient:
             ) as ws:
                 self._ws = ws
                 await self.api._on_open()
-                async for raw in ws:
-                    await self.api._on_message(raw)
+                # Handlers run on the ingest dispatcher so that slow ones
+                # never hold up the socket read.
+                self.api.ingest.start()
+                try:
+                    while True:
+                        # Keep text frames as bytes so the parser can hand
+                        # the JSON body to the decoder without a str
+                        # round-trip.
+                        raw = await ws.recv(decode=False)
+                        await self.api._enqueue_message(raw)
+                finally:
+                    await self.api.ingest.stop()
         except ConnectionClosed as e:
             # Use newer rcvd/sent attributes to avoid deprecation warnings in websockets 13.1+
             rcvd = getattr(e, 'rcvd', None)
@@ -0,0 +1,233 @@
+"""Bulk download of historical candles for many (asset, period) jobs.
+
+All jobs share one connection: at most ``max_jobs`` of them stream at a
+time through :meth:`Quotex.iter_historical_candles`, and their requests
+go through the connection's history throttle, so concurrency and the
+requests-per-second ceiling are global. Every window is committed to the
+candle store, together with the range it covers, before the next one is
+taken, so the store is the checkpoint: running the same jobs again after
+a crash only downloads what was not committed yet.
+"""
+import asyncio
+import logging
+import sqlite3
+import time
+from collections import deque
+from typing import Any, Callable, Iterable
+
+from pyquotex.utils.candle_store import CandleStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_JOBS = 4
+# Windows each job downloads ahead of the one being written.
+DEFAULT_PREFETCH = 2
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class HistoryJob:
+    """One ``(asset, period, [start, end))`` download and its progress."""
+
+    __slots__ = (
+        "asset", "period", "start", "end", "status", "candles",
+        "last_time", "completeness", "error", "started_at", "finished_at",
+    )
+
+    def __init__(
+            self,
+            asset: str,
+            period: int,
+            start: float,
+            end: float | None = None
+    ) -> None:
+        """
+        Args:
+            asset (str): Asset symbol.
+            period (int): Candle period in seconds.
+            start (float): Oldest candle time wanted (unix seconds).
+            end (float | None): End of the range (exclusive); None for now.
+        """
+        self.asset = asset
+        self.period = period
+        self.start = int(start)
+        self.end = None if end is None else int(end)
+        self.status = PENDING
+        # Candles of the range done so far (downloaded or already
+        # stored) and the newest of them
+        self.candles = 0
+        self.last_time: int | None = None
+        # Share of the range covered by the store, once finished
+        self.completeness: float | None = None
+        self.error: str | None = None
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+
+    @property
+    def progress(self) -> float:
+        """Share of the range written so far, in percent."""
+        if self.status == DONE:
+            return 100.0
+        if self.last_time is None or self.started_at is None:
+            return 0.0
+        end = self.end if self.end is not None else time.time()
+        if end <= self.start:
+            return 100.0
+        done = (self.last_time + self.period - self.start)
+        return round(min(100.0, done * 100 / (end - self.start)), 2)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds the job has been running."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Candles of the range done per second."""
+        elapsed = self.elapsed
+        return round(self.candles / elapsed, 1) if elapsed else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "asset": self.asset,
+            "period": self.period,
+            "start": self.start,
+            "end": self.end,
+            "status": self.status,
+            "candles": self.candles,
+            "progress": self.progress,
+            "completeness": self.completeness,
+            "throughput": self.throughput,
+            "elapsed": round(self.elapsed, 2),
+            "error": self.error,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"HistoryJob({self.asset!r}, {self.period}, {self.start}, "
+            f"{self.end}, status={self.status!r}, candles={self.candles})"
+        )
+
+
+class BulkHistoryDownloader:
+    """Runs history jobs over one connection into a candle store."""
+
+    def __init__(
+            self,
+            client: Any,
+            store: CandleStore,
+            max_jobs: int = DEFAULT_MAX_JOBS,
+            prefetch: int = DEFAULT_PREFETCH,
+            timeout: int = 30
+    ) -> None:
+        """
+        Args:
+            client (Quotex): Connected client.
+            store (CandleStore): Store written to; also the checkpoint
+                resumed from.
+            max_jobs (int): Jobs streaming at the same time.
+            prefetch (int): Windows each job downloads ahead.
+            timeout (int): Timeout per request in seconds.
+        """
+        self.client = client
+        self.store = store
+        self.max_jobs = max_jobs
+        self.prefetch = prefetch
+        self.timeout = timeout
+        # Assets whose candle stream was started by this downloader
+        self._subscribed: set[str] = set()
+
+    async def run(
+            self,
+            jobs: Iterable[HistoryJob | tuple],
+            progress_callback: Callable[[HistoryJob], None] | None = None
+    ) -> list[HistoryJob]:
+        """
+        Runs the jobs, ``max_jobs`` at a time, until all are finished.
+
+        A failing job is marked ``failed`` and does not stop the others.
+
+        Args:
+            jobs (Iterable): HistoryJob objects or
+                ``(asset, period, start[, end])`` tuples.
+            progress_callback (Callable, optional): Called with the job
+                after every window written and when the job finishes.
+
+        Returns:
+            list[HistoryJob]: The jobs, in the given order.
+        """
+        jobs = [
+            job if isinstance(job, HistoryJob) else HistoryJob(*job)
+            for job in jobs
+        ]
+        queue = deque(jobs)
+
+        async def runner() -> None:
+            while queue:
+                await self._run_job(queue.popleft(), progress_callback)
+
+        runners = [
+            asyncio.create_task(runner())
+            for _ in range(max(1, self.max_jobs))
+        ]
+        try:
+            await asyncio.gather(*runners)
+        finally:
+            # An error that is not a job failure stops every job
+            for task in runners:
+                task.cancel()
+            await asyncio.gather(*runners, return_exceptions=True)
+        return jobs
+
+    async def _run_job(
+            self,
+            job: HistoryJob,
+            progress_callback: Callable[[HistoryJob], None] | None
+    ) -> None:
+        client = self.client
+        job.status = RUNNING
+        job.started_at = time.monotonic()
+        try:
+            # One candle stream per asset, whatever its timeframes
+            if job.asset not in self._subscribed:
+                self._subscribed.add(job.asset)
+                await client.start_candles_stream(job.asset, job.period)
+            async for batch in client.iter_historical_candles(
+                    job.asset, job.start, job.end, job.period,
+                    timeout=self.timeout, prefetch=self.prefetch,
+                    store=self.store, subscribe=False
+            ):
+                job.candles += len(batch)
+                job.last_time = batch[-1]["time"]
+                if progress_callback:
+                    progress_callback(job)
+        except (ConnectionError, RuntimeError, OSError, sqlite3.Error) as e:
+            job.status = FAILED
+            job.error = str(e)
+            logger.error(
+                "History job %s (%ds) failed: %s", job.asset, job.period, e
+            )
+        else:
+            job.status = DONE
+        job.finished_at = time.monotonic()
+        job.completeness = self._completeness(job)
+        if progress_callback:
+            progress_callback(job)
+
+    def _completeness(self, job: HistoryJob) -> float:
+        """Returns the share of the job's complete candles in the store."""
+        now = int(time.time())
+        first_open = -(-job.start // job.period) * job.period
+        end = now if job.end is None else min(job.end, now)
+        end = end // job.period * job.period
+        if end <= first_open:
+            return 100.0
+        covered = self.store.coverage(job.asset, job.period).covered(
+            first_open, end
+        )
+        return round(covered * 100 / (end - first_open), 2)
@@ -0,0 +1,295 @@
+"""In-flight request table for request/response WebSocket calls.
+
+Each request is registered under a correlation key (``index`` for
+``history/load``, ``requestId`` for ``orders/open``, ...) together with a
+future; the router handler that receives the matching response resolves
+that future directly. Entries are removed as soon as the future completes,
+times out or is cancelled, so the table never outgrows the number of
+requests actually waiting.
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class InflightStats:
+    """Lifetime counters of the in-flight table."""
+
+    __slots__ = (
+        "registered", "resolved", "failed", "timed_out", "cancelled",
+        "unmatched",
+    )
+
+    def __init__(self) -> None:
+        self.registered = 0
+        self.resolved = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.cancelled = 0
+        self.unmatched = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class InflightTable:
+    """Futures of pending requests, grouped by kind and correlation key."""
+
+    def __init__(self) -> None:
+        self._tables: dict[str, dict[Hashable, asyncio.Future]] = {}
+        self._owners: dict[asyncio.Future, tuple[str, Hashable]] = {}
+        self._tags: dict[asyncio.Future, Hashable] = {}
+        self.stats = InflightStats()
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self._tables.values())
+
+    def __contains__(self, item: tuple[str, Hashable]) -> bool:
+        kind, key = item
+        return self._key(key) in self._tables.get(kind, ())
+
+    @staticmethod
+    def _key(key: Hashable) -> Hashable:
+        # Servers may echo numeric ids as strings (and vice versa).
+        return str(key)
+
+    def size(self, kind: str | None = None) -> int:
+        """Returns the number of pending requests, optionally per kind."""
+        if kind is not None:
+            return len(self._tables.get(kind, ()))
+        return len(self)
+
+    def sizes(self) -> dict[str, int]:
+        """Returns the number of pending requests per kind."""
+        return {
+            kind: len(table) for kind, table in self._tables.items() if table
+        }
+
+    def register(
+            self, kind: str, key: Hashable, tag: Hashable = None
+    ) -> asyncio.Future:
+        """
+        Registers a pending request.
+
+        Args:
+            kind (str): Request kind, usually the outgoing event name.
+            key (Hashable): Correlation key echoed in the response.
+            tag (Hashable, optional): Secondary attribute (e.g. the asset)
+                used by :meth:`resolve_oldest` for responses without key.
+
+        Returns:
+            asyncio.Future: Resolved with the response data.
+
+        Raises:
+            ValueError: If a request with the same key is already pending.
+        """
+        table = self._tables.setdefault(kind, {})
+        key = self._key(key)
+        if key in table:
+            raise ValueError(f"Request {kind}:{key} is already in flight.")
+        future = asyncio.get_running_loop().create_future()
+        table[key] = future
+        self._owners[future] = (kind, key)
+        if tag is not None:
+            self._tags[future] = tag
+        # Covers futures cancelled by their waiter or by cancel_all().
+        future.add_done_callback(self._forget)
+        self.stats.registered += 1
+        return future
+
+    def _forget(self, future: asyncio.Future) -> None:
+        owner = self._owners.pop(future, None)
+        if owner is None:
+            return
+        self._tags.pop(future, None)
+        if future.cancelled():
+            # Waiter cancelled; explicit paths forget before completing.
+            self.stats.cancelled += 1
+        kind, key = owner
+        table = self._tables.get(kind)
+        if table is not None and table.get(key) is future:
+            del table[key]
+
+    def resolve(self, kind: str, key: Hashable, data: Any) -> bool:
+        """
+        Resolves the request matching kind and key.
+
+        Returns:
+            bool: True if a pending request was resolved.
+        """
+        if key is None:
+            return False
+        future = self._tables.get(kind, {}).get(self._key(key))
+        if future is None or future.done():
+            self.stats.unmatched += 1
+            return False
+        self._forget(future)
+        future.set_result(data)
+        self.stats.resolved += 1
+        return True
+
+    def resolve_oldest(
+            self,
+            kind: str,
+            data: Any,
+            match: Callable[[Hashable], bool] | None = None,
+            tag: Hashable = None
+    ) -> bool:
+        """
+        Resolves the oldest pending request of kind.
+
+        Used for responses that do not echo their correlation key.
+
+        Args:
+            kind (str): Request kind.
+            data (Any): Response data.
+            match (Callable, optional): Restricts the candidates by key.
+            tag (Hashable, optional): Restricts the candidates to requests
+                registered with this tag, giving FIFO order per tag.
+
+        Returns:
+            bool: True if a pending request was resolved.
+        """
+        tags = self._tags
+        for key, future in self._tables.get(kind, {}).items():
+            if (
+                    not future.done()
+                    and (match is None or match(key))
+                    and (tag is None or tags.get(future) == tag)
+            ):
+                self._forget(future)
+                future.set_result(data)
+                self.stats.resolved += 1
+                return True
+        self.stats.unmatched += 1
+        return False
+
+    def fail(self, kind: str, key: Hashable, error: BaseException) -> bool:
+        """Fails the request matching kind and key with error."""
+        future = self._tables.get(kind, {}).get(self._key(key))
+        if future is None or future.done():
+            return False
+        self._forget(future)
+        future.set_exception(error)
+        self.stats.failed += 1
+        return True
+
+    def fail_all(
+            self, error: BaseException, kind: str | None = None
+    ) -> int:
+        """
+        Fails pending requests (e.g. when the connection drops).
+
+        Returns:
+            int: Number of requests failed.
+        """
+        kinds = [kind] if kind is not None else list(self._tables)
+        failed = 0
+        for name in kinds:
+            for future in list(self._tables.get(name, {}).values()):
+                self._forget(future)
+                if not future.done():
+                    future.set_exception(error)
+                    failed += 1
+        self.stats.failed += failed
+        return failed
+
+    def cancel(self, future: asyncio.Future) -> bool:
+        """
+        Cancels one pending request and removes it from the table now,
+        rather than from its done callback.
+
+        Returns:
+            bool: True if the request was still pending.
+        """
+        if not future.cancel():
+            return False
+        self._forget(future)
+        return True
+
+    def cancel_all(self, kind: str | None = None) -> int:
+        """
+        Cancels pending requests.
+
+        Returns:
+            int: Number of requests cancelled.
+        """
+        kinds = [kind] if kind is not None else list(self._tables)
+        cancelled = 0
+        for name in kinds:
+            for future in list(self._tables.get(name, {}).values()):
+                if future.cancel():
+                    self._forget(future)
+                    cancelled += 1
+        return cancelled
+
+    def _expire(self, future: asyncio.Future, timeout: float) -> None:
+        if future.done():
+            return
+        self._forget(future)
+        future.set_exception(
+            TimeoutError(f"Request timed out after {timeout}s")
+        )
+        self.stats.timed_out += 1
+
+    async def wait(
+            self, future: asyncio.Future, timeout: float | None = None
+    ) -> Any:
+        """
+        Waits for a registered request.
+
+        Raises:
+            TimeoutError: If the response does not arrive in time. The
+                entry is removed either way.
+        """
+        if timeout is None:
+            return await future
+        handle = asyncio.get_running_loop().call_later(
+            timeout, self._expire, future, timeout
+        )
+        try:
+            return await future
+        finally:
+            handle.cancel()
+
+    async def request(
+            self,
+            kind: str,
+            key: Hashable,
+            send: Callable[[], Awaitable[Any]],
+            timeout: float | None = None,
+            tag: Hashable = None
+    ) -> Any:
+        """
+        Registers a request, sends it and waits for the matching response.
+
+        Args:
+            kind (str): Request kind.
+            key (Hashable): Correlation key echoed in the response.
+            send (Callable): Coroutine function that sends the request.
+            timeout (float, optional): Seconds to wait for the response.
+            tag (Hashable, optional): See :meth:`register`.
+
+        Returns:
+            Any: The response data.
+
+        Raises:
+            TimeoutError: If the response does not arrive in time.
+        """
+        future = self.register(kind, key, tag)
+        try:
+            await send()
+        except BaseException:
+            future.cancel()
+            self._forget(future)
+            raise
+        return await self.wait(future, timeout)
+
+    def metrics(self) -> dict[str, Any]:
+        """Returns the current table size and lifetime counters."""
+        metrics: dict[str, Any] = self.stats.as_dict()
+        metrics["in_flight"] = len(self)
+        metrics["by_kind"] = self.sizes()
+        return metrics
@@ -0,0 +1,337 @@
+"""Bounded, prioritized ingest queue between the socket and the router.
+
+The receive loop only parses and enqueues frames; a separate dispatcher task
+drains the queue and runs the handlers. Order, balance and authorization
+events go through a priority lane that is always drained first, everything
+else through the market lane. Streaming market data (ticks, generated
+candles, sentiment) may be shed under load following the configured
+policy, while responses such as ``history/load`` are never dropped: when a
+lane is full of them the receive loop waits for room instead.
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+DROP_OLDEST = "drop_oldest"
+CONFLATE = "conflate"
+MARKET_POLICIES = (DROP_OLDEST, CONFLATE)
+
+DEFAULT_INGEST_CAPACITY = 1024
+
+PRIORITY_EVENTS = frozenset({
+    "s_authorization",
+    "authorization/reject",
+    "balance",
+    "deals",
+    "demo/refill",
+    "order",
+})
+PRIORITY_PREFIXES = ("orders/", "pending/")
+STREAM_EVENTS = frozenset({
+    "quotes/stream",
+    "candle-generated",
+    "sentiment",
+})
+
+# Items dispatched back to back before yielding to the receive loop.
+_DISPATCH_BATCH = 64
+
+Dispatch = Callable[[str | None, Any, bool], Awaitable[Any]]
+
+
+def is_priority(event: str | None) -> bool:
+    """Returns True for order, balance and authorization events."""
+    return event is not None and (
+        event in PRIORITY_EVENTS or event.startswith(PRIORITY_PREFIXES)
+    )
+
+
+def conflation_key(event: str | None, data: Any) -> tuple | None:
+    """
+    Returns the key under which a streaming update supersedes older ones.
+
+    Only updates that concern a single asset are conflated; anything else
+    returns None and is subject to drop-oldest only.
+    """
+    if event == "quotes/stream":
+        if (
+                isinstance(data, list) and len(data) == 1
+                and isinstance(data[0], list) and data[0]
+        ):
+            return event, data[0][0]
+        return None
+    if isinstance(data, dict) and data.get("asset"):
+        return event, data["asset"], data.get("period")
+    return None
+
+
+class IngestItem:
+    """A routed event waiting in the ingest queue."""
+
+    __slots__ = ("event", "data", "fallback", "enqueued", "key")
+
+    def __init__(
+            self,
+            event: str | None,
+            data: Any,
+            fallback: bool,
+            key: tuple | None = None
+    ) -> None:
+        self.event = event
+        self.data = data
+        self.fallback = fallback
+        self.enqueued = time.monotonic()
+        self.key = key
+
+    @property
+    def droppable(self) -> bool:
+        return self.event in STREAM_EVENTS
+
+
+class IngestStats:
+    """Queue depth, shedding and processing lag counters."""
+
+    __slots__ = (
+        "enqueued", "processed", "dropped", "conflated", "max_depth",
+        "last_lag", "max_lag", "_lag_total",
+    )
+
+    def __init__(self) -> None:
+        self.enqueued = 0
+        self.processed = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.max_depth = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self._lag_total = 0.0
+
+    def record_lag(self, lag: float) -> None:
+        self.processed += 1
+        self.last_lag = lag
+        self._lag_total += lag
+        if lag > self.max_lag:
+            self.max_lag = lag
+
+    @property
+    def avg_lag(self) -> float:
+        return self._lag_total / self.processed if self.processed else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "enqueued": self.enqueued,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "conflated": self.conflated,
+            "max_depth": self.max_depth,
+            "last_lag_ms": self.last_lag * 1000,
+            "avg_lag_ms": self.avg_lag * 1000,
+            "max_lag_ms": self.max_lag * 1000,
+        }
+
+
+class IngestQueue:
+    """Two-lane bounded queue feeding a single dispatcher task."""
+
+    def __init__(
+            self,
+            dispatch: Dispatch,
+            capacity: int = DEFAULT_INGEST_CAPACITY,
+            market_policy: str = DROP_OLDEST
+    ) -> None:
+        """
+        Args:
+            dispatch (Callable): Coroutine called as
+                ``dispatch(event, data, fallback)`` for every item.
+            capacity (int): Maximum items per lane.
+            market_policy (str): ``"drop_oldest"`` sheds the oldest
+                streaming update when the market lane is full;
+                ``"conflate"`` additionally replaces a queued update for
+                the same asset with the newer one.
+        """
+        if capacity <= 0:
+            raise ValueError("Ingest queue capacity must be positive.")
+        if market_policy not in MARKET_POLICIES:
+            raise ValueError(
+                f"Unknown market policy {market_policy!r}; "
+                f"expected one of {MARKET_POLICIES}."
+            )
+        self._dispatch = dispatch
+        self.capacity = capacity
+        self.market_policy = market_policy
+        self._priority: deque[IngestItem] = deque()
+        self._market: deque[IngestItem] = deque()
+        self._latest: dict[tuple, IngestItem] = {}
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._task: asyncio.Task | None = None
+        self._closing = False
+        self.stats = IngestStats()
+
+    def __len__(self) -> int:
+        return len(self._priority) + len(self._market)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def depth(self) -> dict[str, int]:
+        """Returns the current number of queued items per lane."""
+        return {"priority": len(self._priority), "market": len(self._market)}
+
+    def metrics(self) -> dict[str, Any]:
+        """Returns queue depth and lag metrics."""
+        metrics = self.stats.as_dict()
+        metrics.update(self.depth())
+        metrics["capacity"] = self.capacity
+        metrics["market_policy"] = self.market_policy
+        return metrics
+
+    async def put(
+            self, event: str | None, data: Any, fallback: bool = True
+    ) -> None:
+        """
+        Enqueues an event for dispatch.
+
+        Streaming market data never blocks: it is shed or conflated when
+        the market lane is full. Other events wait for room.
+        """
+        item = IngestItem(event, data, fallback)
+        if is_priority(event):
+            lane = self._priority
+        else:
+            lane = self._market
+            if item.droppable and self._offer_stream(item):
+                return
+        while len(lane) >= self.capacity:
+            self._space.clear()
+            await self._space.wait()
+        self._append(lane, item)
+
+    def _offer_stream(self, item: IngestItem) -> bool:
+        """
+        Applies the market policy to a streaming update.
+
+        Returns:
+            bool: True if the update was absorbed (conflated or dropped).
+        """
+        if self.market_policy == CONFLATE:
+            item.key = conflation_key(item.event, item.data)
+            queued = self._latest.get(item.key) if item.key else None
+            if queued is not None:
+                queued.data = item.data
+                self.stats.conflated += 1
+                return True
+        lane = self._market
+        if len(lane) < self.capacity:
+            return False
+        if not self._drop_oldest_stream():
+            # Lane is full of responses; shed the new update instead.
+            self.stats.dropped += 1
+            return True
+        self._append(lane, item)
+        return True
+
+    def _drop_oldest_stream(self) -> bool:
+        lane = self._market
+        for index, queued in enumerate(lane):
+            if queued.droppable:
+                del lane[index]
+                self._forget(queued)
+                self.stats.dropped += 1
+                return True
+        return False
+
+    def _append(self, lane: deque[IngestItem], item: IngestItem) -> None:
+        lane.append(item)
+        if item.key is not None:
+            self._latest[item.key] = item
+        self.stats.enqueued += 1
+        depth = len(self)
+        if depth > self.stats.max_depth:
+            self.stats.max_depth = depth
+        self._ready.set()
+
+    def _forget(self, item: IngestItem) -> None:
+        if item.key is not None and self._latest.get(item.key) is item:
+            del self._latest[item.key]
+
+    def _pop(self) -> IngestItem | None:
+        if self._priority:
+            lane = self._priority
+        elif self._market:
+            lane = self._market
+        else:
+            return None
+        item = lane.popleft()
+        self._forget(item)
+        self._space.set()
+        return item
+
+    async def run(self, drain: bool = False) -> None:
+        """
+        Dispatches queued items, priority lane first.
+
+        Args:
+            drain (bool): Return once the queue is empty instead of
+                waiting for more items.
+        """
+        batch = 0
+        while True:
+            item = self._pop()
+            if item is None:
+                if drain or self._closing:
+                    return
+                self._ready.clear()
+                await self._ready.wait()
+                batch = 0
+                continue
+            self.stats.record_lag(time.monotonic() - item.enqueued)
+            try:
+                await self._dispatch(item.event, item.data, item.fallback)
+            except Exception as e:
+                logger.error("Error dispatching %s: %s", item.event, e)
+            batch += 1
+            if batch >= _DISPATCH_BATCH:
+                batch = 0
+                await asyncio.sleep(0)
+
+    def start(self) -> None:
+        """Starts the dispatcher task if it is not already running."""
+        if not self.running:
+            self._closing = False
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self, timeout: float = 1.0) -> None:
+        """
+        Stops the dispatcher once what is already queued has been handled.
+
+        Args:
+            timeout (float): Seconds allowed for the flush before the
+                dispatcher is cancelled.
+        """
+        task, self._task = self._task, None
+        if task is None:
+            return
+        self._closing = True
+        self._ready.set()
+        try:
+            done, _ = await asyncio.wait({task}, timeout=timeout)
+            if not done:
+                logger.warning(
+                    "Ingest queue flush timed out with %d items left",
+                    len(self)
+                )
+                task.cancel()
+                await asyncio.wait({task})
+        except asyncio.CancelledError:
+            # stop() itself was cancelled: take the dispatcher down too
+            task.cancel()
+            raise
+        if not task.cancelled():
+            task.result()
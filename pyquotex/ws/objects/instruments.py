@@ -0,0 +1,234 @@
+"""Indexed catalog of the rows pushed by ``instruments/list``.
+
+Each row is decoded once into an :class:`Instrument`; unchanged rows of
+later pushes are recognised by list equality and not decoded again. The
+catalog keeps lookups by symbol and numeric id and the open/OTC partition
+up to date, and reports what changed on every update.
+"""
+from typing import Any, Iterable, NamedTuple
+
+from pyquotex.ws.objects.base import Base
+
+# Column positions of an instruments/list row.
+ID = 0
+SYMBOL = 1
+NAME = 2
+TYPE = 3
+PAYMENT = 5
+OPEN = 14
+TURBO_PAYMENT = 18
+PROFIT_24H = -10
+PROFIT_1M = -9
+PROFIT_5M = -8
+
+# Fields whose changes are reported by InstrumentCatalog.update().
+WATCHED_FIELDS = (
+    "open", "payment", "turbo_payment", "profit_24h", "profit_1m",
+    "profit_5m",
+)
+
+
+def _column(row: list[Any], index: int) -> Any:
+    try:
+        return row[index]
+    except IndexError:
+        return None
+
+
+class Instrument:
+    """One decoded instruments/list row."""
+
+    __slots__ = (
+        "id", "symbol", "name", "type", "payment", "open", "turbo_payment",
+        "profit_24h", "profit_1m", "profit_5m", "is_otc", "raw",
+    )
+
+    def __init__(self, row: list[Any]) -> None:
+        """
+        :param row: The raw instruments/list row.
+        """
+        self.id = row[ID]
+        self.symbol: str = row[SYMBOL]
+        self.name = str(_column(row, NAME) or "").replace("\n", "")
+        self.type = _column(row, TYPE)
+        self.payment = _column(row, PAYMENT)
+        self.open = bool(_column(row, OPEN))
+        self.turbo_payment = _column(row, TURBO_PAYMENT)
+        short = len(row) < -PROFIT_24H
+        self.profit_24h = None if short else row[PROFIT_24H]
+        self.profit_1m = None if short else row[PROFIT_1M]
+        self.profit_5m = None if short else row[PROFIT_5M]
+        self.is_otc = self.symbol.endswith("_otc")
+        self.raw = row
+
+    def payout(self) -> dict[str, Any]:
+        """Returns the payout fields in the ``get_payment()`` layout.
+
+        :returns: ``turbo_payment``, ``payment``, ``profit`` and ``open``.
+        """
+        return {
+            "turbo_payment": self.turbo_payment,
+            "payment": self.payment,
+            "profit": {
+                "24H": self.profit_24h,
+                "1M": self.profit_1m,
+                "5M": self.profit_5m,
+            },
+            "open": self.open,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"Instrument(symbol={self.symbol!r}, id={self.id}, "
+            f"open={self.open}, payment={self.payment})"
+        )
+
+
+class InstrumentChange(NamedTuple):
+    """A change reported by :meth:`InstrumentCatalog.update`.
+
+    ``field`` is one of :data:`WATCHED_FIELDS`, ``"added"`` or
+    ``"removed"``; ``old``/``new`` are the field values (the instrument
+    itself for additions and removals).
+    """
+    symbol: str
+    field: str
+    old: Any
+    new: Any
+
+
+class InstrumentCatalog(Base):
+    """Instruments indexed by symbol and id, partitioned by open/OTC."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__name = "instruments"
+        self._by_symbol: dict[str, Instrument] = {}
+        self._by_id: dict[Any, Instrument] = {}
+        # (is_open, is_otc) -> symbols
+        self._partition: dict[tuple[bool, bool], set[str]] = {
+            (is_open, is_otc): set()
+            for is_open in (False, True) for is_otc in (False, True)
+        }
+        self._payments: dict[str, Any] | None = None
+        self.updates = 0
+        self.decoded = 0
+
+    def __len__(self) -> int:
+        return len(self._by_symbol)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._by_symbol
+
+    def __iter__(self):
+        return iter(self._by_symbol.values())
+
+    def get(self, symbol: str) -> Instrument | None:
+        """Looks an instrument up by symbol.
+
+        :returns: The instrument or None.
+        """
+        return self._by_symbol.get(symbol)
+
+    def by_id(self, instrument_id: Any) -> Instrument | None:
+        """Looks an instrument up by numeric id.
+
+        :returns: The instrument or None.
+        """
+        return self._by_id.get(instrument_id)
+
+    def symbols(
+            self, is_open: bool | None = None, otc: bool | None = None
+    ) -> set[str]:
+        """Returns the symbols of one side of the open/OTC partition.
+
+        :param is_open: Only open (True) or closed (False) instruments.
+        :param otc: Only OTC (True) or regular (False) instruments.
+        :returns: A new set of symbols.
+        """
+        result: set[str] = set()
+        for (part_open, part_otc), symbols in self._partition.items():
+            if (
+                    (is_open is None or part_open == is_open)
+                    and (otc is None or part_otc == otc)
+            ):
+                result |= symbols
+        return result
+
+    def payments(self) -> dict[str, dict[str, Any]]:
+        """Returns ``{name: payout}`` for every instrument.
+
+        Built once per update that changed anything.
+        """
+        if self._payments is None:
+            self._payments = {
+                instrument.name: instrument.payout()
+                for instrument in self._by_symbol.values()
+            }
+        return self._payments
+
+    def _add(self, instrument: Instrument) -> None:
+        self._by_symbol[instrument.symbol] = instrument
+        self._by_id[instrument.id] = instrument
+        self._partition[instrument.open, instrument.is_otc].add(
+            instrument.symbol
+        )
+
+    def _remove(self, instrument: Instrument) -> None:
+        del self._by_symbol[instrument.symbol]
+        if self._by_id.get(instrument.id) is instrument:
+            del self._by_id[instrument.id]
+        self._partition[instrument.open, instrument.is_otc].discard(
+            instrument.symbol
+        )
+
+    def update(
+            self, rows: Iterable[list[Any]], full: bool = True
+    ) -> list[InstrumentChange]:
+        """Applies an instruments/list push.
+
+        :param rows: The raw rows.
+        :param full: Whether the push lists every instrument, so that
+            instruments missing from it are removed.
+        :returns: The changes, in row order, removals last.
+        """
+        changes: list[InstrumentChange] = []
+        seen: set[str] = set()
+        dirty = False
+        for row in rows:
+            if not isinstance(row, list) or len(row) <= SYMBOL:
+                continue
+            symbol = row[SYMBOL]
+            seen.add(symbol)
+            current = self._by_symbol.get(symbol)
+            if current is not None and current.raw == row:
+                continue
+            instrument = Instrument(row)
+            self.decoded += 1
+            dirty = True
+            if current is None:
+                changes.append(
+                    InstrumentChange(symbol, "added", None, instrument)
+                )
+            else:
+                for field in WATCHED_FIELDS:
+                    old = getattr(current, field)
+                    new = getattr(instrument, field)
+                    if old != new:
+                        changes.append(
+                            InstrumentChange(symbol, field, old, new)
+                        )
+                self._remove(current)
+            self._add(instrument)
+        if full:
+            for symbol in [s for s in self._by_symbol if s not in seen]:
+                instrument = self._by_symbol[symbol]
+                self._remove(instrument)
+                changes.append(
+                    InstrumentChange(symbol, "removed", instrument, None)
+                )
+                dirty = True
+        self.updates += 1
+        if dirty:
+            self._payments = None
+        return changes
@@ -1,26 +1,38 @@
 from typing import Any
 
+from pyquotex.utils.bounded import BoundedDict
 from pyquotex.ws.objects.base import Base
 
 
 class ListInfoData(Base):
     """Class for Quotex Candles websocket object."""
 
-    def __init__(self) -> None:
+    def __init__(
+            self, capacity: int | None = None, ttl: float | None = None
+    ) -> None:
+        """
+        :param capacity: Maximum number of orders kept (unbounded if None).
+        :param ttl: Seconds an order result is kept after its last update.
+        """
         super(ListInfoData, self).__init__()
         self.__name = "listInfoData"
-        self.listinfodata_dict: dict[str | int, dict[str, Any]] = {}
+        self.listinfodata_dict: dict[str, dict[str, Any]] = (
+            BoundedDict(capacity, ttl)
+            if capacity is not None or ttl is not None
+            else {}
+        )
 
+    # Order ids arrive as int or str depending on the message; entries are
+    # stored once under the str form.
     def set(self, win: str, game_state: int, id_number: str | int, profit: float | int = 0) -> None:
-        self.listinfodata_dict[id_number] = {
+        self.listinfodata_dict[str(id_number)] = {
             "win": win,
             "game_state": game_state,
             "profit": profit
         }
 
     def delete(self, id_number: str | int) -> None:
-        if id_number in self.listinfodata_dict:
-            del self.listinfodata_dict[id_number]
+        self.listinfodata_dict.pop(str(id_number), None)
 
     def get(self, id_number: str | int) -> dict[str, Any] | None:
-        return self.listinfodata_dict.get(id_number)
+        return self.listinfodata_dict.get(str(id_number))
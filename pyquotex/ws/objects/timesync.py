@@ -1,6 +1,7 @@
 import datetime
 import time
 
+from pyquotex.utils.server_clock import ServerClock
 from pyquotex.ws.objects.base import Base
 
 
@@ -11,6 +12,7 @@ class TimeSync(Base):
         super().__init__()
         self.__name = "timeSync"
         self.__server_timestamp: float = time.time()
+        self.clock = ServerClock()
         self.__expiration_time_minutes: float | int = 1
 
     @property
@@ -31,6 +33,39 @@ class TimeSync(Base):
             raise ValueError("The timestamp must be a number.")
         self.__server_timestamp = float(timestamp)
 
+    def sync(self, timestamp: float | int) -> None:
+        """Record a timestamp taken from a server message (e.g. a tick).
+
+        Updates ``server_timestamp`` and feeds the sample to ``clock``.
+
+        :param timestamp: Server UNIX timestamp in seconds.
+        """
+        self.server_timestamp = timestamp
+        self.clock.observe(self.server_timestamp)
+
+    @property
+    def offset(self) -> float:
+        """Get the estimated server clock offset from the local clock.
+
+        :returns: Seconds to add to local time to get server time.
+        """
+        return self.clock.offset
+
+    @property
+    def synced(self) -> bool:
+        """Whether the offset was measured from a server timestamp.
+
+        :returns: False until the first server timestamp arrives.
+        """
+        return self.clock.synced
+
+    def server_now(self) -> float:
+        """Get the current server time without a network round-trip.
+
+        :returns: The ``clock`` estimate, in sub-millisecond resolution.
+        """
+        return self.clock.server_now()
+
     @property
     def server_datetime(self) -> datetime.datetime:
         """Get the server date and time based on the timestamp.
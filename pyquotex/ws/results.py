@@ -0,0 +1,233 @@
+"""Futures for order results, resolved by the order-close handlers.
+
+Waiting for an order result costs one future and one timer-wheel entry;
+nothing polls. The close handlers call :meth:`OrderResults.resolve`, which
+wakes every waiter of the order and records the delay between the order's
+expiry and the arrival of its result.
+"""
+import asyncio
+import time
+from typing import Any, Callable, Iterable
+
+from pyquotex.utils.latency import LatencyHistogram
+from pyquotex.utils.timer_wheel import TimerWheel
+
+OrderResult = tuple[str, float]
+
+
+class OrderResults:
+    """Waiters for order results, keyed by order id."""
+
+    def __init__(
+            self,
+            timers: TimerWheel | None = None,
+            clock: Callable[[], float] = time.time
+    ) -> None:
+        """
+        Args:
+            timers (TimerWheel, optional): Wheel holding the waiters'
+                deadlines. A private one is created if omitted.
+            clock (Callable): Wall clock, in seconds, used to measure the
+                delay from expiry to result.
+        """
+        self.timers = timers if timers is not None else TimerWheel()
+        self.clock = clock
+        self.latency = LatencyHistogram()
+        self.resolved = 0
+        self.timed_out = 0
+        self._waiters: dict[str, list[asyncio.Future]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    def __contains__(self, order_id: object) -> bool:
+        return str(order_id) in self._waiters
+
+    def register(self, order_id: str | int) -> asyncio.Future:
+        """
+        Returns a future resolved with the order's ``(win, profit)``.
+
+        Every call returns a new future, so each waiter can time out or be
+        cancelled without affecting the others.
+        """
+        future = asyncio.get_running_loop().create_future()
+        key = str(order_id)
+        self._waiters.setdefault(key, []).append(future)
+        future.add_done_callback(lambda f: self._discard(key, f))
+        return future
+
+    def _discard(self, key: str, future: asyncio.Future) -> None:
+        waiters = self._waiters.get(key)
+        if waiters and future in waiters:
+            waiters.remove(future)
+            if not waiters:
+                del self._waiters[key]
+
+    def resolve(
+            self,
+            order_id: str | int,
+            win: str,
+            profit: float,
+            expired_at: float | None = None
+    ) -> int:
+        """
+        Resolves every waiter of an order.
+
+        Args:
+            order_id (str | int): Order id.
+            win (str): "win" or "loss".
+            profit (float): Order profit.
+            expired_at (float, optional): Unix time at which the order
+                expired (``closeTimestamp``); feeds the latency histogram
+                when the order has waiters.
+
+        Returns:
+            int: Number of waiters woken.
+        """
+        waiters = self._waiters.pop(str(order_id), None)
+        if not waiters:
+            return 0
+        # Only awaited orders are measured: close events also replay old
+        # deals, whose delay says nothing about the live path.
+        if expired_at:
+            self.latency.record(self.clock() - float(expired_at))
+        result = (win, float(profit))
+        woken = 0
+        for future in waiters:
+            if not future.done():
+                future.set_result(result)
+                woken += 1
+        self.resolved += woken
+        return woken
+
+    def fail_all(self, error: BaseException) -> int:
+        """Fails every waiter (e.g. when the connection drops)."""
+        waiters, self._waiters = self._waiters, {}
+        failed = 0
+        for futures in waiters.values():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+                    failed += 1
+        return failed
+
+    def _expire(self, future: asyncio.Future, timeout: float) -> None:
+        if not future.done():
+            self.timed_out += 1
+            future.set_exception(
+                TimeoutError(f"No order result after {timeout}s")
+            )
+
+    async def wait(
+            self, order_id: str | int, timeout: float | None = None
+    ) -> OrderResult:
+        """
+        Waits for an order result.
+
+        Raises:
+            TimeoutError: If the result does not arrive in time.
+        """
+        future = self.register(order_id)
+        if timeout is None:
+            return await future
+        timer = self.timers.call_later(timeout, self._expire, future, timeout)
+        try:
+            return await future
+        finally:
+            self.timers.cancel(timer)
+
+    def watch(
+            self,
+            order_ids: Iterable[str | int],
+            timeout: float | None = None
+    ) -> "ResultWatch":
+        """
+        Watches many orders at once; see :class:`ResultWatch`.
+
+        The waiters are registered immediately, so no result can be missed
+        between this call and the first iteration.
+        """
+        return ResultWatch(self, order_ids, timeout)
+
+    def metrics(self) -> dict[str, Any]:
+        """Returns waiter counts and the expiry-to-result histogram."""
+        return {
+            "waiting": len(self),
+            "resolved": self.resolved,
+            "timed_out": self.timed_out,
+            "timers": len(self.timers),
+            "latency": self.latency.as_dict(),
+        }
+
+
+class ResultWatch:
+    """
+    Async iterator over the results of many orders, in completion order.
+
+    Yields ``(order_id, (win, profit))`` with order ids as strings. Each
+    order costs one future and one done callback; the whole batch shares a
+    single timer-wheel deadline. When the deadline expires the remaining
+    waiters are cancelled and :class:`TimeoutError` is raised; closing the
+    watch early cancels them as well.
+    """
+
+    def __init__(
+            self,
+            results: OrderResults,
+            order_ids: Iterable[str | int],
+            timeout: float | None = None
+    ) -> None:
+        self._results = results
+        self._timeout = timeout
+        self._done: asyncio.Queue = asyncio.Queue()
+        self._pending: dict[str, asyncio.Future] = {}
+        for key in dict.fromkeys(str(order_id) for order_id in order_ids):
+            future = results.register(key)
+            future.add_done_callback(
+                lambda f, k=key: self._done.put_nowait((k, f))
+            )
+            self._pending[key] = future
+        self._timer = (
+            results.timers.call_later(timeout, self._done.put_nowait, None)
+            if timeout is not None and self._pending else None
+        )
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def pending(self) -> list[str]:
+        """Returns the ids still awaiting a result."""
+        return list(self._pending)
+
+    def __aiter__(self) -> "ResultWatch":
+        return self
+
+    async def __anext__(self) -> tuple[str, OrderResult]:
+        while self._pending:
+            item = await self._done.get()
+            if item is None:
+                remaining = len(self._pending)
+                self._results.timed_out += remaining
+                self.close()
+                raise TimeoutError(
+                    f"No result for {remaining} order(s) after "
+                    f"{self._timeout}s"
+                )
+            key, future = item
+            if self._pending.pop(key, None) is None or future.cancelled():
+                continue
+            # Raises the waiter's error, e.g. ConnectionError on disconnect.
+            return key, future.result()
+        self.close()
+        raise StopAsyncIteration
+
+    def close(self) -> None:
+        """Cancels the remaining waiters and the shared deadline."""
+        if self._timer is not None:
+            self._results.timers.cancel(self._timer)
+            self._timer = None
+        pending, self._pending = self._pending, {}
+        for key, future in pending.items():
+            self._results._discard(key, future)
+            if not future.cancel() and not future.cancelled():
+                future.exception()  # Mark a failure as retrieved
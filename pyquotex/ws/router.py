@@ -0,0 +1,489 @@
+"""Socket.IO frame parsing and table-driven event routing.
+
+Every inbound WebSocket frame is parsed exactly once into a :class:`Frame`
+(Engine.IO packet type, Socket.IO packet type, attachment count, event
+name and payload) and then dispatched through a hash table of handlers,
+replacing the old substring scanning and ``if/elif`` chains.
+"""
+import inspect
+import logging
+from collections import deque
+from typing import Any, Callable
+
+from pyquotex.utils import json_utils as json
+
+logger = logging.getLogger(__name__)
+
+# Engine.IO (v3) packet types
+ENGINE_OPEN = 0
+ENGINE_CLOSE = 1
+ENGINE_PING = 2
+ENGINE_PONG = 3
+ENGINE_MESSAGE = 4
+
+# Socket.IO packet types
+SOCKET_CONNECT = 0
+SOCKET_DISCONNECT = 1
+SOCKET_EVENT = 2
+SOCKET_ACK = 3
+SOCKET_ERROR = 4
+SOCKET_BINARY_EVENT = 5
+SOCKET_BINARY_ACK = 6
+
+Handler = Callable[[str, Any], Any]
+
+# Binary-event headers repeat verbatim (``451-["quotes/stream",{...}]`` on
+# every tick), so their parsed form is cached to skip the JSON decode.
+_HEADER_CACHE_SIZE = 256
+_header_cache: dict[bytes | str, tuple[int, int, str | None, Any]] = {}
+
+
+class Frame:
+    """A single parsed WebSocket frame."""
+
+    __slots__ = (
+        "engine_type", "packet_type", "attachments", "event", "data",
+        "binary"
+    )
+
+    def __init__(
+            self,
+            engine_type: int = ENGINE_MESSAGE,
+            packet_type: int = -1,
+            attachments: int = 0,
+            event: str | None = None,
+            data: Any = None,
+            binary: bool = False
+    ) -> None:
+        self.engine_type = engine_type
+        self.packet_type = packet_type
+        self.attachments = attachments
+        self.event = event
+        self.data = data
+        self.binary = binary
+
+    @property
+    def is_placeholder(self) -> bool:
+        """True when the frame is a header announcing binary attachments."""
+        if self.packet_type in (SOCKET_BINARY_EVENT, SOCKET_BINARY_ACK):
+            return True
+        return isinstance(self.data, dict) and bool(
+            self.data.get("_placeholder")
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Frame(engine={self.engine_type}, packet={self.packet_type}, "
+            f"event={self.event!r}, binary={self.binary})"
+        )
+
+
+def _event_args(payload: Any) -> tuple[str | None, Any]:
+    """Splits a Socket.IO event array into its name and data."""
+    if (
+            isinstance(payload, list)
+            and payload
+            and isinstance(payload[0], str)
+    ):
+        args = payload[1:]
+        if not args:
+            return payload[0], None
+        return payload[0], args[0] if len(args) == 1 else args
+    return None, payload
+
+
+class FrameStats:
+    """Counters for inbound frames and the payload bytes copied to parse
+    them."""
+
+    __slots__ = ("frames", "bytes_received", "bytes_copied")
+
+    def __init__(self) -> None:
+        self.frames = 0
+        self.bytes_received = 0
+        self.bytes_copied = 0
+
+    @property
+    def copied_per_frame(self) -> float:
+        """Average payload bytes copied per frame."""
+        return self.bytes_copied / self.frames if self.frames else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "frames": self.frames,
+            "bytes_received": self.bytes_received,
+            "bytes_copied": self.bytes_copied,
+            "copied_per_frame": self.copied_per_frame,
+        }
+
+
+def _copy_cost(size: int, offset: int, is_bytes: bool) -> int:
+    """Bytes copied by the parser front-end before JSON decoding."""
+    if is_bytes and json.HAS_ORJSON:
+        return 0
+    return size - offset if offset else 0
+
+
+def is_binary_frame(raw: bytes | str) -> bool:
+    """Returns True for attachment frames (no leading Engine.IO digit)."""
+    if not raw:
+        return True
+    first = raw[0] if not isinstance(raw, str) else ord(raw[0])
+    return not 48 <= first <= 57
+
+
+def parse_frame(
+        raw: bytes | str, stats: FrameStats | None = None
+) -> Frame:
+    """
+    Parses a raw WebSocket frame.
+
+    Text frames carry an Engine.IO type digit, a Socket.IO type digit, an
+    optional ``<attachments>-`` count, an optional namespace and ack id and
+    finally the JSON body. Binary frames are Socket.IO attachments whose
+    first byte is the Engine.IO message type.
+
+    Frames received as bytes are parsed in place: the prefix is read from
+    the buffer and the JSON body is handed to the decoder as a memoryview
+    slice, so no decoded string or sliced copy of the payload is made.
+
+    Args:
+        raw (bytes | str): The frame as received from the socket.
+        stats (FrameStats, optional): Counters to update.
+
+    Returns:
+        Frame: The parsed frame.
+    """
+    if isinstance(raw, memoryview):
+        raw = raw.tobytes()
+    is_bytes = not isinstance(raw, str)
+    n = len(raw)
+    if stats is not None:
+        stats.frames += 1
+        stats.bytes_received += n
+    if not n:
+        return Frame(binary=True)
+
+    first = raw[0] if is_bytes else ord(raw[0])
+    if not 48 <= first <= 57:
+        # Binary attachment (leading Engine.IO message byte) or bare JSON
+        offset = 1 if first == ENGINE_MESSAGE else 0
+        if stats is not None:
+            stats.bytes_copied += _copy_cost(n, offset, is_bytes)
+        data = _loads(raw, offset, is_bytes) if offset < n else None
+        return Frame(ENGINE_MESSAGE, SOCKET_EVENT, data=data, binary=True)
+
+    engine_type = first - 48
+    if engine_type != ENGINE_MESSAGE or n == 1:
+        return Frame(engine_type)
+
+    packet_type = (raw[1] if is_bytes else ord(raw[1])) - 48
+    cacheable = (
+            packet_type == SOCKET_BINARY_EVENT and type(raw) in (bytes, str)
+    )
+    if cacheable:
+        cached = _header_cache.get(raw)
+        if cached is not None:
+            return Frame(engine_type, *cached)
+
+    # The prefix is ASCII: read it as code points without decoding the
+    # payload.
+    codes = raw if is_bytes else _prefix_codes(raw, 32)
+    limit = min(n, len(codes))
+    i = 2
+    attachments = 0
+    if packet_type in (SOCKET_BINARY_EVENT, SOCKET_BINARY_ACK):
+        start = i
+        while i < limit and 48 <= codes[i] <= 57:
+            i += 1
+        if i < limit and codes[i] == 45:  # "-"
+            attachments = int(raw[start:i])
+            i += 1
+        else:
+            i = start
+    if i < limit and codes[i] == 47:  # "/" namespace
+        comma = raw.find(b"," if is_bytes else ",", i)
+        i = n if comma == -1 else comma + 1
+        if not is_bytes:
+            codes = _prefix_codes(raw, i + 32)
+            limit = min(n, len(codes))
+    while i < limit and 48 <= codes[i] <= 57:  # ack id
+        i += 1
+
+    if stats is not None:
+        stats.bytes_copied += _copy_cost(n, i, is_bytes)
+    payload = _loads(raw, i, is_bytes) if i < n else None
+    event, data = _event_args(payload)
+    if cacheable:
+        if len(_header_cache) >= _HEADER_CACHE_SIZE:
+            _header_cache.clear()
+        _header_cache[raw] = (packet_type, attachments, event, data)
+    return Frame(engine_type, packet_type, attachments, event, data)
+
+
+def _prefix_codes(text: str, size: int) -> bytes:
+    """Code points of the first size characters (non-ASCII as ``?``)."""
+    return text[:size].encode("ascii", "replace")
+
+
+def _loads(raw: bytes | str, offset: int, is_bytes: bool) -> Any:
+    if is_bytes:
+        return json.loads_from(raw, offset)
+    return json.loads(raw[offset:] if offset else raw)
+
+
+def fill_placeholders(data: Any, attachments: list[Any]) -> tuple[Any, int]:
+    """
+    Replaces ``{"_placeholder": true, "num": n}`` markers with attachments.
+
+    The header data is rebuilt rather than mutated, since parsed headers
+    are shared through the header cache.
+
+    Returns:
+        tuple: (Reconstructed data, number of placeholders replaced).
+    """
+    if isinstance(data, dict):
+        if data.get("_placeholder") is True:
+            num = data.get("num", 0)
+            if isinstance(num, int) and 0 <= num < len(attachments):
+                return attachments[num], 1
+            return None, 1
+        filled = {}
+        count = 0
+        for key, value in data.items():
+            filled[key], found = fill_placeholders(value, attachments)
+            count += found
+        return filled, count
+    if isinstance(data, list):
+        items = []
+        count = 0
+        for value in data:
+            item, found = fill_placeholders(value, attachments)
+            items.append(item)
+            count += found
+        return items, count
+    return data, 0
+
+
+class BinaryEvent:
+    """A binary event header together with its attachments."""
+
+    __slots__ = ("event", "data", "expected", "attachments")
+
+    def __init__(self, event: str | None, data: Any, expected: int) -> None:
+        self.event = event
+        self.data = data
+        self.expected = expected
+        self.attachments: list[Any] = []
+
+    @property
+    def complete(self) -> bool:
+        return len(self.attachments) >= self.expected
+
+    def payload(self, decode: Callable[[Any], Any] | None = None) -> Any:
+        """
+        Returns the event data with placeholders replaced.
+
+        Args:
+            decode (Callable, optional): Applied to each attachment first,
+                for attachments queued as raw frames.
+        """
+        attachments = self.attachments
+        data = self.data
+        if type(data) is dict and data.get("_placeholder") is True:
+            # Common case: the whole argument is a single placeholder, so
+            # only that attachment needs decoding.
+            num = data.get("num", 0)
+            if type(num) is not int or not 0 <= num < len(attachments):
+                return None
+            attachment = attachments[num]
+            return attachment if decode is None else decode(attachment)
+        if decode is not None:
+            attachments = [decode(attachment) for attachment in attachments]
+        filled, found = fill_placeholders(data, attachments)
+        if not found and attachments:
+            # Header without markers: the attachment is the payload.
+            return attachments[0]
+        return filled
+
+
+class AttachmentAssembler:
+    """Reassembles Socket.IO binary events from headers and attachments.
+
+    Headers are queued in arrival order with their expected attachment
+    count; each binary frame completes the oldest pending header, so two
+    headers received before their attachments are no longer confused.
+    """
+
+    def __init__(self, max_pending: int = 64) -> None:
+        """
+        Args:
+            max_pending (int): Headers kept waiting for attachments before
+                the oldest is discarded.
+        """
+        self.max_pending = max_pending
+        self.pending: deque[BinaryEvent] = deque()
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def add_header(
+            self, event: str | None, data: Any, expected: int
+    ) -> BinaryEvent | None:
+        """
+        Queues a header announcing expected attachments.
+
+        Returns:
+            BinaryEvent | None: The event if it needs no attachments.
+        """
+        binary_event = BinaryEvent(event, data, expected)
+        if expected <= 0:
+            return binary_event
+        if len(self.pending) >= self.max_pending:
+            dropped = self.pending.popleft()
+            logger.warning(
+                "Dropping incomplete binary event %s (%d/%d attachments)",
+                dropped.event, len(dropped.attachments), dropped.expected
+            )
+        self.pending.append(binary_event)
+        return None
+
+    def add_attachment(self, attachment: Any) -> BinaryEvent | None:
+        """
+        Adds an attachment to the oldest pending header.
+
+        Returns:
+            BinaryEvent | None: The event once all its attachments arrived.
+        """
+        pending = self.pending
+        if not pending:
+            return None
+        binary_event = pending[0]
+        attachments = binary_event.attachments
+        attachments.append(attachment)
+        if len(attachments) >= binary_event.expected:
+            return pending.popleft()
+        return None
+
+    def clear(self) -> None:
+        """Discards all pending headers (e.g. after a reconnect)."""
+        self.pending.clear()
+
+
+def classify_payload(data: Any) -> str | None:
+    """
+    Infers the event for a payload that arrived without a known header.
+
+    Quotex pushes several payloads (ticks, balances, deals) as bare binary
+    attachments, so these are routed by shape instead of by name.
+
+    Returns:
+        str | None: The synthetic event name or None if unrecognised.
+    """
+    if isinstance(data, list):
+        if not data:
+            return None
+        first = data[0]
+        if isinstance(first, list):
+            return "quotes/stream"
+        if len(data) == 1 and isinstance(first, dict):
+            return classify_payload(first)
+        return None
+    if not isinstance(data, dict):
+        return None
+    if data.get("liveBalance") or data.get("demoBalance"):
+        return "balance"
+    if data.get("deals"):
+        return "deals"
+    if data.get("candles") or data.get("data"):
+        return "history/load"
+    if "ticket" in data and "requestId" not in data:
+        return "orders/cancel"
+    if "id" in data and ("asset" in data or "amount" in data):
+        return "orders/open"
+    return None
+
+
+class MessageRouter:
+    """O(1) event router for Quotex WebSocket messages.
+
+    Handlers are registered per event name and receive ``(event, data)``.
+    Both plain functions and coroutine functions are accepted; the kind is
+    resolved once at registration time so dispatch is a dict lookup plus
+    a call.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, list[tuple[Handler, bool]]] = {}
+
+    def register(
+            self, event: str, handler: Handler, prepend: bool = False
+    ) -> None:
+        """
+        Registers a handler for an event.
+
+        Args:
+            event (str): Socket.IO event name, e.g. ``"orders/close"``.
+            handler (callable): ``handler(event, data)``, sync or async.
+            prepend (bool): Run before the already registered handlers.
+        """
+        entry = (handler, inspect.iscoroutinefunction(handler))
+        handlers = self._handlers.setdefault(event, [])
+        if prepend:
+            handlers.insert(0, entry)
+        else:
+            handlers.append(entry)
+
+    def unregister(self, event: str, handler: Handler) -> None:
+        """Removes a previously registered handler."""
+        handlers = self._handlers.get(event)
+        if not handlers:
+            return
+        self._handlers[event] = [h for h in handlers if h[0] != handler]
+        if not self._handlers[event]:
+            del self._handlers[event]
+
+    def handles(self, event: str | None) -> bool:
+        """Returns True if at least one handler is registered for event."""
+        return event in self._handlers
+
+    @property
+    def events(self) -> list[str]:
+        """Returns the names of all routed events."""
+        return list(self._handlers)
+
+    async def dispatch(
+            self, event: str | None, data: Any, fallback: bool = True
+    ) -> bool:
+        """
+        Dispatches data to the handlers registered for event.
+
+        Args:
+            event (str | None): The event name, if known.
+            data (Any): The decoded payload.
+            fallback (bool): Classify the payload by shape when no handler
+                is registered for event.
+
+        Returns:
+            bool: True if at least one handler ran.
+        """
+        handlers = self._handlers.get(event) if event else None
+        if handlers is None:
+            if not fallback:
+                return False
+            event = classify_payload(data)
+            if event is None:
+                return False
+            handlers = self._handlers.get(event)
+            if handlers is None:
+                return False
+
+        for handler, is_async in handlers:
+            try:
+                if is_async:
+                    await handler(event, data)
+                else:
+                    handler(event, data)
+            except Exception as e:
+                logger.error("Handler for %s failed: %s", event, e)
+        return True
@@ -0,0 +1,234 @@
+"""Orders fired at a given server time.
+
+Each scheduled order is serialized when it is scheduled, with its
+expiration computed for the firing time, and armed with
+``loop.call_at``. The event loop clock is mapped to the server clock when
+the order is armed and again ``lead`` seconds before it fires, so clock
+estimate updates in between do not move the firing time. The delay
+between the target time and the moment the frame is handed to the socket
+is recorded as jitter.
+"""
+import asyncio
+import logging
+from typing import Any
+
+from pyquotex.utils.latency import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# Seconds before the target time at which an order is re-armed against
+# the latest clock estimate.
+DEFAULT_LEAD = 1.0
+# An order woken this much before its target time is re-armed instead of
+# being sent early.
+EARLY_TOLERANCE = 0.0002
+# Sub-millisecond buckets for the firing jitter.
+JITTER_BOUNDS_MS = (
+    0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000,
+)
+
+
+class ScheduledOrder:
+    """An order waiting for its firing time."""
+
+    __slots__ = (
+        "at", "amount", "asset", "direction", "duration", "request_id",
+        "frame", "result", "fired_at", "_handle",
+    )
+
+    def __init__(
+            self,
+            at: float,
+            amount: float,
+            asset: str,
+            direction: str,
+            duration: int,
+            request_id: int,
+            frame: str,
+            result: asyncio.Future
+    ) -> None:
+        self.at = at
+        self.amount = amount
+        self.asset = asset
+        self.direction = direction
+        self.duration = duration
+        self.request_id = request_id
+        self.frame = frame
+        self.result = result
+        self.fired_at: float | None = None
+        self._handle: asyncio.TimerHandle | None = None
+
+    @property
+    def jitter(self) -> float | None:
+        """Seconds between the target time and the send, once fired."""
+        if self.fired_at is None:
+            return None
+        return self.fired_at - self.at
+
+    def __await__(self):
+        return self.result.__await__()
+
+    def __repr__(self) -> str:
+        return (
+            f"ScheduledOrder(at={self.at}, asset={self.asset!r}, "
+            f"direction={self.direction!r}, amount={self.amount}, "
+            f"duration={self.duration})"
+        )
+
+
+class OrderScheduler:
+    """Fires pre-serialized orders at server times."""
+
+    def __init__(self, client: Any, lead: float = DEFAULT_LEAD) -> None:
+        """
+        Args:
+            client (Quotex): Client whose current ``api`` sends the orders.
+            lead (float): Seconds before the target time at which each
+                order is re-armed against the latest clock estimate.
+        """
+        self.client = client
+        self.lead = lead
+        self.jitter = LatencyHistogram(JITTER_BOUNDS_MS)
+        self.scheduled = 0
+        self.fired = 0
+        self.cancelled = 0
+        self.missed = 0
+        self._pending: set[ScheduledOrder] = set()
+        self._tasks: set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _server_now(self) -> float:
+        return self.client.api.timesync.server_now()
+
+    async def schedule(
+            self,
+            at: float,
+            amount: float,
+            asset: str,
+            direction: str,
+            duration: int,
+            request_id: int,
+            time_mode: str = "TIME"
+    ) -> ScheduledOrder:
+        """
+        Schedules an order for server time ``at``.
+
+        The asset is prepared (see ``Quotex.prepare_order``) and the frame
+        serialized now, so firing only sends it.
+
+        Args:
+            at (float): Server UNIX time at which to send the order.
+            amount (float): Order amount.
+            asset (str): Asset symbol.
+            direction (str): "call" or "put".
+            duration (int): Order duration in seconds.
+            request_id (int): Correlation id of the ``orders/open``
+                request.
+            time_mode (str): "TIME" (default) or "TIMER", as in buy().
+
+        Returns:
+            ScheduledOrder: Awaitable resolving to buy()'s
+            ``(status, data)``.
+
+        Raises:
+            ValueError: If ``at`` is already past.
+        """
+        client = self.client
+        if at < self._server_now():
+            raise ValueError(f"Scheduled time {at} is in the past.")
+        await client.prepare_order(asset, duration, time_mode)
+        frame = client.api.buy.build(
+            amount, asset, direction, duration, request_id,
+            time_mode.upper() == "TIME", server_time=at
+        )
+        order = ScheduledOrder(
+            at, amount, asset, direction, duration, request_id, frame,
+            asyncio.get_running_loop().create_future()
+        )
+        self._pending.add(order)
+        self.scheduled += 1
+        self._arm(order)
+        return order
+
+    def cancel(self, order: ScheduledOrder) -> bool:
+        """
+        Cancels an order that has not fired yet.
+
+        Returns:
+            bool: True if the order was still pending.
+        """
+        if order not in self._pending:
+            return False
+        self._pending.discard(order)
+        if order._handle is not None:
+            order._handle.cancel()
+            order._handle = None
+        order.result.cancel()
+        self.cancelled += 1
+        return True
+
+    def cancel_all(self) -> int:
+        """Cancels every pending order and returns how many there were."""
+        return sum(self.cancel(order) for order in list(self._pending))
+
+    def _arm(self, order: ScheduledOrder) -> None:
+        loop = asyncio.get_running_loop()
+        delay = order.at - self._server_now()
+        if delay > self.lead:
+            # Coarse wake-up; the precise one is armed from the latest
+            # clock estimate.
+            order._handle = loop.call_at(
+                loop.time() + delay - self.lead, self._arm, order
+            )
+        else:
+            order._handle = loop.call_at(
+                loop.time() + delay, self._fire, order
+            )
+
+    def _fire(self, order: ScheduledOrder) -> None:
+        if order.at - self._server_now() > EARLY_TOLERANCE:
+            self._arm(order)
+            return
+        order._handle = None
+        self._pending.discard(order)
+        task = asyncio.ensure_future(self._send(order))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, order: ScheduledOrder) -> None:
+        client = self.client
+        api = client.api
+        if not api.is_connected:
+            self.missed += 1
+            logger.warning("Order for %s at %s missed: not connected.",
+                           order.asset, order.at)
+            order.result.set_result((False, "Websocket not connected"))
+            return
+
+        def send():
+            order.fired_at = self._server_now()
+            self.jitter.record(max(0.0, order.fired_at - order.at))
+            self.fired += 1
+            return api.send_websocket_request(order.frame)
+
+        try:
+            outcome = await client._submit_order(
+                order.request_id, order.asset, order.duration, send
+            )
+        except Exception as e:
+            outcome = (False, str(e))
+        if not order.result.done():
+            order.result.set_result(outcome)
+
+    def metrics(self) -> dict[str, Any]:
+        """Returns counters and the firing jitter histogram."""
+        return {
+            "pending": len(self._pending),
+            "scheduled": self.scheduled,
+            "fired": self.fired,
+            "cancelled": self.cancelled,
+            "missed": self.missed,
+            "jitter": self.jitter.as_dict(),
+        }
@@ -0,0 +1,273 @@
+"""Push-based fan-out of market data to async-iterator subscribers.
+
+The message handlers publish every tick and sentiment update to the
+:class:`StreamHub`; each subscriber owns a bounded queue, so a slow consumer
+only loses its own oldest items and never holds up the ingest path. The hub
+reference-counts subscribers per asset so that one upstream subscription
+serves any number of local streams.
+"""
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STREAM_SIZE = 256
+
+Topic = tuple[Hashable, ...]
+Upstream = Callable[[], Awaitable[Any]]
+
+
+class StreamClosed(Exception):
+    """Raised by :meth:`Subscription.get` once the stream has ended."""
+
+
+class Subscription:
+    """A subscriber's bounded queue of stream items."""
+
+    __slots__ = (
+        "topic", "group", "partial", "dropped", "_items", "_waiter",
+        "_closed",
+    )
+
+    def __init__(
+            self,
+            topic: Topic,
+            group: Hashable,
+            maxsize: int = DEFAULT_STREAM_SIZE,
+            partial: bool = False
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("Stream queue size must be positive.")
+        self.topic = topic
+        self.group = group
+        self.partial = partial
+        self.dropped = 0
+        self._items: deque = deque(maxlen=maxsize)
+        self._waiter: asyncio.Future | None = None
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def push(self, item: Any) -> None:
+        """Queues an item, dropping the oldest one when full."""
+        items = self._items
+        if len(items) == items.maxlen:
+            self.dropped += 1
+        items.append(item)
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def close(self) -> None:
+        """Ends the stream once the queued items are consumed."""
+        self._closed = True
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def get(self) -> Any:
+        """
+        Returns the next item, waiting for one if necessary.
+
+        Raises:
+            StreamClosed: If the stream ended and the queue is empty.
+        """
+        items = self._items
+        while not items:
+            if self._closed:
+                raise StreamClosed(self.topic)
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return items.popleft()
+
+
+class CandleAggregator:
+    """Builds OHLC candles of one period from ticks."""
+
+    __slots__ = ("period", "candle")
+
+    def __init__(self, period: int) -> None:
+        self.period = period
+        self.candle: dict[str, Any] | None = None
+
+    def update(self, timestamp: float, price: float) -> dict[str, Any] | None:
+        """
+        Adds a tick to the forming candle.
+
+        Returns:
+            dict | None: The previous candle when this tick closed it.
+        """
+        start = int(timestamp // self.period * self.period)
+        candle = self.candle
+        if candle is not None and candle["time"] == start:
+            candle["close"] = price
+            if price > candle["high"]:
+                candle["high"] = price
+            elif price < candle["low"]:
+                candle["low"] = price
+            candle["ticks"] += 1
+            return None
+        if candle is not None and start < candle["time"]:
+            return None  # Late tick from an already closed candle
+        self.candle = {
+            "time": start, "open": price, "close": price,
+            "high": price, "low": price, "ticks": 1,
+        }
+        return candle
+
+
+class StreamHub:
+    """Routes published market data to subscribers."""
+
+    def __init__(self) -> None:
+        self._topics: dict[Topic, list[Subscription]] = {}
+        self._candles: dict[str, dict[int, CandleAggregator]] = {}
+        self._groups: dict[Hashable, int] = {}
+        self._stops: dict[Hashable, Upstream | None] = {}
+        self._starts: dict[Hashable, Upstream | None] = {}
+
+    def __len__(self) -> int:
+        return sum(len(subs) for subs in self._topics.values())
+
+    def subscribers(self, topic: Topic) -> int:
+        """Returns the number of subscribers of topic."""
+        return len(self._topics.get(topic, ()))
+
+    def groups(self) -> dict[Hashable, int]:
+        """Returns the subscriber count of each upstream group."""
+        return dict(self._groups)
+
+    async def subscribe(
+            self,
+            topic: Topic,
+            group: Hashable,
+            start: Upstream | None = None,
+            stop: Upstream | None = None,
+            maxsize: int = DEFAULT_STREAM_SIZE,
+            partial: bool = False
+    ) -> Subscription:
+        """
+        Adds a subscriber, starting the upstream feed for its group first.
+
+        Args:
+            topic (tuple): ``("prices", asset)``, ``("candles", asset,
+                period)`` or ``("sentiment", asset)``.
+            group (Hashable): Upstream subscription shared by topics
+                (the asset).
+            start (Callable, optional): Starts the upstream feed; awaited
+                when the group gets its first subscriber.
+            stop (Callable, optional): Stops the upstream feed; awaited
+                when the group loses its last subscriber.
+            maxsize (int): Items buffered for this subscriber.
+            partial (bool): For candle topics, also deliver the forming
+                candle after every tick.
+
+        Returns:
+            Subscription: The subscriber's queue.
+        """
+        subscription = Subscription(topic, group, maxsize, partial)
+        first = group not in self._groups
+        self._groups[group] = self._groups.get(group, 0) + 1
+        self._topics.setdefault(topic, []).append(subscription)
+        if topic[0] == "candles":
+            asset, period = topic[1], topic[2]
+            periods = self._candles.setdefault(asset, {})
+            if period not in periods:
+                periods[period] = CandleAggregator(period)
+        if first:
+            self._starts[group] = start
+            self._stops[group] = stop
+            if start is not None:
+                try:
+                    await start()
+                except BaseException:
+                    self._remove(subscription)
+                    raise
+        return subscription
+
+    def _remove(self, subscription: Subscription) -> bool:
+        """Detaches subscription; returns True if its group became empty."""
+        topic, group = subscription.topic, subscription.group
+        subs = self._topics.get(topic)
+        if not subs or subscription not in subs:
+            return False
+        subs.remove(subscription)
+        if not subs:
+            del self._topics[topic]
+            if topic[0] == "candles":
+                periods = self._candles.get(topic[1], {})
+                periods.pop(topic[2], None)
+                if not periods:
+                    self._candles.pop(topic[1], None)
+        self._groups[group] -= 1
+        if self._groups[group]:
+            return False
+        del self._groups[group]
+        self._starts.pop(group, None)
+        return True
+
+    async def unsubscribe(self, subscription: Subscription) -> None:
+        """Removes a subscriber, stopping the upstream feed if unused."""
+        subscription.close()
+        if self._remove(subscription):
+            stop = self._stops.pop(subscription.group, None)
+            if stop is not None:
+                try:
+                    await stop()
+                except Exception as e:
+                    logger.warning(
+                        "Failed to stop stream %s: %s", subscription.group, e
+                    )
+
+    async def restart(self) -> None:
+        """Re-issues the upstream subscriptions (e.g. after reconnecting)."""
+        for group, start in list(self._starts.items()):
+            if start is not None:
+                try:
+                    await start()
+                except Exception as e:
+                    logger.warning("Failed to restart stream %s: %s", group, e)
+
+    def close_all(self) -> None:
+        """Ends every stream."""
+        for subs in self._topics.values():
+            for subscription in subs:
+                subscription.close()
+
+    def publish(self, topic: Topic, item: Any) -> None:
+        """Delivers item to the subscribers of topic."""
+        subs = self._topics.get(topic)
+        if subs:
+            for subscription in subs:
+                subscription.push(item)
+
+    def publish_tick(self, asset: str, timestamp: float, price: float) -> None:
+        """Delivers a tick to price streams and candle aggregators."""
+        topics = self._topics
+        if not topics:
+            return
+        subs = topics.get(("prices", asset))
+        if subs:
+            tick = (timestamp, price)
+            for subscription in subs:
+                subscription.push(tick)
+        periods = self._candles.get(asset)
+        if not periods:
+            return
+        for period, aggregator in periods.items():
+            closed = aggregator.update(timestamp, price)
+            for subscription in topics.get(("candles", asset, period), ()):
+                if closed is not None:
+                    subscription.push(closed)
+                if subscription.partial:
+                    subscription.push(dict(aggregator.candle))
@@ -0,0 +1,174 @@
+"""Adaptive concurrency and rate limit for request/response traffic.
+
+:class:`AdaptiveThrottle` bounds the requests in flight with an AIMD
+limit: every healthy response (answered within the latency target while
+the recent failure rate is low) raises the limit by ``increase / limit``,
+about ``increase`` per round of responses, and a timeout or error frame
+cuts it by ``decrease``. Failures of requests sent before the last cut
+belong to the same congestion episode and do not cut again. On top of
+that, a token bucket caps the requests per second of all callers sharing
+the throttle.
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable
+
+from pyquotex.utils.latency import LatencyHistogram
+
+DEFAULT_INITIAL_LIMIT = 2
+DEFAULT_MAX_LIMIT = 16
+# Requests per second of all callers together.
+DEFAULT_RATE = 10.0
+# Responses slower than this (seconds) do not raise the limit.
+DEFAULT_LATENCY_TARGET = 2.0
+# Smoothing of the failure rate and the failure rate above which the
+# limit stops growing.
+FAILURE_ALPHA = 0.1
+MAX_FAILURE_RATE = 0.05
+
+
+class AdaptiveThrottle:
+    """AIMD limit on requests in flight plus a requests-per-second cap."""
+
+    def __init__(
+            self,
+            initial: float = DEFAULT_INITIAL_LIMIT,
+            minimum: float = 1,
+            maximum: float = DEFAULT_MAX_LIMIT,
+            rate: float = DEFAULT_RATE,
+            latency_target: float = DEFAULT_LATENCY_TARGET,
+            increase: float = 1.0,
+            decrease: float = 0.5,
+            clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        :param initial: Initial limit of requests in flight.
+        :param minimum: Lowest limit after cuts.
+        :param maximum: Highest limit after increases.
+        :param rate: Requests per second (burst of one second, at least
+            one request); 0 or None disables the cap.
+        :param latency_target: Seconds a response may take and still
+            count as healthy.
+        :param increase: Additive increase per round of responses.
+        :param decrease: Multiplicative factor applied on a failure.
+        :param clock: Monotonic clock.
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.rate = rate
+        self.latency_target = latency_target
+        self.increase = increase
+        self.decrease = decrease
+        self._clock = clock
+        self.active = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._tokens = float(max(rate or 0, 1))
+        self._refilled = clock()
+        self._last_cut = float("-inf")
+        self.failure_rate = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.cuts = 0
+        self.latency = LatencyHistogram()
+
+    @property
+    def waiting(self) -> int:
+        """Callers waiting for a slot."""
+        return len(self._waiters)
+
+    async def acquire(self) -> float:
+        """
+        Waits for a slot under the limit and for the rate budget.
+
+        :returns: The send time, to pass back to :meth:`release`.
+        """
+        if self.active >= int(self.limit) or self._waiters:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Granted just before the cancellation
+                    self.active -= 1
+                    self._wake()
+                else:
+                    self._waiters.remove(waiter)
+                raise
+        else:
+            self.active += 1
+        try:
+            await self._take_token()
+        except asyncio.CancelledError:
+            self.active -= 1
+            self._wake()
+            raise
+        self.requests += 1
+        return self._clock()
+
+    def release(self, started: float, ok: bool | None = True) -> None:
+        """
+        Frees a slot and adapts the limit to the outcome.
+
+        :param started: Send time returned by :meth:`acquire`.
+        :param ok: False for a timeout or an error frame; None frees the
+            slot without feedback (request cancelled or not answered for
+            reasons unrelated to load, such as a dropped connection).
+        """
+        self.active -= 1
+        now = self._clock()
+        if ok:
+            elapsed = now - started
+            self.latency.record(elapsed)
+            self.failure_rate *= 1 - FAILURE_ALPHA
+            if (elapsed <= self.latency_target
+                    and self.failure_rate <= MAX_FAILURE_RATE):
+                self.limit = min(
+                    self.maximum, self.limit + self.increase / self.limit
+                )
+        elif ok is not None:
+            self.failures += 1
+            self.failure_rate += (1 - self.failure_rate) * FAILURE_ALPHA
+            if started >= self._last_cut:
+                self.limit = max(self.minimum, self.limit * self.decrease)
+                self._last_cut = now
+                self.cuts += 1
+        self._wake()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Returns the current limit, counters and latency summary."""
+        return {
+            "limit": round(self.limit, 2),
+            "active": self.active,
+            "waiting": self.waiting,
+            "rate": self.rate,
+            "requests": self.requests,
+            "failures": self.failures,
+            "cuts": self.cuts,
+            "failure_rate": round(self.failure_rate, 4),
+            "latency": self.latency.as_dict(),
+        }
+
+    def _wake(self) -> None:
+        while self._waiters and self.active < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.active += 1
+                waiter.set_result(None)
+
+    async def _take_token(self) -> None:
+        if not self.rate:
+            return
+        while True:
+            now = self._clock()
+            self._tokens = min(
+                max(self.rate, 1),
+                self._tokens + (now - self._refilled) * self.rate
+            )
+            self._refilled = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
@@ -0,0 +1,67 @@
+import json
+import time
+from types import SimpleNamespace
+from typing import Any, Callable
+
+import pytest
+
+from pyquotex.api import QuotexAPI
+from pyquotex.stable_api import Quotex
+
+
+class FakeServer:
+    """Records the frames sent by the client and answers none of them."""
+
+    def __init__(self, api: QuotexAPI):
+        self.api = api
+        self.frames: list[str] = []
+
+    async def send(self, frame: str) -> None:
+        self.frames.append(frame)
+
+    def events(self) -> list[str]:
+        return [json.loads(frame[2:])[0] for frame in self.frames]
+
+
+def new_api() -> QuotexAPI:
+    return QuotexAPI("qxbroker.com", "test@test.com", "password", "en")
+
+
+@pytest.fixture
+def api() -> QuotexAPI:
+    """A QuotexAPI that is not connected to anything."""
+    return new_api()
+
+
+@pytest.fixture
+def make_client() -> Callable[..., tuple[Quotex, Any]]:
+    """
+    Returns a factory of clients whose socket is an in-process server.
+
+    ``make_client(server)`` builds the client and its API, uses
+    ``server(api)`` as the socket (any object with ``async send(frame)``
+    that answers through the API handlers, by default a silent
+    FakeServer) and returns ``(client, socket)``. The session is
+    authorized unless ``authorize=False``; ``server_offset`` syncs the
+    server clock that many seconds ahead of the local one. Other keyword
+    arguments go to Quotex.
+    """
+
+    def make(
+            server: Callable[[QuotexAPI], Any] = FakeServer,
+            authorize: bool = True,
+            server_offset: float | None = None,
+            **kwargs: Any
+    ) -> tuple[Quotex, Any]:
+        client = Quotex(email="test@test.com", password="password", **kwargs)
+        client.api = new_api()
+        client.api.streams = client.streams
+        socket = server(client.api)
+        client.api.websocket_client = SimpleNamespace(wss=socket)
+        if authorize:
+            client.api._handle_authorization("s_authorization", None)
+        if server_offset is not None:
+            client.api.timesync.sync(time.time() + server_offset)
+        return client, socket
+
+    return make
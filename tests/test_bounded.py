@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from pyquotex.api import QuotexAPI
+from pyquotex.utils import bounded
+from pyquotex.utils.async_utils import EventRegistry
+from pyquotex.utils.bounded import (
+    DEFAULT_STATE_LIMITS,
+    BoundedDict,
+    estimate_size,
+)
+from pyquotex.ws.objects.listinfodata import ListInfoData
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(bounded.time, "monotonic", fake.monotonic)
+    return fake
+
+
+def test_lru_capacity_evicts_least_recently_used():
+    data = BoundedDict(capacity=2)
+    data["a"] = 1
+    data["b"] = 2
+    assert data["a"] == 1  # "b" is now the least recently used
+    data["c"] = 3
+    assert set(data) == {"a", "c"}
+    assert data.evicted == 1
+
+
+def test_ttl_expires_from_last_write(clock):
+    data = BoundedDict(ttl=10)
+    data["a"] = 1
+    clock.now += 5
+    data["b"] = 2
+    clock.now += 6
+    assert "a" not in data
+    assert data.get("b") == 2
+    clock.now += 10
+    assert data.sweep() == 1
+    assert len(data) == 0
+    assert data.expired == 2
+
+
+def test_default_factory_and_get_do_not_conflict():
+    data = BoundedDict(capacity=4, default_factory=dict)
+    assert data.get("x") is None
+    assert "x" not in data
+    data["x"][60] = {"open": 1}
+    assert data["x"] == {60: {"open": 1}}
+
+
+def test_pinned_values_survive_eviction():
+    data = BoundedDict(capacity=1, pinned=lambda value: value == "keep")
+    data["a"] = "keep"
+    data["b"] = "drop"
+    data["c"] = "new"
+    assert set(data) == {"a", "c"}
+
+
+async def test_event_registry_keeps_keys_with_waiters():
+    registry = EventRegistry(capacity=2)
+    waiter = asyncio.create_task(registry.wait("pending", timeout=1))
+    await asyncio.sleep(0)
+    for index in range(10):
+        registry.set(f"order_closed_{index}", index)
+    assert len(registry) == 2
+    registry.set("pending", "done")
+    assert await waiter == "done"
+
+
+def test_listinfodata_stores_one_entry_per_order():
+    info = ListInfoData()
+    info.set("win", 1, 12345, 1.5)
+    assert info.get("12345") == info.get(12345)
+    assert len(info.listinfodata_dict) == 1
+    info.delete(12345)
+    assert info.get("12345") is None
+
+
+def test_bounded_api_state_and_memory_report():
+    api = QuotexAPI(
+        "qxbroker.com", "test@test.com", "password", "en",
+        state_limits={**DEFAULT_STATE_LIMITS, "realtime_sentiment": (3, None)}
+    )
+    for index in range(10):
+        api._handle_sentiment("sentiment", {"asset": f"A{index}", "call": 50})
+        api._handle_candle_generated(
+            "candle-generated", {"asset": f"A{index}", "period": 60}
+        )
+    assert len(api.realtime_sentiment) == 3
+    assert len(api.candle_generated_check) == 10
+    assert api.candle_generated_check["A9"][60]["period"] == 60
+
+    report = api.memory_report()
+    assert report["realtime_sentiment"]["entries"] == 3
+    assert report["realtime_sentiment"]["capacity"] == 3
+    assert report["realtime_sentiment"]["evicted"] == 7
+    assert report["candle_generated_check"]["bytes"] > 0
+    assert "capacity" not in report["realtime_price"]
+
+
+def test_estimate_size_counts_shared_objects_once():
+    shared = list(range(100))
+    single = estimate_size({"a": shared})
+    double = estimate_size({"a": shared, "b": shared})
+    assert double - single < estimate_size(shared)
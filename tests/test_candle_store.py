@@ -0,0 +1,232 @@
+import asyncio
+import json
+import sqlite3
+import time
+
+import pytest
+
+from pyquotex.api import QuotexAPI
+from pyquotex.utils.candle_store import CandleStore
+from pyquotex.utils.intervals import IntervalSet
+from pyquotex.ws.history_jobs import DONE
+
+
+def test_interval_set_merges_and_finds_gaps():
+    intervals = IntervalSet([(10, 20), (30, 40)])
+    intervals.add(20, 25)
+    intervals.add(38, 50)
+    assert list(intervals) == [(10, 25), (30, 50)]
+    assert intervals.missing(0, 60) == [(0, 10), (25, 30), (50, 60)]
+    assert intervals.missing(12, 24) == []
+    assert intervals.covered(0, 60) == 35
+    assert intervals.contains(30, 50) and not intervals.contains(20, 31)
+    intervals.remove(15, 35)
+    assert list(intervals) == [(10, 15), (35, 50)]
+    intervals.add(0, 100)
+    assert list(intervals) == [(0, 100)]
+
+
+def test_store_persists_candles_and_coverage(tmp_path):
+    path = tmp_path / "candles.sqlite"
+    store = CandleStore(path)
+    candles = [
+        {"time": t, "open": 1.0, "close": 1.1, "high": 1.2, "low": 0.9}
+        for t in range(0, 600, 60)
+    ]
+    assert store.add("EURUSD", 60, candles, [(0, 600)]) == 10
+    store.add("EURUSD", 60, [], [(900, 1200)])
+    store.close()
+
+    store = CandleStore(path)
+    assert store.missing("EURUSD", 60, 0, 1200) == [(600, 900)]
+    assert store.missing("EURUSD", 5, 0, 100) == [(0, 100)]
+    assert [c["time"] for c in store.load("EURUSD", 60, 120, 300)] == [
+        120, 180, 240
+    ]
+    assert store.count("EURUSD", 60) == 10
+
+    # A failed write leaves neither candles nor coverage behind
+    store._db.execute(
+        "CREATE TEMP TRIGGER fail BEFORE INSERT ON coverage "
+        "BEGIN SELECT RAISE(ABORT, 'disk full'); END"
+    )
+    late = dict(candles[0], time=600)
+    with pytest.raises(sqlite3.IntegrityError):
+        store.add("EURUSD", 60, [late], [(600, 900)])
+    assert store.missing("EURUSD", 60, 0, 1200) == [(600, 900)]
+    assert store.count("EURUSD", 60) == 10
+    store.close()
+    store = CandleStore(path)
+    assert store.missing("EURUSD", 60, 0, 1200) == [(600, 900)]
+
+
+class HistoryServer:
+    """Serves up to 199 one-minute candles before the requested time."""
+
+    def __init__(self, api: QuotexAPI, start: int):
+        self.api = api
+        # A two-hour "weekend" without candles.
+        self.times = [
+            t for t in range(start - start % 60, int(time.time()) + 1, 60)
+            if not start + 7200 <= t < start + 14400
+        ]
+        self.requests: list[int] = []
+
+    async def send(self, frame: str) -> None:
+        event, payload = json.loads(frame[2:])
+        if event != "history/load":
+            return
+        end, offset = payload["time"], payload["offset"]
+        self.requests.append(end)
+        data = [
+            [t, 1.0, 1.1, 1.2, 0.9]
+            for t in self.times
+            if end - offset < t <= end and t % payload["period"] == 0
+        ][-199:]
+        asyncio.get_running_loop().call_soon(
+            self.api._handle_history, "history/load", {
+                "asset": payload["asset"], "index": payload["index"],
+                "data": data,
+            }
+        )
+
+
+async def test_second_run_only_fetches_new_data(monkeypatch, make_client):
+    sleep = asyncio.sleep
+    monkeypatch.setattr(
+        asyncio, "sleep", lambda delay, *args: sleep(0, *args)
+    )
+    seconds = 12 * 3600
+    client, server = make_client(
+        lambda api: HistoryServer(api, int(time.time()) - seconds),
+        candle_store=CandleStore()
+    )
+
+    first = await client.get_historical_candles("EURUSD", seconds, 60)
+    first_requests = len(server.requests)
+    times = [c["time"] for c in first]
+    assert times == [t for t in server.times if t >= times[0]]
+    assert times[0] < time.time() - seconds + 60
+    server.requests.clear()
+
+    second = await client.get_historical_candles("EURUSD", seconds, 60)
+    assert [c["time"] for c in second][:-2] == [
+        c["time"] for c in first
+    ][:-2]
+    # Only the newest (still forming) candle range is downloaded again.
+    assert 0 < len(server.requests) <= 2 < first_requests
+
+
+async def test_iter_streams_ordered_batches_into_the_store(
+        monkeypatch, make_client
+):
+    sleep = asyncio.sleep
+    monkeypatch.setattr(
+        asyncio, "sleep", lambda delay, *args: sleep(0, *args)
+    )
+    store = CandleStore()
+    start = int(time.time()) - 6 * 3600
+    client, server = make_client(lambda api: HistoryServer(api, start))
+
+    times = []
+    async for batch in client.iter_historical_candles(
+            "EURUSD", start, None, 60, prefetch=2, store=store
+    ):
+        assert 0 < len(batch) <= 200
+        times.extend(c["time"] for c in batch)
+    assert times == [t for t in server.times if t >= start]
+    assert store.count("EURUSD", 60) == len(times)
+    # Only get_historical_candles() reports its plan
+    assert client.history_plan is None
+
+    # Stopping early leaves no request behind
+    batches = client.iter_historical_candles(
+        "EURUSD", start, None, 60, prefetch=3, store=CandleStore()
+    )
+    first = await anext(batches)
+    await batches.aclose()
+    assert first[0]["time"] >= start
+    assert len(client.api.inflight) == 0
+    # The cancelled prefetched windows gave their throttle slots back
+    throttle = client.api.history_throttle
+    assert throttle.active == 0 and throttle.waiting == 0
+    assert throttle.failures == 0
+
+    # Windows the store covers are not downloaded again
+    server.requests.clear()
+    again = [
+        c["time"]
+        async for batch in client.iter_historical_candles(
+            "EURUSD", start, None, 60, store=store
+        )
+        for c in batch
+    ]
+    assert again[:-2] == times[:-2]
+    assert len(server.requests) <= 2
+
+
+async def test_bulk_download_resumes_from_the_store(
+        monkeypatch, tmp_path, make_client
+):
+    sleep = asyncio.sleep
+    monkeypatch.setattr(
+        asyncio, "sleep", lambda delay, *args: sleep(0, *args)
+    )
+    store = CandleStore()
+    start = int(time.time()) - 8 * 3600
+    client, server = make_client(lambda api: HistoryServer(api, start))
+    universe = [
+        (asset, period, start, start + 6 * 3600)
+        for asset in ("EURUSD", "GBPUSD") for period in (60, 120)
+    ]
+
+    # Crash after a few windows
+    seen = []
+
+    def crash(job) -> None:
+        seen.append(job.asset)
+        if len(seen) == 3:
+            raise LookupError
+
+    with pytest.raises(LookupError):
+        await client.download_history(
+            universe, store=store, max_jobs=2, progress_callback=crash
+        )
+    assert store.count("EURUSD", 60) > 0
+    server.requests.clear()
+
+    jobs = await client.download_history(universe, store=store, max_jobs=2)
+    assert [job.status for job in jobs] == [DONE] * 4
+    assert all(job.completeness == 100 for job in jobs)
+    assert all(job.progress == 100 and job.throughput > 0 for job in jobs)
+    for asset, period, _, end in universe:
+        expected = [
+            t for t in server.times
+            if start <= t < end and t % period == 0
+        ]
+        assert [c["time"] for c in store.load(asset, period, 0, end)] == (
+            expected
+        )
+    # Windows written before the crash were not downloaded again
+    resumed = len(server.requests)
+    server.requests.clear()
+    await client.download_history(universe, store=CandleStore())
+    assert resumed < len(server.requests)
+
+    # A finished universe costs nothing
+    server.requests.clear()
+    jobs = await client.download_history(universe, store=store)
+    assert server.requests == []
+    # Four hours of candles around the two-hour gap, read from the store
+    assert [job.candles for job in jobs] == [240, 120, 240, 120]
+
+    # A store opened from a path is closed again
+    closed = []
+    close = CandleStore.close
+    monkeypatch.setattr(
+        CandleStore, "close", lambda self: closed.append(close(self))
+    )
+    path = tmp_path / "history.sqlite"
+    await client.download_history(universe[:1], store=path)
+    assert len(closed) == 1
+    assert CandleStore(path).count("EURUSD", 60) == 240
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import time
+
+from pyquotex.api import QuotexAPI
+from pyquotex.global_value import AuthStatus, WebsocketStatus
+from pyquotex.stable_api import Quotex
+
+
+async def test_check_connect_does_not_sleep(make_client):
+    client, _ = make_client()
+    start = time.perf_counter()
+    assert await client.check_connect()
+    assert time.perf_counter() - start < 0.1
+    assert client.is_connected
+
+    client.api._on_close(1006, "gone")
+    assert not client.is_connected
+    assert not await client.check_connect()
+
+
+async def test_wait_connected_wakes_on_authorization(make_client):
+    client, _ = make_client(authorize=False)
+    waiter = asyncio.create_task(client.wait_connected(timeout=1))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    client.api._handle_authorization("s_authorization", None)
+    assert await waiter
+    assert len(client.api.state._listeners) == 1  # waiter listener removed
+
+
+async def test_wait_connected_returns_early_on_reject_and_timeout(make_client):
+    client, _ = make_client(authorize=False)
+    waiter = asyncio.create_task(client.wait_connected(timeout=5))
+    await asyncio.sleep(0)
+    client.api._handle_authorization_reject("authorization/reject", None)
+    assert await asyncio.wait_for(waiter, 0.5) is False
+
+    fresh, _ = make_client(authorize=False)
+    assert await fresh.wait_connected(timeout=0.01) is False
+    assert await Quotex(email="x@x.com", password="x").wait_connected() is False
+
+
+async def test_stream_connection_state_yields_transitions(make_client):
+    client, _ = make_client(authorize=False)
+    stream = client.stream_connection_state()
+    first = asyncio.create_task(anext(stream))
+    await asyncio.sleep(0)
+
+    client.api._handle_authorization("s_authorization", None)
+    client.api._on_close(1000, "bye")
+    changes = [await first, await anext(stream), await anext(stream)]
+    assert [(c.field, c.new) for c in changes] == [
+        ("auth_status", AuthStatus.AUTHENTICATED),
+        ("status", WebsocketStatus.CONNECTED),
+        ("status", WebsocketStatus.DISCONNECTED),
+    ]
+    assert [c.connected for c in changes] == [False, True, False]
+    assert client.api.event_registry.peek("status_changed") == (
+        WebsocketStatus.DISCONNECTED
+    )
+    await stream.aclose()
+
+
+class ReplyServer:
+    """Answers pending/create and history/subscribe_all on the next turn."""
+
+    def __init__(self, api: QuotexAPI):
+        self.api = api
+        self.events: list[str] = []
+
+    async def send(self, frame: str) -> None:
+        event, payload = json.loads(frame[2:])
+        self.events.append(event)
+        call_soon = asyncio.get_running_loop().call_soon
+        if event == "pending/create":
+            call_soon(self.api._handle_orders, event, {
+                "id": "pending-1", "requestId": payload["requestId"],
+            })
+        elif event == "history/subscribe_all":
+            call_soon(self.api._handle_candle_generated, "candle-generated", {
+                "asset": "EURUSD", "period": 60,
+            })
+
+
+async def test_pending_and_all_size_stream_wait_on_responses(make_client):
+    client, server = make_client(ReplyServer, authorize=False)
+    client.codes_asset["EURUSD"] = "EURUSD"
+    # Subscribing waits for the connection, not a polling loop
+    stream = asyncio.create_task(
+        client.start_candles_all_size_stream("EURUSD")
+    )
+    await asyncio.sleep(0.01)
+    assert not stream.done() and server.events == []
+    client.api._handle_authorization("s_authorization", None)
+    start = time.perf_counter()
+    assert await stream
+    assert server.events == ["history/subscribe_all"]
+
+    async def no_profile():
+        return None
+
+    client.get_profile = no_profile
+    status, _ = await client.open_pending(1, "EURUSD", "call", 60)
+    assert status and client.api.pending_id == "pending-1"
+    assert server.events[1] == "pending/create"
+    assert time.perf_counter() - start < 0.1
+    assert client.api.inflight.size() == 0
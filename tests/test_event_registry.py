@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from pyquotex.utils.async_utils import EventRegistry
+
+
+async def test_set_wakes_all_waiters_and_latches():
+    registry = EventRegistry()
+    waiters = [
+        asyncio.create_task(registry.wait_event("balance_ready", timeout=1))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    assert registry.waiter_count("balance_ready") == 3
+    assert registry.set("balance_ready", {"demo": 10}) == 3
+    assert await asyncio.gather(*waiters) == [{"demo": 10}] * 3
+    # Latched: late waiters return immediately until cleared.
+    assert await registry.wait_event("balance_ready") == {"demo": 10}
+    await registry.clear_event("balance_ready")
+    assert not registry.is_set("balance_ready")
+
+
+async def test_set_before_wait_is_not_lost():
+    registry = EventRegistry()
+    await registry.set_event("buy_confirmed", {"id": "x"})
+    assert await registry.wait_event("buy_confirmed", timeout=0.1) == {
+        "id": "x"
+    }
+
+
+async def test_broadcast_does_not_latch():
+    registry = EventRegistry()
+    waiter = asyncio.create_task(registry.wait("tick", timeout=1))
+    await asyncio.sleep(0)
+    assert registry.broadcast("tick", 1) == 1
+    assert await waiter == 1
+    assert not registry.is_set("tick")
+    with pytest.raises(TimeoutError):
+        await registry.wait("tick", timeout=0.01)
+
+
+async def test_consume_is_one_shot():
+    registry = EventRegistry()
+    registry.set("order", 1)
+    assert await registry.wait("order", consume=True) == 1
+    assert not registry.is_set("order")
+
+
+async def test_fresh_wait_ignores_latched_value():
+    registry = EventRegistry()
+    registry.set("candle", 1)
+    waiter = asyncio.create_task(registry.wait("candle", fresh=True))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    registry.set("candle", 2)
+    assert await waiter == 2
+
+
+async def test_timeout_removes_waiter():
+    registry = EventRegistry()
+    with pytest.raises(TimeoutError):
+        await registry.wait_event("missing", timeout=0.01)
+    assert registry.waiter_count() == 0
+
+    task = asyncio.create_task(registry.wait_event("missing"))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert registry.waiter_count("missing") == 0
+
+
+async def test_history_ring_keeps_recent_values():
+    registry = EventRegistry(history=2)
+    for value in (1, 2, 3):
+        registry.set("quotes", value)
+    registry.broadcast("quotes", 4)
+    assert registry.recent("quotes") == [3, 4]
+    assert registry.peek("quotes") == 3
+    registry.discard("quotes")
+    assert "quotes" not in registry
@@ -0,0 +1,111 @@
+import asyncio
+import random
+
+import pytest
+
+from pyquotex.ws.inflight import InflightTable
+
+
+async def test_resolve_by_key_removes_entry():
+    table = InflightTable()
+    future = table.register("history/load", 7)
+    assert table.size("history/load") == 1
+    assert ("history/load", "7") in table
+    assert table.resolve("history/load", "7", {"index": 7})
+    assert await future == {"index": 7}
+    assert len(table) == 0
+    assert not table.resolve("history/load", 7, {})
+    assert table.stats.unmatched == 1
+
+
+async def test_duplicate_key_is_rejected():
+    table = InflightTable()
+    table.register("orders/open", 1)
+    with pytest.raises(ValueError):
+        table.register("orders/open", 1)
+
+
+async def test_timeout_and_cancel_remove_entries():
+    table = InflightTable()
+
+    async def send():
+        pass
+
+    with pytest.raises(TimeoutError):
+        await table.request("history/load", 1, send, timeout=0.01)
+    assert len(table) == 0
+
+    task = asyncio.create_task(table.request("history/load", 2, send))
+    await asyncio.sleep(0)
+    assert len(table) == 1
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert len(table) == 0
+    assert table.metrics()["timed_out"] == 1
+    assert table.metrics()["cancelled"] == 1
+
+
+async def test_failed_send_removes_entry():
+    table = InflightTable()
+
+    async def send():
+        raise OSError("socket closed")
+
+    with pytest.raises(OSError):
+        await table.request("orders/open", 1, send)
+    assert len(table) == 0
+
+
+async def test_concurrent_history_requests_do_not_cross_talk(api):
+    sent = []
+
+    async def send(index):
+        sent.append(index)
+
+    tasks = [
+        asyncio.create_task(api.inflight.request(
+            "history/load", index, lambda i=index: send(i), timeout=1
+        ))
+        for index in range(300)
+    ]
+    await asyncio.sleep(0)
+    assert api.get_inflight_stats()["in_flight"] == 300
+
+    random.shuffle(sent)
+    for index in sent:
+        api._handle_history("history/load", {
+            "asset": f"ASSET{index % 7}", "index": index, "data": [[index]]
+        })
+    results = await asyncio.gather(*tasks)
+    assert [result["index"] for result in results] == list(range(300))
+    assert len(api.inflight) == 0
+
+
+async def test_orders_open_resolves_by_request_id_then_oldest(api):
+    first = api.inflight.register("orders/open", 10)
+    second = api.inflight.register("orders/open", 11)
+    api._handle_orders("orders/open", {"id": "b", "requestId": 11})
+    assert (await second)["id"] == "b"
+    api._handle_orders("orders/open", {"id": "a"})
+    assert (await first)["id"] == "a"
+
+
+async def test_connection_close_fails_pending_requests(api):
+    future = api.inflight.register("history/load", 1)
+    api._on_close(1006, "gone")
+    with pytest.raises(ConnectionError):
+        await future
+    assert len(api.inflight) == 0
+
+
+async def test_resolve_oldest_is_fifo_per_tag():
+    table = InflightTable()
+    eur_1 = table.register("orders/open", 1, tag="EURUSD")
+    gbp = table.register("orders/open", 2, tag="GBPUSD")
+    eur_2 = table.register("orders/open", 3, tag="EURUSD")
+    assert table.resolve_oldest("orders/open", "g", tag="GBPUSD")
+    assert table.resolve_oldest("orders/open", "e1", tag="EURUSD")
+    assert not table.resolve_oldest("orders/open", "x", tag="USDJPY")
+    assert table.resolve_oldest("orders/open", "e2", tag="EURUSD")
+    assert [await eur_1, await gbp, await eur_2] == ["e1", "g", "e2"]
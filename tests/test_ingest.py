@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+from pyquotex.ws.ingest import CONFLATE, DROP_OLDEST, IngestQueue
+
+
+def make_queue(capacity=4, policy=DROP_OLDEST):
+    seen = []
+
+    async def dispatch(event, data, fallback):
+        seen.append((event, data))
+
+    return IngestQueue(dispatch, capacity, policy), seen
+
+
+def quote(asset, price):
+    return [[asset, 1700000000.0, price, 1]]
+
+
+async def test_priority_lane_drains_first():
+    queue, seen = make_queue()
+    await queue.put("quotes/stream", quote("EURUSD", 1.0))
+    await queue.put("history/load", {"asset": "EURUSD"})
+    await queue.put("orders/close", [{"id": "a"}])
+    await queue.put("s_authorization", None)
+    await queue.run(drain=True)
+    assert [event for event, _ in seen] == [
+        "orders/close", "s_authorization", "quotes/stream", "history/load"
+    ]
+    assert queue.stats.processed == 4
+
+
+async def test_drop_oldest_sheds_stream_updates_only():
+    queue, seen = make_queue(capacity=3)
+    await queue.put("history/load", {"asset": "A"})
+    for price in (1.0, 2.0, 3.0, 4.0):
+        await queue.put("quotes/stream", quote("EURUSD", price))
+    assert queue.depth()["market"] == 3
+    assert queue.stats.dropped == 2
+    await queue.run(drain=True)
+    assert seen[0][0] == "history/load"
+    assert [data[0][2] for _, data in seen[1:]] == [3.0, 4.0]
+
+
+async def test_conflate_keeps_newest_update_per_asset():
+    queue, seen = make_queue(policy=CONFLATE)
+    await queue.put("quotes/stream", quote("EURUSD", 1.0))
+    await queue.put("quotes/stream", quote("GBPUSD", 5.0))
+    await queue.put("quotes/stream", quote("EURUSD", 2.0))
+    assert len(queue) == 2
+    assert queue.stats.conflated == 1
+    await queue.run(drain=True)
+    assert [(data[0][0], data[0][2]) for _, data in seen] == [
+        ("EURUSD", 2.0), ("GBPUSD", 5.0)
+    ]
+
+
+async def test_responses_wait_for_room_instead_of_dropping():
+    queue, seen = make_queue(capacity=1)
+    await queue.put("history/load", {"asset": "A"})
+    blocked = asyncio.create_task(queue.put("history/load", {"asset": "B"}))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+    queue.start()
+    await asyncio.wait_for(blocked, 1)
+    await queue.stop()
+    assert [data["asset"] for _, data in seen] == ["A", "B"]
+    assert queue.stats.dropped == 0
+
+
+async def test_slow_handler_does_not_block_enqueue():
+    release = asyncio.Event()
+
+    async def dispatch(event, data, fallback):
+        await release.wait()
+
+    queue = IngestQueue(dispatch, capacity=8)
+    queue.start()
+    for price in range(20):
+        await asyncio.wait_for(
+            queue.put("quotes/stream", quote("EURUSD", price)), 0.1
+        )
+    metrics = queue.metrics()
+    assert metrics["market"] == 8
+    assert metrics["dropped"] == 11
+    release.set()
+    await queue.stop()
+    assert queue.stats.max_lag > 0
+    assert len(queue) == 0
+
+
+async def test_stop_propagates_its_own_cancellation():
+    async def dispatch(event, data, fallback):
+        await asyncio.Event().wait()
+
+    queue = IngestQueue(dispatch, capacity=8)
+    queue.start()
+    await queue.put("history/load", {"asset": "A"})
+    await asyncio.sleep(0)
+    dispatcher = queue._task
+    stopping = asyncio.create_task(queue.stop(timeout=5))
+    await asyncio.sleep(0)
+    stopping.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await stopping
+    await asyncio.sleep(0)
+    assert dispatcher.cancelled()
+
+    # A flush that times out cancels the dispatcher and returns
+    queue.start()
+    await queue.put("history/load", {"asset": "B"})
+    await queue.stop(timeout=0.01)
+    assert not queue.running
+
+
+def test_rejects_unknown_policy():
+    with pytest.raises(ValueError):
+        IngestQueue(lambda *args: None, market_policy="fifo")
+
+
+async def test_api_enqueue_defers_attachment_decode(api):
+    await api._enqueue_message(
+        '451-["history/load/line",{"_placeholder":true,"num":0}]'
+    )
+    await api._enqueue_message(
+        b'\x04{"asset":"EURUSD","index":3,"data":[[1,1.1]]}'
+    )
+    # Only the header has been parsed; the attachment waits in the queue.
+    assert api.frame_stats.frames == 1
+    await api._enqueue_message(b'\x04[["EURUSD",1700000000.5,1.25,1]]')
+    assert api.get_ingest_stats()["market"] == 2
+    await api.ingest.run(drain=True)
+    assert api.frame_stats.frames == 3
+    assert api.candle_v2_data["EURUSD"]["index"] == 3
+    assert api.realtime_price["EURUSD"].last() == (1700000000.5, 1.25)
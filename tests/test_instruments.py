@@ -0,0 +1,80 @@
+import asyncio
+
+from pyquotex.ws.objects.instruments import InstrumentCatalog
+
+
+def row(
+        instrument_id: int, symbol: str, is_open: bool = True,
+        payment: int = 80, profit_1m: int = 85
+) -> list:
+    cells: list = [None] * 30
+    cells[0], cells[1], cells[2], cells[3] = (
+        instrument_id, symbol, f"{symbol}\n", "currency"
+    )
+    cells[5], cells[14], cells[18] = payment, is_open, payment + 5
+    cells[-10], cells[-9], cells[-8] = 70, profit_1m, 88
+    return cells
+
+
+def test_catalog_indexes_and_partition():
+    catalog = InstrumentCatalog()
+    changes = catalog.update([
+        row(1, "EURUSD"), row(2, "EURUSD_otc"), row(3, "GBPUSD", False),
+    ])
+    assert [change.field for change in changes] == ["added"] * 3
+    assert catalog.get("EURUSD_otc").id == 2
+    assert catalog.by_id(3).symbol == "GBPUSD"
+    assert catalog.get("GBPUSD").name == "GBPUSD"
+    assert catalog.symbols(is_open=True) == {"EURUSD", "EURUSD_otc"}
+    assert catalog.symbols(is_open=True, otc=False) == {"EURUSD"}
+    assert catalog.symbols(is_open=False) == {"GBPUSD"}
+
+
+def test_catalog_updates_incrementally_with_diffs():
+    catalog = InstrumentCatalog()
+    catalog.update([row(1, "EURUSD"), row(2, "GBPUSD"), row(3, "AUDCAD")])
+    payments = catalog.payments()
+    assert catalog.payments() is payments
+    assert catalog.update([
+        row(1, "EURUSD"), row(2, "GBPUSD"), row(3, "AUDCAD")
+    ]) == []
+    assert catalog.decoded == 3
+    assert catalog.payments() is payments
+
+    changes = catalog.update([
+        row(1, "EURUSD", is_open=False), row(2, "GBPUSD", profit_1m=90),
+    ])
+    assert changes[:2] == [
+        ("EURUSD", "open", True, False),
+        ("GBPUSD", "profit_1m", 85, 90),
+    ]
+    assert (changes[2].symbol, changes[2].field) == ("AUDCAD", "removed")
+    assert catalog.decoded == 5
+    assert catalog.symbols(is_open=False) == {"EURUSD"}
+    assert "AUDCAD" not in catalog and catalog.by_id(3) is None
+    assert catalog.payments()["GBPUSD"]["profit"]["1M"] == 90
+
+
+async def test_client_lookups_and_change_stream(make_client):
+    client, _ = make_client()
+    client.api._handle_instruments("instruments/list", [
+        row(1, "EURUSD"), row(2, "EURUSD_otc"),
+    ])
+
+    assert client.get_payout_by_asset("EURUSD") == 85
+    assert client.get_payout_by_asset("EURUSD", "all")["5M"] == 88
+    assert client.get_payment()["EURUSD_otc"]["turbo_payment"] == 85
+    raw, info = await client.check_asset_open("EURUSD_otc")
+    assert info == (2, "EURUSD_otc", True)
+    assert await client.get_available_asset("EURUSD") == (
+        "EURUSD", (1, "EURUSD", True)
+    )
+
+    changes = client.stream_instrument_changes()
+    first = asyncio.create_task(anext(changes))
+    await asyncio.sleep(0)
+    client.api._handle_instruments("instruments/list", [
+        row(1, "EURUSD", payment=75), row(2, "EURUSD_otc"),
+    ])
+    assert await first == ("EURUSD", "payment", 80, 75)
+    await changes.aclose()
@@ -0,0 +1,128 @@
+import asyncio
+import json
+import random
+import time
+
+from pyquotex.api import QuotexAPI
+
+
+class FakeServer:
+    """Records sent frames and acknowledges orders/open on the next turn."""
+
+    def __init__(self, api: QuotexAPI):
+        self.api = api
+        self.frames: list[str] = []
+
+    async def send(self, frame: str) -> None:
+        self.frames.append(frame)
+        event, payload = json.loads(frame[2:])
+        if event == "orders/open":
+            asyncio.get_running_loop().call_soon(
+                self.api._handle_orders, "orders/open", {
+                    "id": f"order-{payload['requestId']}",
+                    "requestId": payload["requestId"],
+                    "closeTimestamp": payload["time"],
+                }
+            )
+
+    def events(self) -> list[str]:
+        return [json.loads(frame[2:])[0] for frame in self.frames]
+
+
+# A tick has already synced the server clock, an hour ahead of the local one.
+SERVER_OFFSET = 3600
+
+
+async def test_prepared_buy_sends_only_orders_open(make_client):
+    client, server = make_client(FakeServer, server_offset=SERVER_OFFSET)
+    await client.prepare_order("EURUSD_otc", 60)
+    assert "orders/open" not in server.events()
+    server.frames.clear()
+
+    status, data = await client.buy(1, "EURUSD_otc", "call", 60)
+    assert status
+    assert server.events() == ["orders/open"]
+    assert data["id"].startswith("order-")
+
+    stats = client.get_order_ack_stats()
+    assert stats["ack_latency"]["count"] == 1
+    assert stats["prepared"] == [("EURUSD_otc", 60, True)]
+
+
+async def test_first_buy_prepares_once_per_asset(make_client):
+    client, server = make_client(FakeServer, server_offset=SERVER_OFFSET)
+    for _ in range(3):
+        assert (await client.buy(1, "EURUSD", "put", 60))[0]
+    events = server.events()
+    assert events.count("instruments/update") == 1
+    assert events.count("settings/apply") == 1
+    assert events.count("orders/open") == 3
+    assert "tick" not in events
+
+
+async def test_expiration_uses_server_clock_offset(make_client):
+    client, server = make_client(FakeServer, server_offset=SERVER_OFFSET)
+    await client.buy(1, "EURUSD", "call", 60)
+    payload = json.loads(server.frames[-1][2:])[1]
+    assert payload["time"] > time.time() + SERVER_OFFSET
+
+
+class StandInServer(FakeServer):
+    """Acks in random order; "_legacy" assets omit the requestId."""
+
+    def __init__(self, api: QuotexAPI):
+        super().__init__(api)
+        self.acked_by_asset: dict[str, list[int]] = {}
+
+    async def send(self, frame: str) -> None:
+        self.frames.append(frame)
+        event, payload = json.loads(frame[2:])
+        if event != "orders/open":
+            return
+        asset, request_id = payload["asset"], payload["requestId"]
+        if payload["amount"] <= 0:
+            response = {"requestId": request_id, "error": "Invalid amount"}
+        else:
+            response = {
+                "id": f"order-{request_id}", "asset": asset,
+                "amount": payload["amount"], "requestId": request_id,
+            }
+        loop = asyncio.get_running_loop()
+        if asset.endswith("_legacy"):
+            # No requestId, but acks of one asset keep their order.
+            del response["requestId"]
+            queue = self.acked_by_asset.setdefault(asset, [])
+            queue.append(request_id)
+            delay = 0.001 * len(queue) + random.uniform(0, 0.0005)
+        else:
+            delay = random.uniform(0, 0.02)
+        loop.call_later(
+            delay, self.api._handle_orders, "orders/open", response
+        )
+
+
+async def test_hundreds_of_concurrent_orders_get_their_own_ack(make_client):
+    client, server = make_client(
+        StandInServer, server_offset=SERVER_OFFSET
+    )
+    assets = ["EURUSD_otc", "GBPUSD_otc", "AUDCAD_legacy", "USDJPY_legacy"]
+    orders = [
+        # Rejected orders (amount 0) all go to GBPUSD_otc.
+        (index, assets[index % len(assets)], 0 if index % 40 == 5 else index)
+        for index in range(400)
+    ]
+    results = await asyncio.gather(*(
+        client.buy(amount, asset, "call", 60) for _, asset, amount in orders
+    ))
+
+    for (index, asset, amount), (status, data) in zip(orders, results):
+        if amount == 0:
+            assert (status, data) == (False, "Invalid amount")
+        else:
+            assert status, data
+            assert (data["asset"], data["amount"]) == (asset, amount)
+    events = server.events()
+    assert events.count("orders/open") == 400
+    # One preparation per asset despite 100 concurrent first orders each.
+    assert events.count("settings/apply") == len(assets)
+    assert len(client.api.inflight) == 0
@@ -0,0 +1,128 @@
+import asyncio
+import random
+import time
+
+import pytest
+
+from pyquotex.utils.latency import LatencyHistogram
+from pyquotex.utils.timer_wheel import TimerWheel
+
+
+async def test_timer_wheel_fires_every_timer_never_early():
+    # 4 slots x 2 levels cover 0.16 s; longer delays are re-cascaded.
+    wheel = TimerWheel(resolution=0.01, slots=4, levels=2)
+    start = time.monotonic()
+    fired = []
+    delays = [random.uniform(0, 0.4) for _ in range(200)]
+    for delay in delays:
+        wheel.call_later(
+            delay, lambda d=delay: fired.append((d, time.monotonic() - start))
+        )
+    cancelled = wheel.call_later(0.05, fired.append, "cancelled")
+    assert wheel.cancel(cancelled)
+    assert not wheel.cancel(cancelled)
+
+    await asyncio.sleep(0.5)
+    assert len(fired) == 200
+    assert all(elapsed >= delay for delay, elapsed in fired)
+    assert len(wheel) == 0
+    assert wheel._handle is None  # idle wheel schedules nothing
+
+
+async def test_timer_wheel_is_not_early_partway_through_a_tick():
+    wheel = TimerWheel(resolution=0.1)
+    # The wheel's origin is now almost two ticks old
+    await asyncio.sleep(0.19)
+    start = time.monotonic()
+    fired = asyncio.get_running_loop().create_future()
+    wheel.call_later(0.1, lambda: fired.set_result(time.monotonic() - start))
+    assert await asyncio.wait_for(fired, 1) >= 0.1
+
+
+async def test_check_win_resolves_on_close_event(make_client):
+    client, _ = make_client()
+    tasks = [
+        asyncio.create_task(client.check_win(order_id, timeout=5))
+        for order_id in range(1, 201)
+    ]
+    await asyncio.sleep(0)
+    assert client.get_order_result_stats()["waiting"] == 200
+    assert len(client.api.timers) == 200
+
+    closed_at = time.time()
+    for order_id in range(1, 201):
+        client.api._handle_orders("orders/close", [{
+            "id": order_id, "profit": order_id % 2,
+            "closeTimestamp": closed_at,
+        }])
+    results = await asyncio.gather(*tasks)
+    assert results[:2] == [("win", 1.0), ("loss", 0.0)]
+
+    stats = client.get_order_result_stats()
+    assert stats["waiting"] == 0
+    assert stats["timers"] == 0
+    assert stats["latency"]["count"] == 200
+    assert client.api.listinfodata.get(1) is None
+
+
+async def test_check_win_returns_stored_result_and_times_out(make_client):
+    client, _ = make_client()
+    client.api._handle_deals("deals", {"deals": [{"id": "a", "profit": 2}]})
+    assert await client.check_win("a") == ("win", 2.0)
+    assert await client.check_win("b", timeout=0.05) == ("loss", 0.0)
+    assert client.get_order_result_stats()["timed_out"] == 1
+
+
+async def test_disconnect_fails_result_waiters(make_client):
+    client, _ = make_client()
+    task = asyncio.create_task(client.api.order_results.wait("a"))
+    await asyncio.sleep(0)
+    client.api._on_close(1006, "gone")
+    with pytest.raises(ConnectionError):
+        await task
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.record(ms / 1000)
+    summary = histogram.as_dict()
+    assert summary["count"] == 100
+    assert summary["p50_ms"] == 50
+    assert summary["p99_ms"] == 100
+    assert summary["max_ms"] == 100
+    assert sum(summary["buckets"].values()) == 100
+
+
+async def test_watch_results_yields_in_completion_order(make_client):
+    client, _ = make_client()
+    client.api._handle_deals("deals", {"deals": [{"id": "c", "profit": 3}]})
+    results = []
+
+    async def consume():
+        async for item in client.watch_results(["a", "b", "c", "a"]):
+            results.append(item)
+
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+    assert results == [("c", "win", 3.0)]
+    assert len(client.api.order_results) == 2
+    client.api._handle_orders("orders/close", [{"id": "b", "profit": 0}])
+    client.api._handle_orders("orders/close", [{"id": "a", "profit": 1}])
+    await task
+    assert results[1:] == [("b", "loss", 0.0), ("a", "win", 1.0)]
+    assert len(client.api.timers) == 0
+
+
+async def test_watch_results_timeout_cancels_remaining(make_client):
+    client, _ = make_client()
+    watch = client.watch_results([1, 2, 3], timeout=0.1)
+    first = asyncio.create_task(anext(watch))
+    await asyncio.sleep(0)
+    client.api._handle_deals("deals", {"deals": [{"id": 2, "profit": 1}]})
+    assert await first == (2, "win", 1.0)
+    with pytest.raises(TimeoutError):
+        await anext(watch)
+    assert len(client.api.order_results) == 0
+    assert len(client.api.timers) == 0
+    assert client.get_order_result_stats()["timed_out"] == 2
@@ -0,0 +1,117 @@
+import asyncio
+import json
+import time
+
+from pyquotex.api import QuotexAPI
+from pyquotex.utils.range_planner import RangePlanner
+
+
+def answer(planner, task, times, limit=None):
+    """Answers ``task`` like the server: the newest candles in its window."""
+    found = [t for t in times if task.start <= t < task.end]
+    planner.complete(task, found[-limit:] if limit else found)
+
+
+def test_planner_learns_the_response_limit():
+    times = list(range(0, 60 * 1000, 60))
+    planner = RangePlanner(0, 60 * 1000, 60, chunk_candles=100)
+    while (task := planner.next_task()) is not None:
+        answer(planner, task, times, limit=150)
+    assert planner.completeness() == 100
+    assert planner.capacity == 150
+    # Doubled from 100 while responses were complete, then cut to 150
+    assert planner.requests < 10
+    assert planner.next_task() is None and planner.finished
+
+
+def test_planner_covers_empty_ranges_and_hands_out_the_rest():
+    # No candles between 6000 and 9000 (a weekend)
+    times = [t for t in range(0, 12000, 60) if not 6000 <= t < 9000]
+    planner = RangePlanner(0, 12000, 60, chunk_candles=40, capacity=40)
+    first, second = planner.next_task(), planner.next_task()
+    assert (first.start, first.end) == (9600, 12000)
+    assert (second.start, second.end) == (7200, 9600)
+    # Short of its start: the rest goes back to the pool
+    answer(planner, second, times)
+    assert list(planner.covered) == [(9000, 9600)]
+    third = planner.next_task()
+    assert (third.start, third.end) == (6600, 9000)
+    # Empty, so the whole window is known to hold no candles
+    answer(planner, third, times)
+    assert planner.covered.contains(6600, 9600)
+    while (task := planner.next_task()) is not None:
+        answer(planner, task, times)
+    assert not planner.finished
+    answer(planner, first, times)
+    assert planner.finished and planner.completeness() == 100
+
+
+def test_planner_retries_with_backoff_then_gives_up():
+    now = [0.0]
+    planner = RangePlanner(
+        0, 600, 60, max_attempts=3, backoff=1.0, clock=lambda: now[0]
+    )
+    task = planner.next_task()
+    planner.fail(task)
+    assert planner.next_task() is None and not planner.finished
+    assert planner.retry_delay() == 1.0
+    now[0] = 1.0
+    retry = planner.next_task()
+    assert retry == (0, 600, 1)
+    planner.fail(retry)
+    assert planner.retry_delay() == 2.0
+    now[0] = 3.0
+    planner.fail(planner.next_task())
+    assert planner.finished and planner.completeness() == 0
+    assert planner.as_dict()["failed"] == [(0, 600)]
+    assert planner.as_dict()["retries"] == 2
+
+
+class FlakyHistoryServer:
+    """Serves up to 199 candles and drops every third request."""
+
+    def __init__(self, api: QuotexAPI, start: int):
+        self.api = api
+        self.times = list(range(start - start % 60, int(time.time()) + 1, 60))
+        self.requests = 0
+
+    async def send(self, frame: str) -> None:
+        event, payload = json.loads(frame[2:])
+        if event != "history/load":
+            return
+        self.requests += 1
+        if self.requests % 3 == 0:
+            return
+        end, offset = payload["time"], payload["offset"]
+        data = [
+            [t, 1.0, 1.1, 1.2, 0.9]
+            for t in self.times if end - offset < t <= end
+        ][-199:]
+        asyncio.get_running_loop().call_soon(
+            self.api._handle_history, "history/load", {
+                "asset": payload["asset"], "index": payload["index"],
+                "data": data,
+            }
+        )
+
+
+async def test_history_is_complete_despite_dropped_requests(
+        monkeypatch, make_client
+):
+    sleep = asyncio.sleep
+    monkeypatch.setattr(
+        asyncio, "sleep", lambda delay, *args: sleep(0, *args)
+    )
+    seconds = 4 * 3600
+    client, server = make_client(
+        lambda api: FlakyHistoryServer(api, int(time.time()) - seconds)
+    )
+
+    candles = await client.get_historical_candles(
+        "EURUSD", seconds, 60, timeout=0.05, max_workers=3
+    )
+    times = [c["time"] for c in candles]
+    assert times == [t for t in server.times if t >= times[0]]
+    stats = client.get_history_stats()
+    assert stats["completeness"] == 100 and stats["failed"] == []
+    assert stats["retries"] > 0 and stats["capacity"] == 199
@@ -0,0 +1,65 @@
+import asyncio
+import json
+import time
+
+from pyquotex.api import QuotexAPI
+
+
+class FakeServer:
+    """Answers settings/apply, demo/refill and history/load once."""
+
+    def __init__(self, api: QuotexAPI):
+        self.api = api
+        self.payloads: dict[str, list] = {}
+
+    async def send(self, frame: str) -> None:
+        event, payload = json.loads(frame[2:])
+        self.payloads.setdefault(event, []).append(payload)
+        api = self.api
+        if event == "settings/apply":
+            reply = api._handle_settings, "settings/list", {
+                "dealValue": payload.get("dealValue"),
+            }
+        elif event == "demo/refill":
+            reply = api._handle_demo_refill, "demo/refill", {
+                "balance": 10000 + payload,
+            }
+        elif event == "history/load":
+            reply = api._handle_history, "history/load", {
+                "asset": payload["asset"], "index": payload["index"],
+                "history": [[1, 1.1], [2, 1.2]],
+            }
+        else:
+            return
+        asyncio.get_running_loop().call_soon(*reply)
+
+
+async def test_calls_finish_in_one_round_trip(make_client):
+    client, server = make_client(FakeServer)
+    client.codes_asset["EURUSD"] = 1
+    start = time.perf_counter()
+
+    settings = await client.store_settings_apply("EURUSD", 60, deal=7)
+    balance = await client.edit_practice_balance(500)
+    history = await client.get_history_line("EURUSD", time.time(), 3600)
+
+    assert time.perf_counter() - start < 0.5
+    assert settings == {"dealValue": 7}
+    assert server.payloads["settings/apply"][-1] == {
+        "asset": "EURUSD", "time": 60, "isFastOption": False,
+        "dealValue": 7, "isFastAmountOption": False, "dealPercentValue": 1,
+    }
+    assert balance == {"balance": 10500}
+    assert history["history"] == [[1, 1.1], [2, 1.2]]
+    assert client.api.historical_candles is history
+    assert len(client.api.inflight) == 0
+
+
+async def test_concurrent_history_lines_do_not_collide(make_client):
+    client, _ = make_client(FakeServer)
+    client.codes_asset.update({"EURUSD": 1, "GBPUSD": 2})
+    first, second = await asyncio.gather(
+        client.get_history_line("EURUSD", time.time(), 3600),
+        client.get_history_line("GBPUSD", time.time(), 3600),
+    )
+    assert (first["asset"], second["asset"]) == (1, 2)
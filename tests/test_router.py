@@ -0,0 +1,168 @@
+import json as std_json
+
+import pytest
+
+from pyquotex.global_value import AuthStatus
+from pyquotex.utils import json_utils
+from pyquotex.ws.router import (
+    ENGINE_PONG,
+    SOCKET_BINARY_EVENT,
+    AttachmentAssembler,
+    FrameStats,
+    MessageRouter,
+    classify_payload,
+    parse_frame,
+)
+
+
+def test_parse_event_frame():
+    frame = parse_frame('42["balance",{"demoBalance":100}]')
+    assert frame.event == "balance"
+    assert frame.data == {"demoBalance": 100}
+    assert not frame.is_placeholder
+
+
+def test_parse_binary_header():
+    frame = parse_frame(
+        '451-["orders/close",{"_placeholder":true,"num":0}]'
+    )
+    assert frame.packet_type == SOCKET_BINARY_EVENT
+    assert frame.attachments == 1
+    assert frame.event == "orders/close"
+    assert frame.is_placeholder
+
+
+def test_parse_control_and_binary_frames():
+    assert parse_frame("3").engine_type == ENGINE_PONG
+    frame = parse_frame(b'\x04[["EURUSD",1700000000.5,1.1,0]]')
+    assert frame.binary
+    assert frame.data == [["EURUSD", 1700000000.5, 1.1, 0]]
+
+
+def test_parse_bytes_text_frame_with_namespace_and_ack():
+    stats = FrameStats()
+    frame = parse_frame(b'42/ws,17["balance",{"liveBalance":5}]', stats)
+    assert frame.event == "balance"
+    assert frame.data == {"liveBalance": 5}
+    assert stats.frames == 1
+
+
+def test_parse_bytes_copies_only_without_orjson(monkeypatch):
+    raw = b'42["balance",{"demoBalance":1}]'
+    if json_utils.HAS_ORJSON:
+        stats = FrameStats()
+        assert parse_frame(raw, stats).data == {"demoBalance": 1}
+        assert stats.bytes_copied == 0
+
+    monkeypatch.setattr(json_utils, "HAS_ORJSON", False)
+    monkeypatch.setattr(json_utils, "json", std_json, raising=False)
+    stats = FrameStats()
+    assert parse_frame(raw, stats).data == {"demoBalance": 1}
+    assert parse_frame(b"\x04[1]", stats).data == [1]
+    assert stats.bytes_copied == len(raw) - 2 + 3
+
+
+def test_classify_payload():
+    assert classify_payload([["EURUSD", 1, 1.1, 0]]) == "quotes/stream"
+    assert classify_payload({"liveBalance": 10}) == "balance"
+    assert classify_payload({"deals": [{"id": 1}]}) == "deals"
+    assert classify_payload({"asset": "EURUSD", "data": [1]}) == (
+        "history/load"
+    )
+    assert classify_payload({"foo": 1}) is None
+
+
+async def test_router_dispatch_sync_and_async():
+    router = MessageRouter()
+    seen = []
+
+    def on_sync(event, data):
+        seen.append(("sync", event, data))
+
+    async def on_async(event, data):
+        seen.append(("async", event, data))
+
+    router.register("x", on_sync)
+    router.register("x", on_async)
+    assert await router.dispatch("x", 1)
+    assert seen == [("sync", "x", 1), ("async", "x", 1)]
+
+    router.unregister("x", on_sync)
+    assert not await router.dispatch("unknown", {"foo": 1})
+    assert await router.dispatch("x", 2)
+    assert seen[-1] == ("async", "x", 2)
+
+
+async def test_on_message_routes_placeholder_attachment(api):
+    await api._on_message(
+        '451-["orders/close",{"_placeholder":true,"num":0}]'
+    )
+    await api._on_message(b'\x04[{"id":"abc","profit":1.5}]')
+    assert api.listinfodata.get("abc") == {
+        "win": "win", "game_state": 1, "profit": 1.5
+    }
+
+
+def test_assembler_fills_placeholders_in_header_order():
+    assembler = AttachmentAssembler()
+    header = [{"_placeholder": True, "num": 1}, {"_placeholder": True, "num": 0}]
+    assert assembler.add_header("pair", header, 2) is None
+    assert assembler.add_header("single", {"_placeholder": True}, 1) is None
+    assert assembler.add_attachment("a") is None
+    first = assembler.add_attachment("b")
+    assert first.event == "pair"
+    assert first.payload() == ["b", "a"]
+    assert header[0] == {"_placeholder": True, "num": 1}
+    second = assembler.add_attachment({"x": 1})
+    assert second.event == "single"
+    assert second.payload() == {"x": 1}
+    assert len(assembler) == 0
+
+
+async def test_on_message_interleaved_binary_headers(api):
+    await api._on_message(
+        '451-["history/load/line",{"_placeholder":true,"num":0}]'
+    )
+    await api._on_message(
+        '451-["orders/close",{"_placeholder":true,"num":0}]'
+    )
+    await api._on_message(
+        b'\x04{"asset":"EURUSD","index":7,"data":[[1,1.1]]}'
+    )
+    await api._on_message(b'\x04[{"id":"abc","profit":-1}]')
+    assert api.candle_v2_data["EURUSD"]["index"] == 7
+    assert api.listinfodata.get("abc")["win"] == "loss"
+    assert len(api.assembler) == 0
+
+
+async def test_on_message_authorization_and_user_handler(api):
+    received = []
+    api.router.register(
+        "s_authorization", lambda event, data: received.append(event)
+    )
+    await api._on_message('42["s_authorization"]')
+    assert api.state.auth_status == AuthStatus.AUTHENTICATED
+    assert received == ["s_authorization"]
+
+
+async def test_on_message_bare_quotes_by_shape(api):
+    await api._on_message(b'\x04[["EURUSD_otc",1700000000.25,1.5,1]]')
+    assert api.realtime_price["EURUSD_otc"][-1]["price"] == 1.5
+    assert api.timesync.server_timestamp == pytest.approx(1700000000.25)
+
+
+async def test_on_message_ingests_every_quote_in_frame(api):
+    await api._on_message(
+        b'\x04[["EURUSD_otc",1700000000.25,1.5,1],'
+        b'["GBPUSD_otc",1700000000.5,1.25,0],'
+        b'["EURUSD_otc",1700000000.75,1.6,1],'
+        b'["BROKEN_otc",1700000000.8]]'
+    )
+    assert [t["price"] for t in api.realtime_price["EURUSD_otc"]] == [
+        1.5, 1.6
+    ]
+    assert api.realtime_candles["GBPUSD_otc"][2] == 1.25
+    assert api.timesync.server_timestamp == pytest.approx(1700000000.75)
+    stats = api.get_tick_stats()
+    assert stats["EURUSD_otc"] == {"ingested": 2, "dropped": 0}
+    assert stats["BROKEN_otc"] == {"ingested": 0, "dropped": 1}
@@ -0,0 +1,84 @@
+import asyncio
+import json
+
+import pytest
+
+from pyquotex.api import QuotexAPI
+from pyquotex.expiration import get_expiration_time_quotex
+
+
+class FakeServer:
+    """Stamps each orders/open with the server clock and acks it."""
+
+    def __init__(self, api: QuotexAPI):
+        self.api = api
+        self.received: dict[int, tuple[float, dict]] = {}
+
+    async def send(self, frame: str) -> None:
+        event, payload = json.loads(frame[2:])
+        if event != "orders/open":
+            return
+        self.received[payload["requestId"]] = (
+            self.api.timesync.server_now(), payload
+        )
+        asyncio.get_running_loop().call_soon(
+            self.api._handle_orders, "orders/open", {
+                "id": f"order-{payload['requestId']}",
+                "requestId": payload["requestId"],
+            }
+        )
+
+
+async def test_scheduled_orders_fire_on_time_with_aligned_expiration(
+        make_client
+):
+    client, server = make_client(FakeServer, server_offset=3600)
+    client.scheduler.lead = 0.05
+    await client.prepare_order("EURUSD", 60)
+    now = client.api.timesync.server_now()
+    orders = [
+        await client.schedule_order(
+            now + 0.3 + (index % 50) * 0.004, 1, "EURUSD", "call", 60
+        )
+        for index in range(1000)
+    ]
+    assert len(client.scheduler) == 1000
+    assert not server.received
+
+    results = await asyncio.gather(*orders)
+    assert all(status for status, _ in results)
+    for order in orders:
+        sent_at, payload = server.received[order.request_id]
+        assert sent_at >= order.at - 0.001
+        assert payload["time"] == get_expiration_time_quotex(
+            int(order.at), 60
+        )
+        assert order.jitter is not None and order.jitter >= 0
+
+    stats = client.get_scheduler_stats()
+    assert stats["fired"] == stats["jitter"]["count"] == 1000
+    assert stats["pending"] == 0
+    assert stats["jitter"]["p50_ms"] < 100
+
+
+async def test_cancel_and_past_times(make_client):
+    client, server = make_client(FakeServer, server_offset=3600)
+    now = client.api.timesync.server_now()
+    order = await client.schedule_order(now + 0.05, 1, "EURUSD", "put", 60)
+    assert client.cancel_scheduled_order(order)
+    assert not client.cancel_scheduled_order(order)
+    await asyncio.sleep(0.1)
+    assert order.result.cancelled()
+    assert not server.received
+
+    with pytest.raises(ValueError):
+        await client.schedule_order(now - 1, 1, "EURUSD", "put", 60)
+
+
+async def test_order_missed_while_disconnected(make_client):
+    client, server = make_client(FakeServer, server_offset=3600)
+    now = client.api.timesync.server_now()
+    order = await client.schedule_order(now + 0.02, 1, "EURUSD", "call", 60)
+    client.api._on_close(1006, "gone")
+    assert await order == (False, "Websocket not connected")
+    assert client.get_scheduler_stats()["missed"] == 1
@@ -0,0 +1,76 @@
+import asyncio
+import json
+
+from pyquotex.api import QuotexAPI
+from pyquotex.ws.router import classify_payload
+
+
+class FakeServer:
+    """Answers orders/cancel in reverse order, in three different ways."""
+
+    def __init__(self, api: QuotexAPI, silent: set[str] = frozenset()):
+        self.api = api
+        self.silent = silent
+        self.tickets: list[str] = []
+
+    async def send(self, frame: str) -> None:
+        event, payload = json.loads(frame[2:])
+        assert event == "orders/cancel"
+        ticket = payload["ticket"]
+        self.tickets.append(ticket)
+        if ticket in self.silent:
+            return
+        number = int(ticket)
+        delay = 0.001 * (100 - number)
+        if number % 10 == 3:
+            handler = self.api._handle_sell
+            response = {"ticket": ticket, "error": "Deal is closed"}
+        elif number % 2:
+            # Settled by the order's close event only.
+            handler = self.api._handle_orders
+            event, response = "orders/close", [{"id": ticket, "profit": 1}]
+        else:
+            handler = self.api._handle_sell
+            response = {"ticket": ticket, "profit": 0.5}
+        asyncio.get_running_loop().call_later(
+            delay, handler, event, response
+        )
+
+
+async def test_batch_sell_correlates_every_ticket(make_client):
+    client, server = make_client(FakeServer)
+    tickets = [str(number) for number in range(50)]
+    results = await client.sell_options(tickets, timeout=5)
+
+    assert server.tickets == tickets
+    assert results.keys() == set(tickets)
+    assert results["2"] == (True, {"ticket": "2", "profit": 0.5})
+    assert results["1"] == (True, {"id": "1", "profit": 1})
+    assert results["13"] == (False, "Deal is closed")
+    assert client.get_sell_stats()["count"] == 1
+    assert len(client.api.inflight) == 0
+
+
+async def test_stream_yields_in_completion_order_and_times_out(make_client):
+    client, _ = make_client(
+        lambda api: FakeServer(api, silent={"7"})
+    )
+    seen = [
+        ticket
+        async for ticket, _, _ in client.stream_sell_options(
+            ["4", "7", "6", "8"], timeout=0.2
+        )
+    ]
+    assert seen == ["8", "6", "4", "7"]
+    assert client.get_sell_stats()["count"] == 0
+    assert len(client.api.inflight) == 0
+
+
+async def test_single_ticket_keeps_legacy_return(make_client):
+    client, _ = make_client(FakeServer)
+    assert await client.sell_option("42") == {"ticket": "42", "profit": 0.5}
+    assert client.api.sold_options_respond == {"ticket": "42", "profit": 0.5}
+
+
+def test_bare_ticket_payload_is_routed_to_cancel():
+    assert classify_payload({"ticket": "1", "profit": 2}) == "orders/cancel"
@@ -0,0 +1,100 @@
+import random
+import time
+
+from pyquotex import expiration
+from pyquotex.utils.server_clock import ServerClock
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_clock(**kwargs) -> tuple[ServerClock, FakeClock]:
+    monotonic = FakeClock()
+    clock = ServerClock(monotonic=monotonic, wall=lambda: 1_000_000.0, **kwargs)
+    return clock, monotonic
+
+
+def test_min_filter_ignores_delayed_samples():
+    clock, monotonic = make_clock()
+    rng = random.Random(7)
+    assert not clock.synced
+    assert clock.server_now() == 1_000_000.0
+    offset = 120.0
+    for _ in range(500):
+        monotonic.now += 0.05
+        local = clock.local_now()
+        # 20 ms minimum one-way delay plus up to 300 ms of jitter.
+        delay = 0.02 + rng.uniform(0, 0.3)
+        clock.observe(local + offset - delay, received_at=local)
+    assert clock.synced
+    assert abs(clock.offset - (offset - 0.02)) < 0.005
+
+    clock.observe_rtt(0.05)
+    clock.observe_rtt(0.04)
+    assert clock.rtt == 0.04
+    assert abs(clock.offset - offset) < 0.005
+    assert abs(clock.server_now() - (clock.local_now() + offset)) < 0.005
+
+
+def test_drift_is_tracked():
+    clock, monotonic = make_clock()
+    rng = random.Random(7)
+    drift = 50e-6
+    for _ in range(3000):
+        monotonic.now += 0.1
+        local = clock.local_now()
+        server = local + 2.0 + drift * monotonic.now
+        clock.observe(server - rng.uniform(0, 0.05), received_at=local)
+    assert abs(clock.drift - drift) < 10e-6
+    monotonic.now += 10
+    expected = clock.local_now() + 2.0 + drift * monotonic.now
+    assert abs(clock.server_now() - expected) < 0.002
+
+
+def test_drift_is_refitted_only_when_a_window_closes():
+    clock, monotonic = make_clock()
+    fits = []
+    fit = clock._fit
+    clock._fit = lambda: fits.append(fit())
+    # Rising samples inside one 10 s window
+    for index in range(90):
+        monotonic.now += 0.1
+        clock.observe(clock.local_now() + 5 + index * 1e-4)
+    assert len(fits) == 1
+    assert abs(clock.offset - (5 + 89e-4)) < 1e-9
+    clock.observe_rtt(0.02)
+    assert len(fits) == 1
+    assert abs(clock.offset - (5 + 89e-4 + 0.01)) < 1e-9
+    monotonic.now += 10
+    clock.observe(clock.local_now() + 5)
+    assert len(fits) == 2
+
+
+def test_outliers_are_dropped_and_steps_reset():
+    clock, monotonic = make_clock()
+    clock.observe(1_000_010.0)
+    monotonic.now += 1
+    clock.observe(1_000_000.0 + 1 + 60)  # one bogus timestamp
+    assert abs(clock.offset - 10) < 1e-6
+    for _ in range(3):  # the server clock really stepped
+        monotonic.now += 1
+        clock.observe(clock.local_now() + 60)
+    assert abs(clock.offset - 60) < 1e-6
+    assert clock.resets == 1
+
+
+def test_expiration_helpers_take_an_explicit_clock():
+    clock = lambda: 1_700_000_000.0  # noqa: E731
+    assert expiration.get_timestamp(clock) == 1_700_000_000
+    assert expiration.get_timestamp_days_ago(1, clock) == (
+        1_700_000_000 - 86400
+    )
+    # No module state: the default stays the local clock
+    assert abs(expiration.get_timestamp() - time.time()) < 2
@@ -0,0 +1,89 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pyquotex.stable_api import Quotex
+from pyquotex.ws.streams import StreamClosed, StreamHub, Subscription
+
+
+@pytest.fixture
+def client(make_client) -> Quotex:
+    client, _ = make_client(authorize=False)
+    client.start_candles_stream = AsyncMock()
+    client.stop_candles_stream = AsyncMock()
+    return client
+
+
+def quotes(asset, *ticks):
+    return [[asset, ts, price, 0] for ts, price in ticks]
+
+
+async def test_subscription_drops_oldest_when_full():
+    subscription = Subscription(("prices", "EURUSD"), "EURUSD", maxsize=2)
+    for price in (1, 2, 3):
+        subscription.push(price)
+    assert subscription.dropped == 1
+    assert await subscription.get() == 2
+    assert await subscription.get() == 3
+    subscription.close()
+    with pytest.raises(StreamClosed):
+        await subscription.get()
+
+
+async def test_one_upstream_fans_out_to_many_subscribers(client):
+    streams = [client.stream_prices("EURUSD") for _ in range(3)]
+    tasks = [asyncio.create_task(anext(stream)) for stream in streams]
+    await asyncio.sleep(0)
+    client.api._handle_quotes("quotes/stream", quotes("EURUSD", (10, 1.5)))
+    assert await asyncio.gather(*tasks) == [(10, 1.5)] * 3
+    client.start_candles_stream.assert_awaited_once_with("EURUSD", 0)
+
+    for stream in streams[:2]:
+        await stream.aclose()
+    client.stop_candles_stream.assert_not_awaited()
+    await streams[2].aclose()
+    client.stop_candles_stream.assert_awaited_once_with("EURUSD")
+    assert len(client.streams) == 0
+
+
+async def test_candle_stream_yields_closed_candles(client):
+    stream = client.stream_candles("EURUSD", 60)
+    task = asyncio.create_task(anext(stream))
+    await asyncio.sleep(0)
+    client.api._handle_quotes("quotes/stream", quotes(
+        "EURUSD", (60, 1.0), (70, 1.3), (80, 0.9), (90, 1.1), (125, 2.0)
+    ))
+    candle = await task
+    assert candle == {
+        "time": 60, "open": 1.0, "close": 1.1, "high": 1.3, "low": 0.9,
+        "ticks": 4,
+    }
+    await stream.aclose()
+
+
+async def test_partial_candles_and_sentiment(client):
+    candles = client.stream_candles("EURUSD", 60, partial=True)
+    sentiment = client.stream_sentiment("EURUSD")
+    first = asyncio.create_task(anext(candles))
+    mood = asyncio.create_task(anext(sentiment))
+    await asyncio.sleep(0)
+    client.api._handle_quotes("quotes/stream", quotes("EURUSD", (61, 1.0)))
+    client.api._handle_sentiment("sentiment", {"asset": "EURUSD", "call": 70})
+    assert (await first)["open"] == 1.0
+    assert (await mood)["call"] == 70
+    client.start_candles_stream.assert_awaited_once()
+    await candles.aclose()
+    await sentiment.aclose()
+
+
+async def test_failed_upstream_start_leaves_no_subscriber():
+    hub = StreamHub()
+
+    async def start():
+        raise ConnectionError("not connected")
+
+    with pytest.raises(ConnectionError):
+        await hub.subscribe(("prices", "EURUSD"), "EURUSD", start=start)
+    assert len(hub) == 0
+    assert hub.groups() == {}
@@ -0,0 +1,79 @@
+import asyncio
+import time
+
+from pyquotex.ws.throttle import AdaptiveThrottle
+
+
+async def test_limit_grows_additively_and_is_cut_once_per_episode():
+    now = [0.0]
+    throttle = AdaptiveThrottle(
+        initial=2, maximum=8, rate=0, clock=lambda: now[0]
+    )
+    for _ in range(20):
+        started = await throttle.acquire()
+        now[0] += 0.1
+        throttle.release(started)
+    assert 6 < throttle.limit <= 8
+
+    limit = throttle.limit
+    sent = [await throttle.acquire() for _ in range(3)]
+    now[0] += 5
+    for started in sent:
+        throttle.release(started, ok=False)
+    # The three timeouts belong to one episode
+    assert throttle.limit == limit / 2 and throttle.cuts == 1
+    assert throttle.failures == 3
+
+    # Healthy but slow responses do not raise the limit
+    limit = throttle.limit
+    started = await throttle.acquire()
+    now[0] += 10
+    throttle.release(started)
+    assert throttle.limit == limit
+
+
+async def test_waiters_are_admitted_under_the_limit():
+    throttle = AdaptiveThrottle(initial=2, rate=0)
+    first = await throttle.acquire()
+    await throttle.acquire()
+    third = asyncio.create_task(throttle.acquire())
+    await asyncio.sleep(0)
+    assert not third.done() and throttle.waiting == 1
+    throttle.release(first)
+    await third
+    assert throttle.active == 2 and throttle.waiting == 0
+
+    blocked = asyncio.create_task(throttle.acquire())
+    await asyncio.sleep(0)
+    blocked.cancel()
+    await asyncio.gather(blocked, return_exceptions=True)
+    assert throttle.waiting == 0 and throttle.active == 2
+
+
+async def test_rate_ceiling_is_shared():
+    throttle = AdaptiveThrottle(initial=16, maximum=16, rate=50)
+
+    async def caller() -> None:
+        for _ in range(15):
+            throttle.release(await throttle.acquire())
+
+    begin = time.monotonic()
+    await asyncio.gather(*(caller() for _ in range(4)))
+    # 60 requests: a burst of 50, then 10 more at 50 per second
+    assert time.monotonic() - begin >= 0.18
+    assert throttle.requests == 60
+
+
+async def test_cancelled_history_request_frees_its_slot(make_client):
+    # The default server never answers
+    client, _ = make_client()
+    throttle = client.api.history_throttle
+    fetch = asyncio.create_task(
+        client._fetch_historical_batch("EURUSD", 1000, 600, 60, 1, 5)
+    )
+    await asyncio.sleep(0.01)
+    assert throttle.active == 1
+    fetch.cancel()
+    await asyncio.gather(fetch, return_exceptions=True)
+    assert throttle.active == 0 and throttle.failures == 0
+    assert throttle.limit == 2
@@ -0,0 +1,51 @@
+import pytest
+
+from pyquotex.utils.tick_buffer import TickBuffer, TickStore
+
+
+def test_append_and_wraparound():
+    buffer = TickBuffer(capacity=3)
+    for i in range(5):
+        buffer.append(100.0 + i, 1.0 + i)
+
+    assert len(buffer) == 3
+    assert list(buffer.times()) == [102.0, 103.0, 104.0]
+    assert list(buffer.prices()) == [3.0, 4.0, 5.0]
+    assert buffer.last() == (104.0, 5.0)
+
+
+def test_dict_compat_indexing_and_iteration():
+    buffer = TickBuffer(capacity=4)
+    for i in range(6):
+        buffer.append(float(i), float(i) * 10)
+
+    assert buffer[0] == {"time": 2.0, "price": 20.0}
+    assert buffer[-1] == {"time": 5.0, "price": 50.0}
+    assert buffer[1:3] == [
+        {"time": 3.0, "price": 30.0}, {"time": 4.0, "price": 40.0}
+    ]
+    assert [t["time"] for t in buffer] == [2.0, 3.0, 4.0, 5.0]
+    with pytest.raises(IndexError):
+        buffer[4]
+
+
+def test_segments_are_zero_copy_views():
+    buffer = TickBuffer(capacity=4)
+    for i in range(6):
+        buffer.append(float(i), float(i))
+
+    segments = buffer.segments()
+    assert len(segments) == 2
+    assert [list(t) for t, _ in segments] == [[2.0, 3.0], [4.0, 5.0]]
+    assert all(isinstance(t, memoryview) for t, _ in segments)
+
+
+def test_empty_buffer_and_store():
+    store = TickStore(capacity=2)
+    assert not store.get("EURUSD")
+    store["EURUSD"].append(1.0, 1.1)
+    assert store.get("EURUSD").last() == (1.0, 1.1)
+    assert store["EURUSD"].capacity == 2
+    assert TickBuffer(1).segments() == []
+    with pytest.raises(ValueError):
+        TickBuffer(0)